@@ -1,56 +1,180 @@
-from PyQt5.QtCore import (
-    Qt, QSize, QPoint, QPointF, QRectF, QRect,
-    QEasingCurve, QPropertyAnimation, QSequentialAnimationGroup,
+from collections import OrderedDict
+
+from qt_compat.QtCore import (
+    Qt, QSize, QPoint, QPointF, QRectF, QRect, QObject, QTimer, QEvent,
+    QEasingCurve, QPropertyAnimation,
     pyqtSlot, pyqtProperty
 )
-from PyQt5.QtWidgets import (
+from qt_compat.QtWidgets import (
     QCheckBox, QWidget, QVBoxLayout, QLabel, QPushButton, QGraphicsOpacityEffect, QApplication
 )
-from PyQt5.QtGui import QColor, QBrush, QPaintEvent, QPen, QPainter
+from qt_compat.QtGui import QPaintEvent, QPen, QPainter, QPixmap
 import sys
+import time
+
+from curves import DEFAULT_RESOLUTION, easing_table
+from theme import Themed, ToggleTheme
+
+
+class _ToggleAnimation:
+    """Animation state of one toggle; instances are recycled by ToggleAnimator."""
+
+    __slots__ = ("start", "begin", "end")
+
+
+class ToggleAnimator(QObject):
+    """Runs the handle and pulse animations of every AnimatedToggle from one timer.
+
+    Each frame advances all running toggles, writes their animated values
+    directly and then calls update() once per toggle, so Qt paints the whole
+    batch in a single pass. Finished states go back to a pool for reuse.
+    Anything with ``_handle_position``, ``_pulse_radius``, ``_pulse_active``
+    and ``update()`` can be animated, not only AnimatedToggle widgets.
+
+    The handle and pulse easing curves are lookup tables (curves.easing_table)
+    evaluated for all running toggles in one batch per frame.
+    """
+
+    HANDLE_MS = 200
+    PULSE_MS = 350
+    PULSE_START = 10
+    PULSE_END = 20
+
+    _shared = None
 
+    def __init__(self, interval_ms=16, clock=time.monotonic,
+                 handle_curve=QEasingCurve.Type.InOutCubic, pulse_curve=QEasingCurve.Type.Linear,
+                 resolution=DEFAULT_RESOLUTION, parent=None):
+        super().__init__(parent)
+        self.clock = clock
+        self._handle_curve = easing_table(handle_curve, resolution)
+        self._pulse_curve = easing_table(pulse_curve, resolution)
+        self._running = {}
+        self._pool = []
+        self.frames = 0
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.advance)
+
+    @classmethod
+    def shared(cls):
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def __len__(self):
+        return len(self._running)
+
+    def __contains__(self, toggle):
+        return toggle in self._running
+
+    def animate(self, toggle, end):
+        """(Re)start moving ``toggle``'s handle from where it is now to ``end``."""
+        state = self._running.get(toggle)
+        if state is None:
+            state = self._pool.pop() if self._pool else _ToggleAnimation()
+            self._running[toggle] = state
+        state.start = self.clock()
+        state.begin = toggle._handle_position
+        state.end = end
+        toggle._pulse_active = False
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def stop(self, toggle):
+        state = self._running.pop(toggle, None)
+        if state is not None:
+            self._pool.append(state)
+
+    def advance(self, now=None):
+        now = self.clock() if now is None else now
+        self.frames += 1
+        running = list(self._running.items())
+        elapsed = [(now - state.start) * 1000 for _, state in running]
+        handle = self._handle_curve.evaluate([e / self.HANDLE_MS for e in elapsed])
+        pulse = [(e - self.HANDLE_MS) / self.PULSE_MS for e in elapsed]
+        pulse_eased = self._pulse_curve.evaluate(pulse)
+        dirty = []
+        for k, (toggle, state) in enumerate(running):
+            if elapsed[k] < self.HANDLE_MS:
+                toggle._handle_position = state.begin + (state.end - state.begin) * float(handle[k])
+            else:
+                toggle._handle_position = state.end
+                toggle._pulse_active = pulse[k] < 1.0
+                if toggle._pulse_active:
+                    toggle._pulse_radius = (self.PULSE_START
+                                            + (self.PULSE_END - self.PULSE_START) * float(pulse_eased[k]))
+                else:
+                    self.stop(toggle)
+            dirty.append(toggle)
+
+        for toggle in dirty:
+            try:
+                toggle.update()
+            except RuntimeError:  # widget deleted while animating
+                self.stop(toggle)
+        if not self._running:
+            self._timer.stop()
+
+
+class _ToggleState:
+    """Caches of one toggle; colors and brushes are in its shared ToggleTheme."""
+
+    __slots__ = ("geometry", "layers")
+
+    def __init__(self):
+        self.geometry = None
+        self.layers = {}
 
-class AnimatedToggle(QCheckBox):
+
+class AnimatedToggle(Themed, QCheckBox):
+
+    default_theme = ToggleTheme()
 
     _transparent_pen = QPen(Qt.GlobalColor.transparent)
     _light_grey_pen = QPen(Qt.GlobalColor.lightGray)
 
+    # (size, margins, DPR, checked, theme) -> (track, handle sprite, sprite half size),
+    # shared by all toggles that look the same.
+    _layer_cache = OrderedDict()
+    _LAYER_CACHE_SIZE = 64
+
     def __init__(self,
         parent=None,
-        bar_color=Qt.GlobalColor.gray,
-        checked_color="#00B0FF",
-        handle_color=Qt.GlobalColor.white,
-        pulse_unchecked_color="#44999999",
-        pulse_checked_color="#4400B0EE"
+        bar_color=None,
+        checked_color=None,
+        handle_color=None,
+        pulse_unchecked_color=None,
+        pulse_checked_color=None,
+        animator=None,
+        theme=None
         ):
         super().__init__(parent)
 
-        self._bar_brush = QBrush(bar_color)
-        self._bar_checked_brush = QBrush(QColor(checked_color).lighter())
-
-        self._handle_brush = QBrush(handle_color)
-        self._handle_checked_brush = QBrush(QColor(checked_color))
-
-        self._pulse_unchecked_animation = QBrush(QColor(pulse_unchecked_color))
-        self._pulse_checked_animation = QBrush(QColor(pulse_checked_color))
+        # Colors given here override the theme (the class default if none);
+        # equal themes are one shared object, see theme.ToggleTheme.
+        colors = {
+            "bar_color": bar_color,
+            "checked_color": checked_color,
+            "handle_color": handle_color,
+            "pulse_unchecked_color": pulse_unchecked_color,
+            "pulse_checked_color": pulse_checked_color,
+        }
+        colors = {name: color for name, color in colors.items() if color is not None}
+        theme = theme or self.default_theme
+        self._theme = theme.replace(**colors) if colors else theme
+        self._state = _ToggleState()
 
         self.setContentsMargins(8, 0, 8, 0)
         self._handle_position = 0
 
         self._pulse_radius = 0
+        self._pulse_active = False
 
-        self.animation = QPropertyAnimation(self, b"handle_position", self)
-        self.animation.setEasingCurve(QEasingCurve.Type.InOutCubic)
-        self.animation.setDuration(200)  # time in ms
-
-        self.pulse_anim = QPropertyAnimation(self, b"pulse_radius", self)
-        self.pulse_anim.setDuration(350)  # time in ms
-        self.pulse_anim.setStartValue(10)
-        self.pulse_anim.setEndValue(20)
-
-        self.animations_group = QSequentialAnimationGroup()
-        self.animations_group.addAnimation(self.animation)
-        self.animations_group.addAnimation(self.pulse_anim)
+        # Handle and pulse animations are driven by a shared ToggleAnimator.
+        self._animator = animator if animator is not None else ToggleAnimator.shared()
 
         self.stateChanged.connect(self.setup_animation)
 
@@ -62,56 +186,120 @@ class AnimatedToggle(QCheckBox):
 
     @pyqtSlot(int)
     def setup_animation(self, value):
-        self.animations_group.stop()
-        if value:
-            self.animation.setEndValue(1)
-        else:
-            self.animation.setEndValue(0)
-        self.animations_group.start()
+        self._animator.animate(self, 1 if value else 0)
 
-    def paintEvent(self, e: QPaintEvent):
+    def resizeEvent(self, e):
+        self._invalidate_layers()
+        super().resizeEvent(e)
 
-        contRect = self.contentsRect()
-        handleRadius = round(0.24 * contRect.height())
+    def changeEvent(self, e):
+        if e.type() in (QEvent.Type.PaletteChange, QEvent.Type.StyleChange):
+            self._invalidate_layers()
+        super().changeEvent(e)
 
-        p = QPainter(self)
-        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+    def _invalidate_layers(self):
+        self._state.geometry = None
+        self._state.layers = {}
 
-        p.setPen(self._transparent_pen)
-        barRect = QRectF(
-            0, 0,
-            contRect.width() - handleRadius, 0.40 * contRect.height()
-        )
-        barRect.moveCenter(QPointF(contRect.center()))
-        rounding = barRect.height() / 2
+    def _theme_changed(self):
+        self._state.layers = {}
+        self.update()
 
-        trailLength = contRect.width() - 2 * handleRadius
+    def _toggle_geometry(self, width, height, dpr):
+        """Handle radius, bar rect, rounding and trail length for a widget of this size."""
+        state = self._state
+        key = (width, height, dpr)
+        if state.geometry is None or state.geometry[0] != key:
+            if state.geometry is not None:
+                state.layers = {}  # DPR changed, e.g. moved to another screen
+            contRect = QRect(0, 0, width, height).marginsRemoved(self.contentsMargins())
+            handleRadius = round(0.24 * contRect.height())
+
+            barRect = QRectF(
+                0, 0,
+                contRect.width() - handleRadius, 0.40 * contRect.height()
+            )
+            barRect.moveCenter(QPointF(contRect.center()))
+            rounding = barRect.height() / 2
+
+            trailLength = contRect.width() - 2 * handleRadius
+            state.geometry = (key, contRect, handleRadius, barRect, rounding, trailLength)
+        return state.geometry
+
+    def _static_layers(self, width, height, dpr, checked):
+        """Pre-rendered (track, handle sprite) for the current size, state and colors."""
+        layers = self._state.layers.get(checked)
+        if layers is not None:
+            return layers
+        _, contRect, handleRadius, barRect, rounding, _ = self._toggle_geometry(width, height, dpr)
+        key = (width, height, contRect.getRect(), dpr, checked, self._theme)
+        layers = AnimatedToggle._layer_cache.get(key)
+        if layers is None:
+            layers = AnimatedToggle._layer_cache[key] = self._render_layers(
+                width, height, dpr, checked, handleRadius, barRect, rounding)
+            if len(AnimatedToggle._layer_cache) > AnimatedToggle._LAYER_CACHE_SIZE:
+                AnimatedToggle._layer_cache.popitem(last=False)
+        else:
+            AnimatedToggle._layer_cache.move_to_end(key)
+        self._state.layers[checked] = layers
+        return layers
+
+    def _render_layers(self, width, height, dpr, checked, handleRadius, barRect, rounding):
+        def pixmap(w, h):
+            pm = QPixmap(max(1, round(w * dpr)), max(1, round(h * dpr)))
+            pm.setDevicePixelRatio(dpr)
+            pm.fill(Qt.GlobalColor.transparent)
+            return pm
+
+        track = pixmap(width, height)
+        p = QPainter(track)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        p.setPen(self._transparent_pen)
+        theme = self._theme
+        p.setBrush(theme.bar_checked_brush if checked else theme.bar_brush)
+        p.drawRoundedRect(barRect, rounding, rounding)
+        p.end()
 
-        xPos = contRect.x() + handleRadius + trailLength * self._handle_position
+        # One pixel of room for the unchecked handle's outline.
+        half = handleRadius + 1
+        handle = pixmap(2 * half, 2 * half)
+        p = QPainter(handle)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if checked:
+            p.setPen(self._transparent_pen)
+            p.setBrush(theme.handle_checked_brush)
+        else:
+            p.setPen(self._light_grey_pen)
+            p.setBrush(theme.handle_brush)
+        p.drawEllipse(QPointF(half, half), handleRadius, handleRadius)
+        p.end()
+        return track, handle, half
 
-        if self.pulse_anim.state() == QPropertyAnimation.State.Running:
-            p.setBrush(
-                self._pulse_checked_animation if
-                self.isChecked() else self._pulse_unchecked_animation)
-            p.drawEllipse(QPointF(xPos, barRect.center().y()),
-                          self._pulse_radius, self._pulse_radius)
+    def paintEvent(self, e: QPaintEvent):
+        p = QPainter(self)
+        self._draw(p, self.width(), self.height(), self.isChecked(),
+                   self._handle_position, self._pulse_radius if self._pulse_active else 0)
+        p.end()
 
-        if self.isChecked():
-            p.setBrush(self._bar_checked_brush)
-            p.drawRoundedRect(barRect, rounding, rounding)
-            p.setBrush(self._handle_checked_brush)
+    def _draw(self, p, width, height, checked, handle_position, pulse_radius):
+        """Paint the toggle at the painter's origin: pulse, cached track, cached handle."""
+        dpr = p.device().devicePixelRatioF()
+        _, contRect, handleRadius, barRect, _, trailLength = self._toggle_geometry(width, height, dpr)
+        track, handle, half = self._static_layers(width, height, dpr, checked)
 
-        else:
-            p.setBrush(self._bar_brush)
-            p.drawRoundedRect(barRect, rounding, rounding)
-            p.setPen(self._light_grey_pen)
-            p.setBrush(self._handle_brush)
+        xPos = contRect.x() + handleRadius + trailLength * handle_position
+        yPos = barRect.center().y()
 
-        p.drawEllipse(
-            QPointF(xPos, barRect.center().y()),
-            handleRadius, handleRadius)
+        if pulse_radius:
+            p.setRenderHint(QPainter.RenderHint.Antialiasing)
+            p.setPen(self._transparent_pen)
+            p.setBrush(
+                self._theme.pulse_checked_brush if
+                checked else self._theme.pulse_unchecked_brush)
+            p.drawEllipse(QPointF(xPos, yPos), pulse_radius, pulse_radius)
 
-        p.end()
+        p.drawPixmap(0, 0, track)
+        p.drawPixmap(QPointF(xPos - half, yPos - half), handle)
 
     @pyqtProperty(float)
     def handle_position(self):
@@ -144,7 +332,7 @@ class AnimatedDemo(QWidget):
         self.setWindowTitle("Animated Demo")
 
         layout = QVBoxLayout(self)
-        layout.setAlignment(Qt.AlignCenter)
+        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         self.mainToggle = AnimatedToggle()
         self.secondaryToggle = AnimatedToggle(
@@ -192,4 +380,4 @@ if __name__ == "__main__":
     app = QApplication(sys.argv)
     w = AnimatedDemo()
     w.show()
-    sys.exit(app.exec_())
+    sys.exit(app.exec())
@@ -0,0 +1,272 @@
+"""Headless batch renderer: scripted widget animations to PNG or raw RGBA frames.
+
+    python batch_render.py timer --duration 12 --out frames/
+    python batch_render.py powerbar --fps 60 --format rgba --out bar.rgba --jobs 4
+    python batch_render.py toggle --script toggle.json --out toggle/
+
+A scene builds one widget and moves it to any point of its timeline with
+``seek(t)``. Time comes from a ``countdown.ManualClock`` instead of QTimer, and
+every frame is a pure function of the script and ``t``, so frames can be
+rendered in any number of processes and the output is byte-identical between
+runs. ``manifest.json`` (or ``<out>.json`` for raw output) lists the SHA-256
+of each frame's pixels for golden-image tests.
+
+Raw output is one file of ``width * height * 4`` byte RGBA frames, e.g.
+
+    ffmpeg -f rawvideo -pix_fmt rgba -s 320x120 -r 30 -i bar.rgba bar.mp4
+"""
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+
+from countdown import Countdown, ManualClock
+
+FORMATS = ("png", "rgba")
+
+
+class Scene:
+    """A widget and a script; ``seek`` must be called with non-decreasing ``t``."""
+
+    size = (320, 120)
+
+    def __init__(self, **params):
+        self.params = params
+
+    def build(self):
+        raise NotImplementedError
+
+    def seek(self, t):
+        raise NotImplementedError
+
+
+class TimerScene(Scene):
+    """cw3 TimerDisplay counting down ``seconds`` with its pulse, red for the last 10 s."""
+
+    size = (320, 120)
+
+    def build(self):
+        from cw3 import TimerDisplay
+        self.clock = ManualClock()
+        self.countdown = Countdown(self.params.get("seconds", 15), clock=self.clock)
+        self.countdown.start()
+        self.widget = TimerDisplay(single_widget=self.params.get("single_widget", False))
+        return self.widget
+
+    def seek(self, t):
+        from cw3 import pulse_intensity
+        from qt_compat.QtGui import QColor
+        self.clock.now = t
+        remaining = self.countdown.remaining_seconds()
+        self.widget.set_remaining(remaining)
+        self.widget.set_base_color(QColor(255, 0, 0) if remaining <= 10 else QColor(0, 255, 0))
+        if self.countdown.finished():
+            self.widget.apply_intensity(1.0)
+        else:
+            self.widget.apply_intensity(
+                pulse_intensity(self.countdown.progress(), self.countdown.elapsed()))
+
+
+class PowerBarScene(Scene):
+    """PowerBar whose value follows linear ``keyframes`` of ``(t, value)``."""
+
+    size = (200, 260)
+
+    def build(self):
+        from power_bar import PowerBar
+        self.keyframes = [tuple(k) for k in self.params.get(
+            "keyframes", [(0, 0), (1.5, 99), (2.0, 99), (3.5, 20), (4.0, 0)])]
+        self.widget = PowerBar(self.params.get("steps", 10))
+        if "gradient" in self.params:
+            self.widget.setGradient(self.params["gradient"], self.params.get("mode", "rgb"))
+        return self.widget
+
+    def value_at(self, t):
+        frames = self.keyframes
+        if t <= frames[0][0]:
+            return frames[0][1]
+        for (t0, v0), (t1, v1) in zip(frames, frames[1:]):
+            if t <= t1:
+                return v0 + (v1 - v0) * (t - t0) / (t1 - t0) if t1 > t0 else v1
+        return frames[-1][1]
+
+    def seek(self, t):
+        self.widget.setValue(round(self.value_at(t)))
+
+
+class ToggleScene(Scene):
+    """AnimatedToggle switched at the ``events`` ``(t, checked)``, animated on virtual time."""
+
+    size = (116, 90)
+
+    def build(self):
+        from animated_toggle import AnimatedToggle, ToggleAnimator
+        self.events = [tuple(e) for e in self.params.get(
+            "events", [(0.25, True), (1.0, False), (1.1, True), (2.0, False)])]
+        self._next_event = 0
+        self.clock = ManualClock()
+        self.animator = ToggleAnimator(clock=self.clock)
+        self.widget = AnimatedToggle(animator=self.animator, **self.params.get("colors", {}))
+        return self.widget
+
+    def seek(self, t):
+        # Each switch starts exactly at its scripted time, wherever the frames fall.
+        while self._next_event < len(self.events) and self.events[self._next_event][0] <= t:
+            at, checked = self.events[self._next_event]
+            self._next_event += 1
+            self.clock.now = at
+            self.animator.advance(at)
+            self.widget.setChecked(checked)
+        self.clock.now = t
+        self.animator.advance(t)
+
+
+SCENES = {
+    "timer": TimerScene,
+    "powerbar": PowerBarScene,
+    "toggle": ToggleScene,
+}
+
+
+def frame_times(duration, fps):
+    """Virtual time of every frame; computed from the index so chunks agree exactly."""
+    return [i / fps for i in range(int(round(duration * fps)) + 1)]
+
+
+_app = None
+
+
+def _ensure_app():
+    global _app
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from qt_compat.QtWidgets import QApplication
+    _app = QApplication.instance() or QApplication([])
+    return _app
+
+
+def _render(widget, width, height):
+    from qt_compat.QtGui import QImage
+    from qt_compat.QtCore import Qt
+    image = QImage(width, height, QImage.Format.Format_RGBA8888)
+    image.setDevicePixelRatio(1.0)
+    image.fill(Qt.GlobalColor.transparent)
+    widget.render(image)
+    return image
+
+
+def _pixels(image):
+    data = image.constBits()
+    data.setsize(image.sizeInBytes())
+    return bytes(data)
+
+
+def _open_scene(spec):
+    _ensure_app()
+    from qt_compat.QtCore import Qt
+    scene = SCENES[spec["scene"]](**spec.get("params", {}))
+    widget = scene.build()
+    width, height = spec["size"]
+    widget.setAttribute(Qt.WidgetAttribute.WA_DontShowOnScreen)
+    widget.resize(width, height)
+    widget.show()  # activates layouts; nothing reaches the screen
+    return scene, widget
+
+
+def render_chunk(spec, start, stop):
+    """Render frames ``start..stop-1`` of ``spec``; returns their pixel digests."""
+    scene, widget = _open_scene(spec)
+    width, height = spec["size"]
+    times = frame_times(spec["duration"], spec["fps"])
+    digests = []
+    raw = None
+    if spec["format"] == "rgba":
+        raw = open(spec["out"], "r+b")
+    try:
+        for index in range(start, stop):
+            scene.seek(times[index])
+            image = _render(widget, width, height)
+            pixels = _pixels(image)
+            digests.append(hashlib.sha256(pixels).hexdigest())
+            if raw is not None:
+                raw.seek(index * len(pixels))
+                raw.write(pixels)
+            else:
+                path = os.path.join(spec["out"], f"frame_{index:05d}.png")
+                if not image.save(path, "PNG"):
+                    raise OSError(f"could not write {path}")
+    finally:
+        if raw is not None:
+            raw.close()
+        widget.close()
+        widget.deleteLater()
+    return digests
+
+
+def render(spec, jobs=1):
+    """Render a whole spec, in ``jobs`` processes, and write the manifest."""
+    n_frames = len(frame_times(spec["duration"], spec["fps"]))
+    width, height = spec["size"]
+    if spec["format"] == "rgba":
+        with open(spec["out"], "wb") as fh:
+            fh.truncate(n_frames * width * height * 4)
+        manifest_path = spec["out"] + ".json"
+    else:
+        os.makedirs(spec["out"], exist_ok=True)
+        manifest_path = os.path.join(spec["out"], "manifest.json")
+
+    jobs = max(1, min(jobs, n_frames))
+    # Every chunk replays its script from the start, so contiguous chunks
+    # produce exactly what one process would.
+    bounds = [n_frames * i // jobs for i in range(jobs + 1)]
+    chunks = [(spec, a, b) for a, b in zip(bounds, bounds[1:])]
+    if jobs == 1:
+        results = [render_chunk(*chunks[0])]
+    else:
+        # spawn: a forked child would inherit the parent's Qt state.
+        with multiprocessing.get_context("spawn").Pool(jobs) as pool:
+            results = pool.starmap(render_chunk, chunks)
+
+    manifest = {k: v for k, v in spec.items() if k != "out"}
+    manifest["frames"] = [d for chunk in results for d in chunk]
+    with open(manifest_path, "w") as fh:
+        json.dump(manifest, fh, indent=1)
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scene", choices=sorted(SCENES))
+    parser.add_argument("--out", required=True, help="directory for PNG, file for raw RGBA")
+    parser.add_argument("--format", choices=FORMATS, default="png")
+    parser.add_argument("--duration", type=float, default=4.0, help="seconds of virtual time")
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--size", help="WIDTHxHEIGHT (default depends on the scene)")
+    parser.add_argument("--script", help="JSON file with scene parameters, e.g. keyframes/events")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    params = {}
+    if args.script:
+        with open(args.script) as fh:
+            params = json.load(fh)
+    size = SCENES[args.scene].size
+    if args.size:
+        size = tuple(int(v) for v in args.size.lower().split("x"))
+    spec = {
+        "scene": args.scene,
+        "params": params,
+        "size": list(size),
+        "duration": args.duration,
+        "fps": args.fps,
+        "format": args.format,
+        "out": args.out,
+    }
+    manifest = render(spec, args.jobs)
+    print(f"{len(manifest['frames'])} frames of {size[0]}x{size[1]} written to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""Lookup-table curves: accuracy against the exact functions, and throughput.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.curves
+
+Accuracy: the largest deviation of each table from the function it samples
+(the cw3 pulse wave, Qt easing curves, the full pulse_intensity) for a range
+of resolutions. The pass/fail bounds live in tests/test_curves.py.
+
+Throughput: nanoseconds per value for N animated instances, computed the
+old way (math.sin / QEasingCurve.valueForProgress per instance), with the
+table one value at a time, and with one batch ``evaluate`` per frame.
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from qt_compat.QtCore import QEasingCurve  # noqa: E402
+from qt_compat.QtWidgets import QApplication  # noqa: E402
+
+import curves  # noqa: E402
+from cw3 import pulse_intensities, pulse_intensity, pulse_intensity_exact, pulse_wave  # noqa: E402
+
+RESOLUTIONS = (64, 256, 1024, 4096)
+EASINGS = ("InOutCubic", "OutCubic", "InOutQuad", "OutBack")
+COUNTS = (1, 16, 64, 256, 1024, 10_000)
+
+
+def accuracy():
+    rows = []
+    for resolution in RESOLUTIONS:
+        errors = {"pulse wave": curves.CurveTable(pulse_wave, resolution, periodic=True).max_error()}
+        for name in EASINGS:
+            errors[name] = curves.easing_table(getattr(QEasingCurve.Type, name), resolution).max_error(
+                samples=20_000)
+        rows.append((resolution, errors))
+
+    # The whole pulse, table and batch paths against math.sin, over a 10-minute countdown.
+    rng = random.Random(1)
+    progress = [rng.random() for _ in range(20_000)]
+    times = [p * 600 for p in progress]
+    exact = [pulse_intensity_exact(p, t) for p, t in zip(progress, times)]
+    table = max(abs(pulse_intensity(p, t) - e) for p, t, e in zip(progress, times, exact))
+    batch = max(abs(float(v) - e) for v, e in zip(pulse_intensities(progress, times), exact))
+    return rows, table, batch
+
+
+def _ns_per_value(fn, n, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best / n * 1e9
+
+
+def throughput():
+    easing = QEasingCurve(QEasingCurve.Type.InOutCubic)
+    table = curves.easing_table(QEasingCurve.Type.InOutCubic)
+    rows = []
+    for n in COUNTS:
+        rng = random.Random(n)
+        xs = [rng.random() for _ in range(n)]
+        progress = [rng.random() for _ in range(n)]
+        times = [p * 600 for p in progress]
+        repeat = max(5, 20_000 // n)
+        rows.append((
+            n,
+            _ns_per_value(lambda: [easing.valueForProgress(x) for x in xs], n, repeat),
+            _ns_per_value(lambda: [table(x) for x in xs], n, repeat),
+            _ns_per_value(lambda: table.evaluate(xs), n, repeat),
+            _ns_per_value(lambda: [pulse_intensity_exact(p, t) for p, t in zip(progress, times)], n, repeat),
+            _ns_per_value(lambda: [pulse_intensity(p, t) for p, t in zip(progress, times)], n, repeat),
+            _ns_per_value(lambda: pulse_intensities(progress, times), n, repeat),
+        ))
+    return rows
+
+
+def main() -> int:
+    app = QApplication.instance() or QApplication(sys.argv)  # noqa: F841
+    rows, table, batch = accuracy()
+    names = list(rows[0][1])
+    print("max error " + " ".join(f"{name:>11s}" for name in names))
+    for resolution, errors in rows:
+        print(f"{resolution:9d} " + " ".join(f"{errors[name]:11.2e}" for name in names))
+    print(f"pulse_intensity vs math.sin: {table:.2e} (scalar), {batch:.2e} (batch)")
+
+    print(f"\nns per value{'':4s} {'easing Qt':>10s} {'table':>8s} {'batch':>8s} "
+          f"{'pulse sin':>10s} {'table':>8s} {'batch':>8s}")
+    for n, *cols in throughput():
+        print(f"N={n:<14d} {cols[0]:10.0f} {cols[1]:8.0f} {cols[2]:8.0f} "
+              f"{cols[3]:10.0f} {cols[4]:8.0f} {cols[5]:8.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
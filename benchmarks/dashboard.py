@@ -0,0 +1,89 @@
+"""CPU i liczba wybudzeń timerów w funkcji liczby minutników.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.dashboard
+
+"legacy" odtwarza dawny układ cw3.MainWindow (dwa QTimery 1000/40 ms na
+minutnik), "shared" to TimerDashboard z jednym FrameClock.
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from qt_compat.QtCore import QTimer  # noqa: E402
+from qt_compat.QtWidgets import QApplication  # noqa: E402
+
+from cw3 import FrameClock  # noqa: E402
+from dashboard import TimerDashboard  # noqa: E402
+
+COUNTS = (10, 50, 100, 200, 400)
+DURATION = 2.0
+
+
+def _run_loop(app, seconds):
+    wall0, cpu0 = time.perf_counter(), time.process_time()
+    deadline = wall0 + seconds
+    while time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.001)
+    return time.perf_counter() - wall0, time.process_time() - cpu0
+
+
+def run_legacy(app, n):
+    wakeups = [0]
+    board = TimerDashboard(frame_clock=FrameClock())
+    timers = []
+    for i in range(n):
+        display = board.add_timer(600 + i)
+        state = {"left": 600 + i, "t": 0.0}
+
+        def tick(display=display, state=state):
+            wakeups[0] += 1
+            state["left"] -= 1
+            display.set_time(state["left"] // 60, state["left"] % 60)
+
+        def pulse(display=display, state=state):
+            wakeups[0] += 1
+            state["t"] += 0.04
+            display.apply_intensity(0.6 + 0.4 * ((state["t"] * 2) % 1.0))
+
+        for interval, slot in ((1000, tick), (40, pulse)):
+            t = QTimer(board)
+            t.setInterval(interval)
+            t.timeout.connect(slot)
+            t.start()
+            timers.append(t)
+    board.show()
+    wall, cpu = _run_loop(app, DURATION)
+    for t in timers:
+        t.stop()
+    board.close()
+    return wakeups[0] / wall, cpu / wall
+
+
+def run_shared(app, n):
+    clock = FrameClock()
+    board = TimerDashboard(frame_clock=clock)
+    for i in range(n):
+        board.add_timer(600 + i)
+    board.show()
+    board.start_all()
+    wall, cpu = _run_loop(app, DURATION)
+    board.stop_all()
+    board.close()
+    return board.frames / wall, cpu / wall
+
+
+def main() -> int:
+    app = QApplication.instance() or QApplication(sys.argv)
+    print(f"{'timers':>6s} {'mode':>7s} {'wakeups/s':>10s} {'CPU %':>7s}")
+    for n in COUNTS:
+        for mode, fn in (("legacy", run_legacy), ("shared", run_shared)):
+            wakeups, cpu = fn(app, n)
+            print(f"{n:6d} {mode:>7s} {wakeups:10.1f} {cpu * 100:7.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
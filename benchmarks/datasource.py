@@ -0,0 +1,142 @@
+"""GUI frame time while data sources publish 10 000 updates per second.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.datasource
+
+A window with PowerBars, TimerDisplays and AnimatedToggles is driven at
+60 frames per second for DURATION seconds. Each frame applies the data
+snapshot once (SnapshotBinder.apply) and processes events, which paints.
+Modes:
+
+    idle      no source running, the floor
+    gui       the sources are polled inside the frame (blocking reads stall it)
+    threaded  ThreadedFeed polls them in a worker thread
+    async     AsyncFeed polls them on an asyncio loop in a worker thread
+
+Every source blocks LATENCY seconds per read to imitate slow I/O. The
+worker feeds keep the median frame near the paint cost, but they still share
+the GIL with the GUI thread, so watch p99 and max against the 16 ms budget.
+Correctness of the snapshot and binder is covered by tests/test_datasource.py.
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from qt_compat.QtWidgets import QApplication, QGridLayout, QWidget  # noqa: E402
+
+from animated_toggle import AnimatedToggle  # noqa: E402
+from benchmarks.harness import percentile  # noqa: E402
+from cw3 import TimerDisplay  # noqa: E402
+from datasource import AsyncFeed, SnapshotBinder, Snapshot, StandInSource, ThreadedFeed  # noqa: E402
+from power_bar import PowerBar  # noqa: E402
+
+RATE = 10_000
+DURATION = 3.0
+LATENCY = 0.002
+FRAME = 1 / 60
+BARS, TIMERS, TOGGLES = 24, 8, 16
+
+
+class Board(QWidget):
+    def __init__(self):
+        super().__init__()
+        layout = QGridLayout(self)
+        self.bars = [PowerBar(10) for _ in range(BARS)]
+        self.timers = [TimerDisplay() for _ in range(TIMERS)]
+        self.toggles = [AnimatedToggle() for _ in range(TOGGLES)]
+        for i, widget in enumerate(self.bars + self.timers + self.toggles):
+            layout.addWidget(widget, i // 8, i % 8)
+        self.resize(1200, 600)
+
+
+def _sources(rate, latency):
+    # Split the rate over the three kinds in proportion to their key count.
+    total = BARS + TIMERS + TOGGLES
+    return [
+        StandInSource([f"bar{i}" for i in range(BARS)], rate * BARS // total, "level", latency),
+        StandInSource([f"timer{i}" for i in range(TIMERS)], rate * TIMERS // total, "seconds", latency),
+        StandInSource([f"toggle{i}" for i in range(TOGGLES)], rate * TOGGLES // total, "switch", latency,
+                      period=0.25),
+    ]
+
+
+def _bind(binder, board):
+    for i, bar in enumerate(board.bars):
+        binder.bind_power_bar(f"bar{i}", bar)
+    for i, display in enumerate(board.timers):
+        binder.bind_timer(f"timer{i}", display)
+    for i, toggle in enumerate(board.toggles):
+        binder.bind_toggle(f"toggle{i}", toggle)
+
+
+def run(app, mode, rate, latency, duration):
+    board = Board()
+    board.show()
+    app.processEvents()
+    snapshot = Snapshot()
+    binder = SnapshotBinder(snapshot)
+    _bind(binder, board)
+    binder._timer.stop()  # frames are paced below, not by the binder's timer
+    sources = _sources(rate, latency)
+    feed = None
+    if mode == "threaded":
+        feed = ThreadedFeed(snapshot, sources)
+    elif mode == "async":
+        feed = AsyncFeed(snapshot, sources)
+    if feed is not None:
+        feed.start()
+
+    samples = []
+    start = next_frame = time.perf_counter()
+    while next_frame - start < duration:
+        t0 = time.perf_counter()
+        if mode == "gui":
+            for source in sources:
+                snapshot.publish(source.read(time.monotonic()))
+        binder.apply()
+        app.processEvents()
+        samples.append((time.perf_counter() - t0) * 1e6)
+        next_frame += FRAME
+        delay = next_frame - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+    elapsed = time.perf_counter() - start
+
+    if feed is not None:
+        feed.stop()
+    board.close()
+    board.deleteLater()
+    app.processEvents()
+    samples.sort()
+    return {
+        "mode": mode,
+        "frames": len(samples),
+        "p50_us": percentile(samples, 50),
+        "p99_us": percentile(samples, 99),
+        "max_us": samples[-1],
+        "updates_per_s": sum(source.produced for source in sources) / elapsed,
+        "applied": binder.applied,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rate", type=int, default=RATE)
+    parser.add_argument("--latency", type=float, default=LATENCY)
+    parser.add_argument("--duration", type=float, default=DURATION)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    print(f"{'mode':9s} {'frames':>6s} {'p50 us':>9s} {'p99 us':>9s} {'max us':>9s} "
+          f"{'updates/s':>10s} {'applied':>8s}")
+    for mode in ("idle", "gui", "threaded", "async"):
+        r = run(app, mode, args.rate, args.latency, args.duration)
+        print(f"{r['mode']:9s} {r['frames']:6d} {r['p50_us']:9.0f} {r['p99_us']:9.0f} {r['max_us']:9.0f} "
+              f"{r['updates_per_s']:10.0f} {r['applied']:8d}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""Scroll frame time of a QTableView with toggle and level-bar delegates.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.delegates
+
+One frame = scroll by a page and synchronously repaint the viewport. With
+delegates the cost depends on the visible rows only, so it should stay flat
+from 1k to 100k rows.
+"""
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from qt_compat.QtCore import QAbstractTableModel, QModelIndex, Qt  # noqa: E402
+from qt_compat.QtWidgets import QApplication, QHeaderView, QTableView  # noqa: E402
+
+from benchmarks import harness  # noqa: E402
+from delegates import PowerBarDelegate, ToggleDelegate  # noqa: E402
+
+ROWS = (1_000, 10_000, 100_000)
+
+
+class _Model(QAbstractTableModel):
+    def __init__(self, rows):
+        super().__init__()
+        self._rows = rows
+        self._flipped = set()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+
+    def flags(self, index):
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        row = index.row()
+        if index.column() == 0 and role == Qt.ItemDataRole.CheckStateRole:
+            on = (row % 3 == 0) != (row in self._flipped)
+            return Qt.CheckState.Checked if on else Qt.CheckState.Unchecked
+        if index.column() == 1 and role == Qt.ItemDataRole.DisplayRole:
+            return (row * 37) % 101
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        self._flipped ^= {index.row()}
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+
+def bench(rows):
+    model = _Model(rows)
+    view = QTableView()
+    view.setModel(model)
+    view.setItemDelegateForColumn(0, ToggleDelegate(view))
+    view.setItemDelegateForColumn(1, PowerBarDelegate(view, steps=20))
+    header = view.verticalHeader()
+    header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    header.setDefaultSectionSize(30)
+    view.setColumnWidth(0, 70)
+    view.setColumnWidth(1, 300)
+    view.resize(420, 600)
+    view.show()
+    QApplication.processEvents()
+
+    bar = view.verticalScrollBar()
+
+    def frame(i):
+        bar.setValue((i * bar.pageStep()) % (bar.maximum() + 1))
+        view.viewport().repaint()
+
+    result = harness.measure("QTableView scroll", frame, frames=200, rows=rows)
+    view.close()
+    return result
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)  # noqa: F841
+    harness.print_table([bench(rows) for rows in ROWS])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""Shared helpers for the headless benchmarks.
+
+Every benchmark produces plain dicts so results can be printed, written as a
+JSON baseline and compared against an earlier run.  Suites can be run in
+child processes so their caches and allocations do not leak into each other,
+see ``run_isolated``; the binding follows ``QT_API`` (see qt_compat).
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def percentile(sorted_samples, pc):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_samples:
+        return 0.0
+    k = max(0, min(len(sorted_samples) - 1, round(pc / 100 * (len(sorted_samples) - 1))))
+    return sorted_samples[k]
+
+
+def measure(name, frame, frames=300, warmup=20, **params):
+    """Call ``frame(i)`` repeatedly and return timing/allocation statistics.
+
+    Timings are reported in microseconds.  Allocation figures come from a
+    second, traced pass: ``alloc_peak_bytes`` is the mean transient peak of
+    Python allocations inside one frame and ``retained_bytes`` is the net
+    growth per frame (anything above zero is a leak or a growing cache).
+    """
+    for i in range(warmup):
+        frame(i)
+
+    samples = []
+    for i in range(frames):
+        t0 = time.perf_counter()
+        frame(warmup + i)
+        samples.append((time.perf_counter() - t0) * 1e6)
+    samples.sort()
+
+    traced = min(frames, 100)
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    peaks = 0
+    for i in range(traced):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        frame(warmup + frames + i)
+        _, peak = tracemalloc.get_traced_memory()
+        peaks += peak - before
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "name": name,
+        "params": params,
+        "frames": frames,
+        "mean_us": sum(samples) / len(samples),
+        "p50_us": percentile(samples, 50),
+        "p90_us": percentile(samples, 90),
+        "p99_us": percentile(samples, 99),
+        "max_us": samples[-1],
+        "alloc_peak_bytes": peaks / traced,
+        "retained_bytes": (end - start) / traced,
+    }
+
+
+def result_key(result):
+    params = ",".join(f"{k}={v}" for k, v in sorted(result["params"].items()))
+    return f"{result['name']}[{params}]"
+
+
+def save_baseline(results, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({result_key(r): r for r in results}, f, indent=2, sort_keys=True)
+
+
+def compare(results, baseline_path, metric="p50_us", tolerance=0.2):
+    """Return ``(key, old, new)`` for every result slower than the baseline by more than ``tolerance``."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = []
+    for r in results:
+        old = baseline.get(result_key(r))
+        if old is None:
+            continue
+        if r[metric] > old[metric] * (1 + tolerance):
+            regressions.append((result_key(r), old[metric], r[metric]))
+    return regressions
+
+
+def run_isolated(module, suite, *args):
+    """Run ``python -m module --suite suite --json`` and return its parsed results."""
+    out = subprocess.run(
+        [sys.executable, "-m", module, "--suite", suite, "--json", *args],
+        check=True, stdout=subprocess.PIPE, text=True,
+    )
+    return json.loads(out.stdout)
+
+
+def print_table(results):
+    print(f"{'benchmark':48s} {'p50 us':>9s} {'p90 us':>9s} {'p99 us':>9s} {'alloc B':>9s} {'kept B':>8s}")
+    for r in results:
+        print(
+            f"{result_key(r):48s} {r['p50_us']:9.1f} {r['p90_us']:9.1f} {r['p99_us']:9.1f} "
+            f"{r['alloc_peak_bytes']:9.0f} {r['retained_bytes']:8.1f}"
+        )
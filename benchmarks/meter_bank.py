@@ -0,0 +1,82 @@
+"""Frame time of MeterBank against one PowerBar per channel.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.meter_bank
+
+One frame = bulk update of all channel levels, peak-hold step and a full
+paint into a QImage.
+"""
+import os
+import random
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from qt_compat.QtGui import QImage, QPainter  # noqa: E402
+from qt_compat.QtWidgets import QApplication, QVBoxLayout, QWidget  # noqa: E402
+
+from benchmarks import harness  # noqa: E402
+from meter_bank import MeterBank  # noqa: E402
+from power_bar import PowerBar  # noqa: E402
+
+CHANNELS = (16, 64, 256)
+STEPS = 20
+ROW_HEIGHT = 12
+
+
+def _levels(channels, frames=64):
+    rnd = random.Random(1)
+    return [[rnd.random() for _ in range(channels)] for _ in range(frames)]
+
+
+def bench_bank(channels):
+    bank = MeterBank(channels, STEPS)
+    bank.setPeakHold(300, 1.0)
+    bank.resize(400, channels * ROW_HEIGHT)
+    image = QImage(bank.size(), QImage.Format.Format_ARGB32_Premultiplied)
+    levels = _levels(channels)
+
+    def frame(i):
+        bank.setValues(levels[i % len(levels)])
+        bank.advance(1 / 60)
+        p = QPainter(image)
+        bank.render(p)
+        p.end()
+
+    return harness.measure("MeterBank", frame, frames=200, channels=channels)
+
+
+def bench_power_bars(channels):
+    host = QWidget()
+    layout = QVBoxLayout(host)
+    bars = []
+    for _ in range(channels):
+        bar = PowerBar(STEPS)
+        layout.addWidget(bar)
+        bars.append(bar)
+    host.resize(400, channels * ROW_HEIGHT * 4)
+    layout.activate()
+    image = QImage(host.size(), QImage.Format.Format_ARGB32_Premultiplied)
+    levels = _levels(channels)
+
+    def frame(i):
+        for bar, level in zip(bars, levels[i % len(levels)]):
+            bar.setValue(int(level * 99))
+        p = QPainter(image)
+        host.render(p)
+        p.end()
+
+    return harness.measure("PowerBar x N", frame, frames=30, warmup=3, channels=channels)
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)  # noqa: F841
+    results = []
+    for channels in CHANNELS:
+        results.append(bench_bank(channels))
+        results.append(bench_power_bars(channels))
+    harness.print_table(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
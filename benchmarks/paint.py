@@ -0,0 +1,152 @@
+"""Headless paint benchmarks for every widget in the repository.
+
+    python -m benchmarks.paint                      # run and print
+    python -m benchmarks.paint --save base.json     # store a baseline
+    python -m benchmarks.paint --compare base.json  # fail on regressions
+
+Each suite runs in its own process so glyph/layer caches and allocations of
+one widget do not skew the next. Set ``QT_API=pyqt5`` or ``pyqt6`` to choose
+the binding.
+"""
+import argparse
+import json
+import sys
+
+from benchmarks import harness
+
+SUITES = ("cw3", "power_bar", "toggle")
+
+
+def _render_into(widget, image, QPainter):
+    p = QPainter(image)
+    widget.render(p)
+    p.end()
+
+
+def suite_cw3():
+    from qt_compat.QtGui import QImage, QPainter
+    from qt_compat.QtWidgets import QApplication
+    from cw3 import SevenSegmentDisplay, TimerDisplay
+
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    results = []
+
+    for w, h in ((48, 80), (96, 160), (192, 320)):
+        digit = SevenSegmentDisplay()
+        digit.resize(w, h)
+        image = QImage(w, h, QImage.Format.Format_ARGB32_Premultiplied)
+
+        def frame(i, digit=digit, image=image):
+            digit.set_digit(i % 10)
+            _render_into(digit, image, QPainter)
+
+        results.append(harness.measure("SevenSegmentDisplay", frame, size=f"{w}x{h}"))
+
+    for w, h in ((240, 100), (480, 200)):
+        display = TimerDisplay()
+        display.resize(w, h)
+        image = QImage(w, h, QImage.Format.Format_ARGB32_Premultiplied)
+
+        def frame(i, display=display, image=image):
+            display.set_time((i // 60) % 100, i % 60)
+            display.apply_intensity(0.4 + (i % 25) / 40)
+            _render_into(display, image, QPainter)
+
+        results.append(harness.measure("TimerDisplay", frame, size=f"{w}x{h}"))
+
+    return results
+
+
+def suite_power_bar():
+    from qt_compat.QtGui import QImage, QPainter
+    from qt_compat.QtWidgets import QApplication
+    from power_bar import PowerBar
+
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    results = []
+
+    for steps in (10, 100, 1000):
+        for w, h in ((200, 60), (800, 60)):
+            bar = PowerBar(steps)
+            bar._bar.resize(w, h)
+            image = QImage(w, h, QImage.Format.Format_ARGB32_Premultiplied)
+
+            def frame(i, bar=bar, image=image):
+                bar.setValue(bar.maximum() - i % (bar.maximum() // 2 + 1))
+                _render_into(bar._bar, image, QPainter)
+
+            results.append(harness.measure("_Bar", frame, steps=steps, size=f"{w}x{h}"))
+
+    # Dial drag on a shown bar: value change, invalidation and the resulting paint.
+    for steps in (100, 1000, 5000):
+        bar = PowerBar(steps)
+        bar.resize(800, 300)
+        bar.show()
+        app.processEvents()
+
+        def frame(i, bar=bar):
+            i %= 2 * bar.maximum()
+            bar.setValue(i if i <= bar.maximum() else 2 * bar.maximum() - i)
+            app.processEvents()
+
+        results.append(harness.measure("PowerBar drag", frame, steps=steps))
+        bar.close()
+
+    return results
+
+
+def suite_toggle():
+    from qt_compat.QtGui import QImage, QPainter
+    from qt_compat.QtWidgets import QApplication
+    from animated_toggle import AnimatedToggle
+
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    results = []
+
+    for w, h in ((58, 45), (116, 90), (232, 180)):
+        toggle = AnimatedToggle()
+        toggle.resize(w, h)
+        image = QImage(w, h, QImage.Format.Format_ARGB32_Premultiplied)
+
+        def frame(i, toggle=toggle, image=image):
+            toggle.handle_position = (i % 20) / 19
+            _render_into(toggle, image, QPainter)
+
+        results.append(harness.measure("AnimatedToggle", frame, size=f"{w}x{h}"))
+
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--suite", choices=SUITES)
+    parser.add_argument("--json", action="store_true", help="print raw results as JSON")
+    parser.add_argument("--save", metavar="FILE", help="write results as a baseline")
+    parser.add_argument("--compare", metavar="FILE", help="compare against a baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    if args.suite:
+        results = globals()[f"suite_{args.suite}"]()
+    else:
+        results = []
+        for suite in SUITES:
+            results += harness.run_isolated("benchmarks.paint", suite)
+
+    if args.json:
+        json.dump(results, sys.stdout)
+        return 0
+
+    harness.print_table(results)
+    if args.save:
+        harness.save_baseline(results, args.save)
+    if args.compare:
+        regressions = harness.compare(results, args.compare, tolerance=args.tolerance)
+        for key, old, new in regressions:
+            print(f"REGRESSION {key}: p50 {old:.1f} us -> {new:.1f} us")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""Cost of PowerBar attribute access and of a _Bar paint: __getattr__ pull vs delegates/push.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.power_bar_attrs
+
+The "legacy" classes reproduce the old layout: QDial methods resolved through
+__getattr__ on every call and _Bar pulling min/max/value from its parent
+during paint.
+"""
+import os
+import sys
+import timeit
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from qt_compat import QtGui, QtWidgets  # noqa: E402
+
+from benchmarks import harness  # noqa: E402
+from power_bar import PowerBar, _Bar  # noqa: E402
+
+
+class _LegacyPowerBar(QtWidgets.QWidget):
+    """Old PowerBar: every QDial call falls through to __getattr__."""
+
+    def __init__(self, steps):
+        super().__init__()
+        self._dial = QtWidgets.QDial(self)
+        self._bar = _PullBar(PowerBar(steps)._bar.steps, self)
+        self._dial.valueChanged.connect(self._bar._trigger_refresh)
+
+    def __getattr__(self, name):
+        return getattr(self._dial, name)
+
+
+class _PullBar(_Bar):
+    """_Bar that asks its parent for min/max/value whenever it needs them."""
+
+    def _lit_steps(self):
+        parent = self.parent()
+        vmin, vmax = parent.minimum(), parent.maximum()
+        if vmax <= vmin:
+            return 0
+        return int((parent.value() - vmin) / (vmax - vmin) * self.n_steps)
+
+
+def bench_lookup(bar, label):
+    n = 200_000
+    t = timeit.timeit(lambda: bar.value(), number=n) / n * 1e9
+    t_attr = timeit.timeit(lambda: bar.value, number=n) / n * 1e9
+    print(f"{label:10s} bar.value() {t:7.1f} ns   bar.value lookup {t_attr:7.1f} ns")
+
+
+def bench_paint(bar, label, steps):
+    bar._bar.resize(400, 60)
+    image = QtGui.QImage(bar._bar.size(), QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+
+    def frame(i):
+        bar.setValue(50 + i % 50)
+        p = QtGui.QPainter(image)
+        bar._bar.render(p)
+        p.end()
+
+    return harness.measure(f"_Bar paint ({label})", frame, steps=steps)
+
+
+def main():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)  # noqa: F841
+
+    legacy = _LegacyPowerBar(100)
+    current = PowerBar(100)
+    bench_lookup(legacy, "legacy")
+    bench_lookup(current, "delegates")
+    bench_lookup(current._dial, "QDial")
+
+    results = []
+    for steps in (10, 1000):
+        results.append(bench_paint(_LegacyPowerBar(steps), "pull", steps))
+        results.append(bench_paint(PowerBar(steps), "push", steps))
+    harness.print_table(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
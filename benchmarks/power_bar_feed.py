@@ -0,0 +1,83 @@
+"""PowerBar fed from a worker thread at a high rate.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.power_bar_feed
+
+A producer thread calls setValueAsync RATE times per second for DURATION
+seconds; the table shows how many values were applied, dropped or merged,
+how many paints the bar received, and whether the last value won.
+"""
+import os
+import sys
+import threading
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from qt_compat import QtCore, QtWidgets  # noqa: E402
+
+from power_bar import PowerBar  # noqa: E402
+
+RATE = 10_000
+DURATION = 2.0
+
+
+class _PaintCounter(QtCore.QObject):
+    def __init__(self):
+        super().__init__()
+        self.paints = 0
+
+    def eventFilter(self, obj, event):
+        if event.type() == QtCore.QEvent.Type.Paint:
+            self.paints += 1
+        return False
+
+
+def run(app, interval_ms):
+    bar = PowerBar(200)
+    bar.setCoalescing(interval_ms)
+    bar.resize(600, 300)
+    counter = _PaintCounter()
+    bar._bar.installEventFilter(counter)
+    bar.show()
+    app.processEvents()
+
+    last = [0]
+
+    def produce():
+        n = int(RATE * DURATION)
+        t0 = time.perf_counter()
+        for i in range(n):
+            last[0] = i % 100
+            bar.setValueAsync(last[0])
+            delay = t0 + (i + 1) / RATE - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+    worker = threading.Thread(target=produce)
+    worker.start()
+    while worker.is_alive():
+        app.processEvents()
+        time.sleep(0.001)
+    end = time.perf_counter() + 0.1
+    while time.perf_counter() < end:
+        app.processEvents()
+
+    result = (
+        interval_ms, bar.droppedUpdates(), bar.coalescedUpdates(),
+        counter.paints, bar.value() == last[0],
+    )
+    bar.close()
+    return result
+
+
+def main():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    print(f"{'interval':>8s} {'dropped':>8s} {'coalesced':>9s} {'paints':>7s} {'latest':>6s}")
+    for interval_ms in (None, 16, 33):
+        interval, dropped, coalesced, paints, latest = run(app, interval_ms)
+        print(f"{str(interval):>8s} {dropped:8d} {coalesced:9d} {paints:7d} {str(latest):>6s}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""Pointer input on PowerBar's _Bar, timed.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.power_bar_input
+
+A drag across horizontal and vertical bars of up to 10 000 steps is timed
+per mouse move, including the partial repaint it causes. The synthetic
+events come from tests/input_events.py, shared with the input tests.
+"""
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from qt_compat import QtCore, QtWidgets  # noqa: E402
+
+from benchmarks import harness  # noqa: E402
+from tests.input_events import ORIENTATIONS, bar_point, make_power_bar, mouse  # noqa: E402
+
+STEPS = (10, 1000, 10_000)
+
+
+def bench_drag(app, steps, name, orientation):
+    widget, bar = make_power_bar(steps, orientation, (1200, 1200))
+    length = bar._length()
+    mouse(bar, QtCore.QEvent.Type.MouseButtonPress, *bar_point(bar, 0))
+
+    def frame(i):
+        # Sweep back and forth, a few pixels per move like a fast drag.
+        along = (i * 37) % (2 * length)
+        along = along if along < length else 2 * length - along
+        mouse(bar, QtCore.QEvent.Type.MouseMove, *bar_point(bar, along))
+        app.processEvents()
+
+    result = harness.measure(f"PowerBar drag {name}", frame, frames=300, steps=steps)
+    widget.close()
+    return result
+
+
+def main():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    results = [bench_drag(app, steps, name, orientation)
+               for steps in STEPS for name, orientation in ORIENTATIONS]
+    harness.print_table(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""Koszt rysowania jednej klatki pulsu TimerDisplay: przekolorowanie vs krycie.
+
+Uruchomienie (z katalogu repozytorium):
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.pulse
+"""
+import math
+import time
+
+from qt_compat.QtGui import QImage, QPainter
+from qt_compat.QtWidgets import QApplication
+
+from cw3 import SevenSegmentDisplay, TimerDisplay
+
+
+def run(opacity_pulse: bool, frames: int = 500) -> dict:
+    display = TimerDisplay(opacity_pulse=opacity_pulse)
+    display.resize(320, 120)
+    display.set_time(12, 34)
+    image = QImage(display.size(), QImage.Format.Format_ARGB32_Premultiplied)
+
+    cache = SevenSegmentDisplay.glyph_cache
+    cache.clear()
+    cache.reset_stats()
+
+    samples = []
+    for i in range(frames):
+        intensity = 0.4 + 0.6 * (math.sin(i * 0.25) * 0.5 + 0.5)
+        t0 = time.perf_counter()
+        display.apply_intensity(intensity)
+        p = QPainter(image)
+        display.render(p)
+        p.end()
+        samples.append(time.perf_counter() - t0)
+
+    samples.sort()
+    return {
+        "mode": "opacity" if opacity_pulse else "recolor",
+        "mean_us": sum(samples) / frames * 1e6,
+        "p50_us": samples[frames // 2] * 1e6,
+        "p95_us": samples[int(frames * 0.95)] * 1e6,
+        "glyph_misses": cache.misses,
+        "glyph_hits": cache.hits,
+    }
+
+
+def main() -> None:
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    for opacity_pulse in (False, True):
+        r = run(opacity_pulse)
+        print(
+            f"{r['mode']:8s} mean {r['mean_us']:8.1f} us  p50 {r['p50_us']:8.1f} us  "
+            f"p95 {r['p95_us']:8.1f} us  glyph misses {r['glyph_misses']}/{r['glyph_hits'] + r['glyph_misses']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Wybudzenia i CPU minutnika cw3 przez 10 minut odliczania: stały krok vs adaptacyjny.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.pulse_schedule
+    python -m benchmarks.pulse_schedule --realtime 20   # dodatkowo 20 s na żywo
+
+Odliczanie biegnie na ManualClock: zegar przeskakuje od razu do terminu,
+na który FrameClock nastawił timer, więc 10 minut liczy się w kilka sekund,
+a wybudzenia są dokładnie te, które wykonałaby aplikacja. CPU to czas
+procesu zużyty na klatki (z odmalowaniem). Tryby:
+
+    fixed    dawne zachowanie - klatka co 40 ms od Start do końca
+    visible  adaptacyjny puls (pulse_interval), okno widoczne
+    hidden   adaptacyjny, okno ukryte przez całe odliczanie
+    resumed  ukryte do połowy, potem pokazane w środku cyklu pulsu
+
+Próg zmiany jasności między klatkami i powrót pulsu w fazie sprawdza
+tests/test_pulse_schedule.py.
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from qt_compat.QtCore import QTimer  # noqa: E402
+from qt_compat.QtWidgets import QApplication  # noqa: E402
+
+from countdown import ManualClock  # noqa: E402
+from cw3 import FrameClock, MainWindow  # noqa: E402
+
+SECONDS = 600
+MODES = ("fixed", "visible", "hidden", "resumed")
+
+
+class _Recorder:
+    """Zapamiętuje czasy klatek pulsu okna (bez ingerencji w MainWindow)."""
+
+    def __init__(self, window):
+        self.frames = []
+        pulse_tick = window._pulse_tick
+
+        def recorded(now):
+            result = pulse_tick(now)
+            if window._pulse_visible():
+                self.frames.append(now)
+            return result
+
+        window._pulse_tick = recorded
+
+
+def run(app, mode, seconds):
+    clock = ManualClock(1000.0)
+    frame_clock = FrameClock(clock=clock, adaptive=mode != "fixed")
+    window = MainWindow(frame_clock)
+    window.resize(480, 200)
+    window.show()
+    app.processEvents()
+    recorder = _Recorder(window)
+    window.time_input.setText(str(seconds))
+    window.start()
+    if mode in ("hidden", "resumed"):
+        window.hide()
+    start = clock.now
+
+    cpu0 = time.process_time()
+    while True:
+        timer = frame_clock._timer
+        if not timer.isActive():
+            break
+        interval = timer.interval()
+        timer.stop()  # klatkami steruje pętla poniżej, nie prawdziwy czas
+        if mode == "resumed" and window.isHidden() and clock.now + interval / 1000 >= start + seconds / 2:
+            clock.now = start + seconds / 2 + 0.123  # odsłonięcie w środku cyklu pulsu
+            window.show()
+            app.processEvents()
+            continue
+        clock.advance(interval / 1000)
+        frame_clock.tick()
+        app.processEvents()
+    cpu = time.process_time() - cpu0
+
+    window.close()
+    return {
+        "mode": mode,
+        "wakeups": frame_clock.wakeups,
+        "wakeups_per_s": frame_clock.wakeups / seconds,
+        "cpu_ms": cpu * 1000,
+        "pulse_frames": len(recorder.frames),
+    }
+
+
+def run_realtime(app, mode, seconds):
+    """Na żywo, prawdziwym zegarem: wybudzenia i CPU w ciągu ``seconds``."""
+    frame_clock = FrameClock(adaptive=mode != "fixed")
+    window = MainWindow(frame_clock)
+    window.show()
+    window.time_input.setText(str(SECONDS))
+    window.start()
+    if mode == "hidden":
+        window.hide()
+    QTimer.singleShot(int(seconds * 1000), app.quit)
+    wall0, cpu0 = time.perf_counter(), time.process_time()
+    app.exec()
+    wall, cpu = time.perf_counter() - wall0, time.process_time() - cpu0
+    window.stop()
+    window.close()
+    return frame_clock.wakeups / wall, cpu / wall
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=int, default=SECONDS)
+    parser.add_argument("--realtime", type=float, default=0.0, metavar="S")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    print(f"{args.seconds} s odliczania (ManualClock)")
+    print(f"{'tryb':8s} {'wybudzeń':>9s} {'na s':>7s} {'klatek pulsu':>13s} {'CPU ms':>8s}")
+    for mode in MODES:
+        r = run(app, mode, args.seconds)
+        print(f"{r['mode']:8s} {r['wakeups']:9d} {r['wakeups_per_s']:7.2f} "
+              f"{r['pulse_frames']:13d} {r['cpu_ms']:8.0f}")
+
+    if args.realtime:
+        print(f"\nna żywo, {args.realtime:.0f} s (app.exec())")
+        print(f"{'tryb':8s} {'wybudzeń/s':>11s} {'CPU %':>7s}")
+        for mode in ("fixed", "visible", "hidden"):
+            wakeups, cpu = run_realtime(app, mode, args.realtime)
+            print(f"{mode:8s} {wakeups:11.1f} {cpu * 100:7.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
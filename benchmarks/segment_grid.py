@@ -0,0 +1,90 @@
+"""Siatka 1000 TimerDisplay: 4 cyfry + etykieta vs jeden SegmentDisplay.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.segment_grid
+
+Każdy wariant działa w osobnym procesie, żeby pomiar pamięci był czysty.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from benchmarks import harness
+
+INSTANCES = 1000
+COLUMNS = 25
+BACKENDS = ("widgets", "single")
+
+
+def _rss_kib() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        return 0
+
+
+def run(backend: str) -> dict:
+    from qt_compat.QtGui import QImage, QPainter
+    from qt_compat.QtWidgets import QApplication, QGridLayout, QWidget
+    from cw3 import TimerDisplay
+
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    rss0 = _rss_kib()
+    tracemalloc.start()
+    grid = QWidget()
+    layout = QGridLayout(grid)
+    displays = []
+    for i in range(INSTANCES):
+        display = TimerDisplay(single_widget=backend == "single")
+        display.set_time(i // 60, i % 60)
+        layout.addWidget(display, i // COLUMNS, i % COLUMNS)
+        displays.append(display)
+    grid.resize(COLUMNS * 180, (INSTANCES // COLUMNS) * 90)
+    layout.activate()
+    py_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    image = QImage(grid.size(), QImage.Format.Format_ARGB32_Premultiplied)
+    samples = []
+    for frame in range(10):
+        for display in displays:
+            display.apply_intensity(0.5 + frame / 20)
+        t0 = time.perf_counter()
+        p = QPainter(image)
+        grid.render(p)
+        p.end()
+        samples.append((time.perf_counter() - t0) * 1e3)
+    samples.sort()
+    return {
+        "backend": backend,
+        "widgets": len(grid.findChildren(QWidget)),
+        "rss_kib": _rss_kib() - rss0,
+        "python_kib": py_bytes // 1024,
+        "paint_ms_p50": harness.percentile(samples, 50),
+        "paint_ms_max": samples[-1],
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--suite", choices=BACKENDS)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+    if args.suite:
+        json.dump(run(args.suite), sys.stdout)
+        return 0
+    print(f"{'backend':>8s} {'widgets':>8s} {'RSS KiB':>9s} {'Py KiB':>8s} {'paint p50 ms':>13s} {'max ms':>8s}")
+    for backend in BACKENDS:
+        r = harness.run_isolated("benchmarks.segment_grid", backend)
+        print(
+            f"{r['backend']:>8s} {r['widgets']:8d} {r['rss_kib']:9d} {r['python_kib']:8d} "
+            f"{r['paint_ms_p50']:13.1f} {r['paint_ms_max']:8.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""Przepustowość TimerEngine: dodawanie, wygasanie i odtwarzanie z dziennika.
+
+    python -m benchmarks.timer_engine            # 100 000 minutników
+    python -m benchmarks.timer_engine --count 10000
+
+"linear" to dawne podejście (przegląd wszystkich odliczań w każdej klatce,
+jak CountdownDriver) - podane dla porównania kosztu jednej klatki bez
+wygaśnięć.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+from countdown import ManualClock
+from timer_engine import Journal, TimerEngine
+
+
+def _durations(count, seed=1):
+    rnd = random.Random(seed)
+    return [rnd.uniform(1.0, 3600.0) for _ in range(count)]
+
+
+def bench_insert(durations, journal_path=None):
+    clock = ManualClock()
+    journal = Journal(journal_path) if journal_path else None
+    engine = TimerEngine(clock=clock, journal=journal)
+    t0 = time.perf_counter()
+    for i, seconds in enumerate(durations):
+        engine.add(i, seconds)
+    elapsed = time.perf_counter() - t0
+    if journal is not None:
+        journal.close()
+    return engine, clock, elapsed
+
+
+def bench_expire(engine, clock, step=1.0):
+    """Przesuwa zegar co ``step`` s aż wszystkie minutniki wygasną."""
+    expired = 0
+    t0 = time.perf_counter()
+    while len(engine):
+        clock.advance(step)
+        expired += len(engine.advance())
+    return expired, time.perf_counter() - t0
+
+
+def bench_stages(count, seed=2):
+    """Minutniki interwałowe: każde wygaśnięcie wstawia kolejny etap do kopca."""
+    rnd = random.Random(seed)
+    clock = ManualClock()
+    engine = TimerEngine(clock=clock)
+    for i in range(count):
+        engine.add(i, [("praca", rnd.uniform(20, 40)), ("przerwa", rnd.uniform(5, 15))], repeats=4)
+    return bench_expire(engine, clock)
+
+
+def bench_idle_frame(engine, clock, frames=200):
+    """Koszt klatki, w której nic nie wygasa: kopiec vs przegląd liniowy."""
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        engine.advance(clock.now)
+    heap_us = (time.perf_counter() - t0) / frames * 1e6
+
+    timers = list(engine._timers.values())
+    now = clock.now
+    t0 = time.perf_counter()
+    for _ in range(frames // 10):
+        [t for t in timers if t.deadline is not None and t.deadline <= now]
+    linear_us = (time.perf_counter() - t0) / (frames // 10) * 1e6
+    return heap_us, linear_us
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+    n = args.count
+    durations = _durations(n)
+
+    def row(name, ops, seconds):
+        print(f"{name:34s} {ops:>9d} {seconds * 1000:10.1f} {ops / seconds:12.0f}")
+
+    print(f"{'operacja':34s} {'ops':>9s} {'ms':>10s} {'ops/s':>12s}")
+    engine, clock, t = bench_insert(durations)
+    row("add", n, t)
+
+    heap_us, linear_us = bench_idle_frame(engine, clock)
+
+    expired, t = bench_expire(engine, clock)
+    row("expire (co 1 s wirtualnego czasu)", expired, t)
+
+    expired, t = bench_stages(n)
+    row("expire, 2 etapy x 4 powtórzenia", expired, t)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "timers.jsonl")
+        _, clock, t = bench_insert(durations, path)
+        row("add + dziennik", n, t)
+        t0 = time.perf_counter()
+        restored = TimerEngine.restore(path, clock=clock)
+        row("restore z dziennika", len(restored), time.perf_counter() - t0)
+        restored.journal.close()
+
+    print(f"\nklatka bez wygaśnięć przy {n} minutnikach: "
+          f"kopiec {heap_us:.2f} us, przegląd liniowy {linear_us:.0f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""Flip 1000 AnimatedToggles at once and run until every animation settles.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.toggle_storm
+
+"legacy" rebuilds the old per-toggle QPropertyAnimation group (two property
+setters each calling update()); "pooled" is the shared ToggleAnimator.
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from qt_compat.QtCore import QEasingCurve, QEvent, QObject, QPropertyAnimation, QSequentialAnimationGroup  # noqa: E402
+from qt_compat.QtWidgets import QApplication, QGridLayout, QWidget  # noqa: E402
+
+from animated_toggle import AnimatedToggle, ToggleAnimator  # noqa: E402
+
+COUNT = 1000
+COLUMNS = 40
+
+
+class _LegacyToggle(AnimatedToggle):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.animation = QPropertyAnimation(self, b"handle_position", self)
+        self.animation.setEasingCurve(QEasingCurve.Type.InOutCubic)
+        self.animation.setDuration(200)
+        self.pulse_anim = QPropertyAnimation(self, b"pulse_radius", self)
+        self.pulse_anim.setDuration(350)
+        self.pulse_anim.setStartValue(10)
+        self.pulse_anim.setEndValue(20)
+        self.pulse_anim.stateChanged.connect(
+            lambda state: setattr(self, "_pulse_active", state == QPropertyAnimation.State.Running))
+        self.animations_group = QSequentialAnimationGroup(self)
+        self.animations_group.addAnimation(self.animation)
+        self.animations_group.addAnimation(self.pulse_anim)
+
+    def setup_animation(self, value):
+        self.animations_group.stop()
+        self.animation.setEndValue(1 if value else 0)
+        self.animations_group.start()
+
+
+class _Counter(QObject):
+    def __init__(self):
+        super().__init__()
+        self.paints = 0
+        self.update_requests = 0
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            self.paints += 1
+        elif event.type() == QEvent.Type.UpdateRequest:
+            self.update_requests += 1
+        return False
+
+
+def run(app, toggle_cls, busy):
+    host = QWidget()
+    layout = QGridLayout(host)
+    toggles = [toggle_cls() for _ in range(COUNT)]
+    for i, t in enumerate(toggles):
+        t.setFixedSize(t.sizeHint())
+        layout.addWidget(t, i // COLUMNS, i % COLUMNS)
+    counter = _Counter()
+    host.installEventFilter(counter)
+    for t in toggles:
+        t.installEventFilter(counter)
+    host.show()
+    app.processEvents()
+
+    wall0, cpu0 = time.perf_counter(), time.process_time()
+    for t in toggles:
+        t.setChecked(True)  # "select all"
+    while busy(toggles):
+        app.processEvents()
+    wall, cpu = time.perf_counter() - wall0, time.process_time() - cpu0
+    host.close()
+    return wall, cpu, counter.paints, counter.update_requests
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    animator = ToggleAnimator.shared()
+    print(f"{'mode':>7s} {'wall ms':>8s} {'CPU ms':>8s} {'paints':>8s} {'window updates':>15s}")
+    for mode, cls, busy in (
+        ("legacy", _LegacyToggle,
+         lambda ts: any(t.animations_group.state() == QPropertyAnimation.State.Running for t in ts)),
+        ("pooled", AnimatedToggle, lambda ts: len(animator) > 0),
+    ):
+        wall, cpu, paints, updates = run(app, cls, busy)
+        print(f"{mode:>7s} {wall * 1e3:8.0f} {cpu * 1e3:8.0f} {paints:8d} {updates:15d}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""Python heap per widget instance for large populations, measured with tracemalloc.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.widget_memory
+    python -m benchmarks.widget_memory --save mem.json     # store a baseline
+    python -m benchmarks.widget_memory --compare mem.json  # before/after table
+
+COUNT instances of SevenSegmentDisplay, _Bar and AnimatedToggle are created
+and kept alive; the table shows the traced Python allocations per instance
+(C++ objects are not traced, their share shows up in the RSS column) and the
+time to restyle the whole population with a new theme, where supported.
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from qt_compat.QtWidgets import QApplication  # noqa: E402
+
+COUNT = 10_000
+
+
+def _rss_bytes():
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+def _factories():
+    from animated_toggle import AnimatedToggle
+    from cw3 import SevenSegmentDisplay
+    from palette import gradient_brushes
+    from power_bar import _Bar
+
+    brushes = gradient_brushes(('red', 'lime'), 10)
+    return {
+        "SevenSegmentDisplay": SevenSegmentDisplay,
+        "_Bar": lambda: _Bar(brushes),
+        "AnimatedToggle": AnimatedToggle,
+    }
+
+
+def _restyle(name, widgets):
+    """Theme everything at once; None when this tree has no theme support."""
+    try:
+        import theme
+    except ImportError:
+        return None
+    start = time.perf_counter()
+    if name == "SevenSegmentDisplay":
+        from cw3 import SevenSegmentDisplay
+        SevenSegmentDisplay.set_default_theme(
+            SevenSegmentDisplay.default_theme.replace(active="#ffaa00"))
+    elif name == "_Bar":
+        from power_bar import _Bar
+        theme.restyle(_Bar, widgets[0].theme().replace(background="#202020"))
+    else:
+        from animated_toggle import AnimatedToggle
+        AnimatedToggle.set_default_theme(AnimatedToggle.default_theme.replace(checked_color="#ff0066"))
+    return (time.perf_counter() - start) * 1000
+
+
+def measure(name, factory, count):
+    factory()  # class-level caches and first-use imports are not per-instance cost
+    gc.collect()
+    rss0 = _rss_bytes()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    widgets = [factory() for _ in range(count)]
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss = _rss_bytes() - rss0
+    restyle_ms = _restyle(name, widgets)
+    for w in widgets:
+        w.deleteLater()
+    del widgets
+    QApplication.processEvents()
+    gc.collect()
+    return {
+        "name": name,
+        "count": count,
+        "py_bytes_per_instance": (after - before) / count,
+        "rss_bytes_per_instance": rss / count,
+        "restyle_ms": restyle_ms,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=COUNT)
+    parser.add_argument("--save", metavar="FILE")
+    parser.add_argument("--compare", metavar="FILE")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)  # noqa: F841
+    results = [measure(name, factory, args.count) for name, factory in _factories().items()]
+
+    base = {}
+    if args.compare:
+        with open(args.compare) as fh:
+            base = {r["name"]: r for r in json.load(fh)}
+    print(f"{'widget':22s} {'py B/inst':>10s} {'before':>10s} {'RSS B/inst':>11s} {'restyle ms':>11s}")
+    for r in results:
+        old = base.get(r["name"])
+        before = f"{old['py_bytes_per_instance']:10.0f}" if old else f"{'-':>10s}"
+        restyle = f"{r['restyle_ms']:11.1f}" if r["restyle_ms"] is not None else f"{'-':>11s}"
+        print(f"{r['name']:22s} {r['py_bytes_per_instance']:10.0f} {before} "
+              f"{r['rss_bytes_per_instance']:11.0f} {restyle}")
+    if args.save:
+        with open(args.save, "w") as fh:
+            json.dump(results, fh, indent=1)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""Rdzeń odliczania niezależny od Qt.
+
+Czas pozostały liczony jest z terminu (deadline) na zegarze monotonicznym,
+więc opóźnione lub zgubione wywołania nie kumulują błędu. Zegar można
+podmienić (ManualClock) - wtedy odliczanie jest w pełni deterministyczne.
+"""
+import math
+import time
+
+
+class ManualClock:
+    """Zegar sterowany ręcznie - do testów i renderowania offline."""
+
+    def __init__(self, start: float = 0.0) -> None:
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> float:
+        self.now += seconds
+        return self.now
+
+
+def parse_duration(text: str) -> int:
+    """Liczba sekund z 'H:MM:SS', 'MM:SS' lub samej liczby sekund.
+
+    Nieprawidłowy zapis zgłasza ValueError.
+    """
+    parts = text.strip().split(":")
+    if len(parts) > 3 or not all(p.strip().isdigit() for p in parts):
+        raise ValueError(f"nieprawidłowy czas: {text!r}")
+    total = 0
+    for part in parts:
+        total = total * 60 + int(part)
+    return total
+
+
+def format_duration(seconds: int) -> str:
+    """'MM:SS', a od godziny 'H:MM:SS'."""
+    seconds = max(0, int(seconds))
+    h, rest = divmod(seconds, 3600)
+    m, s = divmod(rest, 60)
+    if h:
+        return f"{h}:{m:02d}:{s:02d}"
+    return f"{m:02d}:{s:02d}"
+
+
+class Countdown:
+    """Odliczanie total_seconds sekund z możliwością pauzy."""
+
+    def __init__(self, total_seconds: float, clock=time.monotonic) -> None:
+        self.total_seconds = total_seconds
+        self.clock = clock
+        self._deadline = None
+        self._left = float(total_seconds)  # pozostały czas, gdy odliczanie stoi
+
+    @property
+    def running(self) -> bool:
+        return self._deadline is not None
+
+    def start(self, now: float = None) -> None:
+        if self.running:
+            return
+        now = self.clock() if now is None else now
+        self._deadline = now + self._left
+
+    def stop(self, now: float = None) -> None:
+        if not self.running:
+            return
+        self._left = self.remaining(now)
+        self._deadline = None
+
+    def remaining(self, now: float = None) -> float:
+        if not self.running:
+            return self._left
+        now = self.clock() if now is None else now
+        return max(0.0, self._deadline - now)
+
+    def remaining_seconds(self, now: float = None) -> int:
+        """Pełne sekundy do wyświetlenia (zaokrąglone w górę, jak w minutniku)."""
+        return math.ceil(self.remaining(now))
+
+    def elapsed(self, now: float = None) -> float:
+        return self.total_seconds - self.remaining(now)
+
+    def progress(self, now: float = None) -> float:
+        """Postęp od 0 (start) do 1 (koniec)."""
+        if self.total_seconds <= 0:
+            return 1.0
+        return max(0.0, min(1.0, self.elapsed(now) / self.total_seconds))
+
+    def finished(self, now: float = None) -> bool:
+        return self.remaining(now) <= 0.0
+
+
+class _Subscription:
+    __slots__ = ("countdown", "on_second", "on_frame", "last_seconds", "missed")
+
+    def __init__(self, countdown, on_second, on_frame) -> None:
+        self.countdown = countdown
+        self.on_second = on_second
+        self.on_frame = on_frame
+        self.last_seconds = None
+        self.missed = 0
+
+
+class CountdownDriver:
+    """Jeden wspólny napęd dla wielu odliczań.
+
+    advance() wywoływane z dowolną częstotliwością (np. co klatkę) woła:
+      on_second(remaining_seconds) - gdy zmieni się liczba pełnych sekund;
+          jeśli kilka sekund przepadło, wywołanie jest jedno, z aktualną wartością,
+          a przeskoczone sekundy trafiają do licznika missed_ticks,
+      on_frame(now) - przy każdym advance(), np. do animacji.
+    Zakończone odliczania są usuwane po ostatnim on_second(0).
+
+    advance() zwraca, za ile sekund jest znowu potrzebne: 0 - w następnej
+    zwykłej klatce, math.inf - dopóki nikt nie doda ani nie wznowi odliczania.
+    on_frame może zwrócić własny odstęp (np. wolniejszy puls albo termin
+    końca, gdy okno jest ukryte) - wtedy odpowiada też za sekundy swojego
+    odliczania; None znaczy "co klatkę". Bez on_frame liczy się najbliższa
+    zmiana pełnej sekundy.
+    """
+
+    def __init__(self, clock=time.monotonic) -> None:
+        self.clock = clock
+        self._subs = {}
+        self.missed_ticks = 0
+
+    def __len__(self) -> int:
+        return len(self._subs)
+
+    def __contains__(self, countdown) -> bool:
+        return id(countdown) in self._subs
+
+    def add(self, countdown: Countdown, on_second=None, on_frame=None) -> None:
+        self._subs[id(countdown)] = _Subscription(countdown, on_second, on_frame)
+
+    def remove(self, countdown: Countdown) -> None:
+        self._subs.pop(id(countdown), None)
+
+    def advance(self, now: float = None) -> float:
+        now = self.clock() if now is None else now
+        wake = math.inf
+        for key, sub in list(self._subs.items()):
+            cd = sub.countdown
+            seconds = cd.remaining_seconds(now)
+            if seconds != sub.last_seconds:
+                if sub.last_seconds is not None and sub.last_seconds - seconds > 1:
+                    skipped = sub.last_seconds - seconds - 1
+                    sub.missed += skipped
+                    self.missed_ticks += skipped
+                sub.last_seconds = seconds
+                if sub.on_second is not None:
+                    sub.on_second(seconds)
+            wanted = None
+            if sub.on_frame is not None and cd.running:
+                wanted = sub.on_frame(now)
+                if wanted is None:
+                    wanted = 0.0
+            if seconds <= 0:
+                self._subs.pop(key, None)
+                continue
+            if wanted is None:
+                wanted = _to_next_second(cd, now)
+            wake = min(wake, wanted)
+        return wake
+
+
+def _to_next_second(countdown: Countdown, now: float) -> float:
+    if not countdown.running:
+        return math.inf
+    left = countdown.remaining(now)
+    frac = left - math.floor(left)
+    return frac if frac > 0 else 1.0
@@ -0,0 +1,87 @@
+"""Animation curves sampled once into lookup tables.
+
+A ``CurveTable`` samples a function of one variable on [0, 1] at
+``resolution`` equal steps and afterwards answers by linear interpolation
+between the two nearest samples, so the error is bounded by
+``max|f''| / (8 * resolution**2)``. Tables are meant for curves evaluated
+every frame for many instances at once: ``evaluate(xs)`` handles a whole
+batch in one vectorized NumPy pass when NumPy is installed and the batch
+is large enough, and falls back to a pure Python loop otherwise.
+
+Inputs outside [0, 1] are clamped, or wrapped for ``periodic`` tables
+(one period of a wave). ``easing_table(QEasingCurve.Type.X)`` returns a
+shared table for a Qt easing curve.
+"""
+import math
+from functools import lru_cache
+
+from numpy_support import numpy_or_none
+from qt_compat.QtCore import QEasingCurve
+
+DEFAULT_RESOLUTION = 1024
+
+# Smaller batches are interpolated in pure Python: converting a short list to
+# an array costs more than the loop it replaces.
+NUMPY_MIN_BATCH = 64
+
+
+def batch_numpy(size):
+    """numpy for a batch of ``size`` values, ``None`` when plain Python is the better choice."""
+    return numpy_or_none() if size >= NUMPY_MIN_BATCH else None
+
+
+class CurveTable:
+    """``func`` on [0, 1] sampled at ``resolution + 1`` points."""
+
+    def __init__(self, func, resolution=DEFAULT_RESOLUTION, periodic=False):
+        if resolution < 1:
+            raise ValueError("resolution must be at least 1")
+        self.func = func
+        self.resolution = int(resolution)
+        self.periodic = periodic
+        self.values = [float(func(i / self.resolution)) for i in range(self.resolution + 1)]
+        self._array = None
+
+    def __call__(self, x):
+        """Interpolated value at ``x``."""
+        if self.periodic:
+            x -= math.floor(x)
+        elif x <= 0.0:
+            return self.values[0]
+        elif x >= 1.0:
+            return self.values[-1]
+        x *= self.resolution
+        i = int(x)
+        if i >= self.resolution:  # x rounded up to exactly 1.0
+            return self.values[-1]
+        a = self.values[i]
+        return a + (self.values[i + 1] - a) * (x - i)
+
+    def evaluate(self, xs):
+        """Values for a batch of inputs: an ndarray with NumPy, else a list."""
+        np = batch_numpy(len(xs))
+        if np is None:
+            return [self(x) for x in xs]
+        if self._array is None:
+            self._array = np.array(self.values)
+        x = np.asarray(xs, dtype=float)
+        if self.periodic:
+            x = x - np.floor(x)
+        else:
+            x = np.clip(x, 0.0, 1.0)
+        x = x * self.resolution
+        i = np.minimum(x.astype(np.intp), self.resolution - 1)
+        a = self._array[i]
+        return a + (self._array[i + 1] - a) * (x - i)
+
+    def max_error(self, func=None, samples=100_000):
+        """Largest deviation from ``func`` (the sampled function by default) on a dense grid."""
+        func = func or self.func
+        return max(abs(self((k + 0.5) / samples) - func((k + 0.5) / samples))
+                   for k in range(samples))
+
+
+@lru_cache(maxsize=None)
+def easing_table(curve_type, resolution=DEFAULT_RESOLUTION):
+    """Shared CurveTable of a Qt easing curve, e.g. ``QEasingCurve.Type.InOutCubic``."""
+    return CurveTable(QEasingCurve(curve_type).valueForProgress, resolution)
@@ -1,6 +1,9 @@
 import sys
 import math
-from PyQt6.QtWidgets import (
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from qt_compat.QtWidgets import (
     QApplication,
     QWidget,
     QVBoxLayout,
@@ -9,11 +12,189 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QLabel,
 )
-from PyQt6.QtCore import QTimer, Qt
-from PyQt6.QtGui import QPainter, QPen, QBrush, QColor
+from qt_compat.QtCore import QEvent, QObject, QPointF, QRectF, QTimer, Qt, pyqtSignal
+from qt_compat.QtGui import QPainter, QPainterPath, QPolygonF, QColor, QPixmap
 
+from countdown import Countdown, CountdownDriver, _to_next_second, format_duration, parse_duration
+from curves import CurveTable, batch_numpy
+from theme import SegmentTheme, Themed
 
-class SevenSegmentDisplay(QWidget):
+
+class SegmentGeometry:
+    """Kształty segmentów a..g dla jednego rozmiaru i stylu, liczone raz.
+
+    style="rect" - prostokątne segmenty (jak dotąd), "hex" - segmenty
+    ścięte na końcach (sześciokąty). Dla każdego znaku trzymane są dwie
+    ścieżki: segmenty zapalone i zgaszone, więc narysowanie cyfry to
+    dwa wywołania fillPath.
+    """
+
+    STYLES = ("rect", "hex")
+
+    def __init__(self, width: int, height: int, style: str = "rect") -> None:
+        if style not in self.STYLES:
+            raise ValueError(f"Nieznany styl segmentów: {style}")
+        self.width = width
+        self.height = height
+        self.style = style
+        self._paths = {}
+
+        w = width - 10
+        h = height - 10
+        x0, y0 = 5, 5
+        thick = max(4, min(w, h) // 12)
+        horizontal = (
+            (x0 + thick, y0),                  # a (top)
+            (x0 + thick, y0 + h - thick),      # d (bottom)
+            (x0 + thick, y0 + h // 2),         # g (middle)
+        )
+        vertical = (
+            (x0 + w - thick, y0 + thick),           # b (top-right)
+            (x0 + w - thick, y0 + h // 2 + thick),  # c (bottom-right)
+            (x0, y0 + h // 2 + thick),              # e (bottom-left)
+            (x0, y0 + thick),                       # f (top-left)
+        )
+        hw, vh = w - 2 * thick, h // 2 - thick
+        a, d, g = (self._segment(x, y, hw, thick, True) for x, y in horizontal)
+        b, c, e, f = (self._segment(x, y, thick, vh, False) for x, y in vertical)
+        self.segments = (a, b, c, d, e, f, g)
+
+    def _segment(self, x, y, ww, hh, horizontal) -> QPolygonF:
+        if self.style == "rect":
+            # Jak drawRect z piórem grubości 1: obrys wychodzi pół piksela poza prostokąt
+            return QPolygonF(QRectF(x - 0.5, y - 0.5, ww + 1, hh + 1))
+        t = (hh if horizontal else ww) / 2
+        if horizontal:
+            points = ((x, y + t), (x + t, y), (x + ww - t, y), (x + ww, y + t),
+                      (x + ww - t, y + hh), (x + t, y + hh))
+        else:
+            points = ((x + t, y), (x + ww, y + t), (x + ww, y + hh - t), (x + t, y + hh),
+                      (x, y + hh - t), (x, y + t))
+        return QPolygonF([QPointF(px, py) for px, py in points])
+
+    def paths(self, char):
+        """(zapalone, zgaszone) QPainterPath dla znaku z SevenSegmentDisplay.SEGMENTS."""
+        paths = self._paths.get(char)
+        if paths is None:
+            on, off = QPainterPath(), QPainterPath()
+            # Segmenty "rect" nachodzą na siebie o pół piksela; przy OddEvenFill
+            # część wspólna zostałaby niezamalowana.
+            on.setFillRule(Qt.FillRule.WindingFill)
+            off.setFillRule(Qt.FillRule.WindingFill)
+            for lit, polygon in zip(SevenSegmentDisplay.SEGMENTS.get(char, (0,) * 7), self.segments):
+                (on if lit else off).addPolygon(polygon)
+            paths = self._paths[char] = (on, off)
+        return paths
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def for_size(width: int, height: int, style: str = "rect") -> "SegmentGeometry":
+        return SegmentGeometry(width, height, style)
+
+
+class SegmentGlyphCache:
+    """Cache LRU cyfr 7-segmentowych wyrenderowanych raz do QPixmap.
+
+    Kluczem jest (cyfra, rozmiar, kolor aktywny, kolor nieaktywny, DPR, styl).
+    Liczniki hits/misses pozwalają sprawdzić, czy w stanie ustalonym
+    nic nie jest już rasteryzowane.
+    """
+
+    def __init__(self, capacity: int = 256) -> None:
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._pixmaps: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._pixmaps)
+
+    def get(self, digit: int, width: int, height: int,
+            active: QColor, inactive: QColor, dpr: float, style: str = "rect") -> QPixmap:
+        key = (digit, width, height, active.rgba(), inactive.rgba(), dpr, style)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            self.hits += 1
+            return pixmap
+        self.misses += 1
+        pixmap = self._render(digit, width, height, active, inactive, dpr, style)
+        self._pixmaps[key] = pixmap
+        if len(self._pixmaps) > self.capacity:
+            self._pixmaps.popitem(last=False)
+        return pixmap
+
+    def clear(self) -> None:
+        self._pixmaps.clear()
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _render(digit, width, height, active, inactive, dpr, style) -> QPixmap:
+        pixmap = QPixmap(max(1, round(width * dpr)), max(1, round(height * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        p = QPainter(pixmap)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        SevenSegmentDisplay.draw_segments(p, width, height, digit, active, inactive, style)
+        p.end()
+        return pixmap
+
+
+class _DigitState:
+    """Zmienny stan cyfry; kolory są we wspólnym SegmentTheme."""
+
+    __slots__ = ("value", "opacity", "style", "skipped")
+
+    def __init__(self, value) -> None:
+        self.value = value
+        self.opacity = 1.0
+        self.style = "rect"
+        self.skipped = 0  # ile odmalowań pominięto, bo stan się nie zmienił
+
+
+class _SegmentWidget(Themed):
+    """Wspólne metody SevenSegmentDisplay i SegmentDisplay.
+
+    Kolory trzyma wspólny, internowany SegmentTheme, a zmienny stan -
+    obiekt _DigitState ze __slots__, więc tysiące cyfr o tym samym wyglądzie
+    nie kopiują QColorów. set_default_theme zmienia wygląd wszystkich naraz.
+    """
+
+    default_theme = SegmentTheme()
+
+    @property
+    def skipped_updates(self) -> int:
+        return self._state.skipped
+
+    def set_color(self, color: QColor) -> None:
+        if not self.set_theme(self._theme.replace(active=color)):
+            self._state.skipped += 1
+
+    def set_opacity(self, opacity: float) -> None:
+        """Krycie aktywnych segmentów (0..1) - jasność bez zmiany koloru."""
+        state = self._state
+        if opacity == state.opacity:
+            state.skipped += 1
+            return
+        state.opacity = opacity
+        self.update()
+
+    def set_segment_style(self, style: str) -> None:
+        """Kształt segmentów: "rect" lub "hex" (ścięte końce)."""
+        if style not in SegmentGeometry.STYLES:
+            raise ValueError(f"Nieznany styl segmentów: {style}")
+        state = self._state
+        if style == state.style:
+            state.skipped += 1
+            return
+        state.style = style
+        self.update()
+
+
+class SevenSegmentDisplay(_SegmentWidget, QWidget):
     """Minimalny wyświetlacz 7-segmentowy dla jednej cyfry (0-9)."""
 
     SEGMENTS = {
@@ -27,108 +208,247 @@ class SevenSegmentDisplay(QWidget):
         7: (1, 1, 1, 0, 0, 0, 0),
         8: (1, 1, 1, 1, 1, 1, 1),
         9: (1, 1, 1, 1, 0, 1, 1),
+        "-": (0, 0, 0, 0, 0, 0, 1),
+        " ": (0, 0, 0, 0, 0, 0, 0),
     }
 
-    def __init__(self, parent=None) -> None:
+    # Wspólny dla wszystkich instancji - cyfry o tym samym wyglądzie renderujemy raz
+    glyph_cache = SegmentGlyphCache()
+    _TRANSPARENT = QColor(0, 0, 0, 0)
+
+    def __init__(self, parent=None, theme: SegmentTheme = None) -> None:
         super().__init__(parent)
-        self._digit = 0
-        self._active = QColor(0, 255, 0)
-        self._inactive = QColor(40, 40, 40)
-        self._background = QColor(20, 20, 20)
+        self._theme = theme or self.default_theme
+        self._state = _DigitState(0)
         self.setMinimumSize(48, 80)
 
     def set_digit(self, d: int) -> None:
-        self._digit = max(0, min(9, int(d)))
-        self.update()
-
-    def set_color(self, color: QColor) -> None:
-        self._active = color
+        d = max(0, min(9, int(d)))
+        state = self._state
+        if d == state.value:
+            state.skipped += 1
+            return
+        state.value = d
         self.update()
 
     def paintEvent(self, _):
         p = QPainter(self)
-        p.setRenderHint(QPainter.RenderHint.Antialiasing)
-        p.fillRect(self.rect(), self._background)
+        theme, state = self._theme, self._state
+        p.fillRect(self.rect(), theme.background)
+        w, h, dpr = self.width(), self.height(), self.devicePixelRatioF()
+        if state.opacity >= 1.0:
+            p.drawPixmap(0, 0, self.glyph_cache.get(
+                state.value, w, h, theme.active, theme.inactive, dpr, state.style
+            ))
+            return
+        # "8" w kolorze nieaktywnym to płytka ze wszystkimi segmentami zgaszonymi,
+        # na nią przyciemnione aktywne segmenty
+        p.drawPixmap(0, 0, self.glyph_cache.get(8, w, h, theme.inactive, theme.inactive, dpr, state.style))
+        p.setOpacity(state.opacity)
+        p.drawPixmap(0, 0, self.glyph_cache.get(
+            state.value, w, h, theme.active, self._TRANSPARENT, dpr, state.style
+        ))
 
-        w = self.width() - 10
-        h = self.height() - 10
-        x0, y0 = 5, 5
-        thick = max(4, min(w, h) // 12)
+    @staticmethod
+    def draw_segments(p: QPainter, width: int, height: int, char, active: QColor, inactive: QColor,
+                      style: str = "rect") -> None:
+        """Rysuje znak w prostokącie width x height: dwa wypełnienia gotowych ścieżek."""
+        on, off = SegmentGeometry.for_size(width, height, style).paths(char)
+        p.fillPath(off, inactive)
+        p.fillPath(on, active)
 
-        # Aktywne segmenty: a,b,c,d,e,f,g
-        s = SevenSegmentDisplay.SEGMENTS.get(self._digit, (0,) * 7)
-
-        def rect(x, y, ww, hh, on):
-            color = self._active if on else self._inactive
-            p.setBrush(QBrush(color))
-            p.setPen(QPen(color, 1))
-            p.drawRect(x, y, ww, hh)
-
-        # a (top)
-        rect(x0 + thick, y0, w - 2 * thick, thick, s[0])
-        # b (top-right)
-        rect(x0 + w - thick, y0 + thick, thick, h // 2 - thick, s[1])
-        # c (bottom-right)
-        rect(x0 + w - thick, y0 + h // 2 + thick, thick, h // 2 - thick, s[2])
-        # d (bottom)
-        rect(x0 + thick, y0 + h - thick, w - 2 * thick, thick, s[3])
-        # e (bottom-left)
-        rect(x0, y0 + h // 2 + thick, thick, h // 2 - thick, s[4])
-        # f (top-left)
-        rect(x0, y0 + thick, thick, h // 2 - thick, s[5])
-        # g (middle)
-        rect(x0 + thick, y0 + h // 2, w - 2 * thick, thick, s[6])
+
+class SegmentDisplay(_SegmentWidget, QWidget):
+    """Dowolny ciąg cyfr 7-segmentowych i separatorów w jednym widżecie.
+
+    Obsługuje znaki 0-9, '-', ' ' oraz wąskie separatory ':' i '.', np.
+    "12:34", "1:05:00", "-3.14". Całość rysowana jest w jednym paintEvent
+    z tych samych glifów co SevenSegmentDisplay.
+    """
+
+    SEPARATORS = ":."
+    SEPARATOR_WIDTH = 0.4  # szerokość separatora względem cyfry
+    SPACING = 6
+
+    def __init__(self, text: str = "00:00", parent=None, theme: SegmentTheme = None) -> None:
+        super().__init__(parent)
+        self._theme = theme or self.default_theme
+        self._state = _DigitState(text)
+        self._cells = None
+        self._cells_key = None
+        self.setMinimumSize(self._min_width(text), 80)
+
+    def text(self) -> str:
+        return self._state.value
+
+    def set_text(self, text: str) -> None:
+        state = self._state
+        if text == state.value:
+            state.skipped += 1
+            return
+        if len(text) != len(state.value):
+            self.setMinimumSize(self._min_width(text), 80)
+        state.value = text
+        self.update()
+
+    def _min_width(self, text: str) -> int:
+        units = sum(self.SEPARATOR_WIDTH if c in self.SEPARATORS else 1.0 for c in text)
+        return int(48 * units) + self.SPACING * max(0, len(text) - 1)
+
+    def _layout(self):
+        """Pozycje x komórek i rozmiar cyfry; liczone tylko po zmianie rozmiaru lub układu tekstu."""
+        shape = tuple(c in self.SEPARATORS for c in self._state.value)
+        key = (self.width(), self.height(), shape)
+        if key != self._cells_key:
+            gaps = self.SPACING * max(0, len(shape) - 1)
+            units = sum(self.SEPARATOR_WIDTH if sep else 1.0 for sep in shape) or 1.0
+            cell_w = max(1, int((self.width() - gaps) / units))
+            sep_w = int(cell_w * self.SEPARATOR_WIDTH)
+            used = sum(sep_w if sep else cell_w for sep in shape) + gaps
+            x = (self.width() - used) // 2
+            xs = []
+            for sep in shape:
+                xs.append(x)
+                x += (sep_w if sep else cell_w) + self.SPACING
+            self._cells = (xs, cell_w, sep_w)
+            self._cells_key = key
+        return self._cells
+
+    def paintEvent(self, _):
+        p = QPainter(self)
+        theme, state = self._theme, self._state
+        p.fillRect(self.rect(), theme.background)
+        xs, cell_w, sep_w = self._layout()
+        h, dpr = self.height(), self.devicePixelRatioF()
+        cache = SevenSegmentDisplay.glyph_cache
+        thick = max(4, min(cell_w - 10, h - 10) // 12)
+
+        digits = []
+        for x, c in zip(xs, state.value):
+            if c == ":":
+                for y in (h // 3, 2 * h // 3):
+                    p.fillRect(x + (sep_w - thick) // 2, y - thick // 2, thick, thick, theme.active)
+            elif c == ".":
+                p.fillRect(x + (sep_w - thick) // 2, h - 5 - thick, thick, thick, theme.active)
+            else:
+                digits.append((x, int(c) if c.isdigit() else c))
+
+        if state.opacity >= 1.0:
+            for x, d in digits:
+                p.drawPixmap(x, 0, cache.get(d, cell_w, h, theme.active, theme.inactive, dpr, state.style))
+            return
+        plate = cache.get(8, cell_w, h, theme.inactive, theme.inactive, dpr, state.style)
+        for x, _d in digits:
+            p.drawPixmap(x, 0, plate)
+        p.setOpacity(state.opacity)
+        for x, d in digits:
+            p.drawPixmap(x, 0, cache.get(
+                d, cell_w, h, theme.active, SevenSegmentDisplay._TRANSPARENT, dpr, state.style
+            ))
 
 
 class TimerDisplay(QWidget):
-    """Wyświetlacz MM:SS z 4 cyfr 7-segmentowych + dwukropek."""
+    """Wyświetlacz MM:SS z 4 cyfr 7-segmentowych + dwukropek.
+
+    opacity_pulse=True: apply_intensity zmienia tylko krycie aktywnych segmentów,
+    False: przelicza kolor i przekazuje go do każdej cyfry (stara ścieżka).
+    single_widget=True: zamiast 4 cyfr i etykiety jeden SegmentDisplay
+    (jeden widżet i jeden paintEvent na wyświetlacz).
+    """
 
-    def __init__(self, parent=None) -> None:
+    def __init__(self, parent=None, opacity_pulse: bool = True, single_widget: bool = False) -> None:
         super().__init__(parent)
-        self.d1 = SevenSegmentDisplay()
-        self.d2 = SevenSegmentDisplay()
-        self.d3 = SevenSegmentDisplay()
-        self.d4 = SevenSegmentDisplay()
+        self.opacity_pulse = opacity_pulse
 
         layout = QHBoxLayout(self)
         layout.setSpacing(6)
-        layout.addWidget(self.d1)
-        layout.addWidget(self.d2)
 
-        self.colon = QLabel(":")
-        self.colon.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(self.colon)
+        if single_widget:
+            self.segments = SegmentDisplay("00:00")
+            self.colon = None
+            self._digits = (self.segments,)
+            layout.addWidget(self.segments)
+        else:
+            self.segments = None
+            self.d1 = SevenSegmentDisplay()
+            self.d2 = SevenSegmentDisplay()
+            self.d3 = SevenSegmentDisplay()
+            self.d4 = SevenSegmentDisplay()
+            self._digits = (self.d1, self.d2, self.d3, self.d4)
+
+            layout.addWidget(self.d1)
+            layout.addWidget(self.d2)
+
+            self.colon = QLabel(":")
+            self.colon.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            layout.addWidget(self.colon)
 
-        layout.addWidget(self.d3)
-        layout.addWidget(self.d4)
+            layout.addWidget(self.d3)
+            layout.addWidget(self.d4)
 
         self._base_color = QColor(0, 255, 0)
+        self._colon_rgb = None
+        self._skipped_colon = 0
         self._apply_color(self._base_color)
         self._update_colon_color()
 
+    @property
+    def skipped_updates(self) -> int:
+        """Pominięte odmalowania cyfr i przebudowy stylu dwukropka."""
+        return self._skipped_colon + sum(d.skipped_updates for d in self._digits)
+
     def set_time(self, minutes: int, seconds: int) -> None:
+        if self.segments is not None:
+            self.segments.set_text(f"{minutes % 100:02d}:{seconds % 100:02d}")
+            return
         self.d1.set_digit((minutes // 10) % 10)
         self.d2.set_digit(minutes % 10)
         self.d3.set_digit((seconds // 10) % 10)
         self.d4.set_digit(seconds % 10)
 
+    def set_remaining(self, seconds: int) -> None:
+        """Pozostały czas w sekundach; od godziny wzwyż jako H:MM:SS (jeden
+        widżet) albo HH:MM (cztery cyfry)."""
+        seconds = max(0, seconds)
+        if self.segments is not None:
+            self.segments.set_text(format_duration(seconds))
+        elif seconds >= 3600:
+            self.set_time(seconds // 3600, seconds // 60 % 60)
+        else:
+            self.set_time(seconds // 60, seconds % 60)
+
     def set_base_color(self, color: QColor) -> None:
-        self._base_color = color
+        self._base_color = QColor(color)
         self._apply_color(self._base_color)
         self._update_colon_color()
 
+    def set_segment_style(self, style: str) -> None:
+        for d in self._digits:
+            d.set_segment_style(style)
+
     def apply_intensity(self, intensity: float) -> None:
         """intensity in [0.2..1.0] — skaluje jasność aktywnych segmentów."""
         intensity = max(0.2, min(1.0, intensity))
+        if self.opacity_pulse:
+            for d in self._digits:
+                d.set_opacity(intensity)
+            return
         c = self._scale_color(self._base_color, intensity)
         self._apply_color(c)
 
     def _apply_color(self, color: QColor) -> None:
-        for d in (self.d1, self.d2, self.d3, self.d4):
+        for d in self._digits:
             d.set_color(color)
 
     def _update_colon_color(self) -> None:
+        if self.colon is None:
+            return
         c = self._base_color
+        # setStyleSheet zawsze parsuje styl od nowa i odmalowuje etykietę
+        if c.rgb() == self._colon_rgb:
+            self._skipped_colon += 1
+            return
+        self._colon_rgb = c.rgb()
         self.colon.setStyleSheet(
             f"color: rgb({c.red()}, {c.green()}, {c.blue()}); font-size: 42px; font-weight: bold;"
         )
@@ -138,28 +458,235 @@ class TimerDisplay(QWidget):
         return QColor(int(c.red() * k), int(c.green() * k), int(c.blue() * k))
 
 
+def pulse_wave(u: float) -> float:
+    """Jeden okres fali pulsu (0..1) dla u w [0, 1)."""
+    return math.sin(2.0 * math.pi * u) * 0.5 + 0.5
+
+
+def pulse_intensity_exact(progress: float, t: float) -> float:
+    """Jasność pulsu (0.2..1.0) dla postępu 0..1 i czasu t [s] od startu odliczania."""
+    # Częstotliwość rośnie wraz z postępem (0.5 Hz -> 4.0 Hz)
+    freq = 0.5 + 3.5 * progress
+
+    # Sygnał 0..1
+    phase = pulse_wave(freq * t)
+
+    # Amplituda rośnie (delikatnie na początku, mocno pod koniec)
+    amp = 0.25 + 0.65 * progress  # 0.25..0.9
+    # Skala jasności (0.2..1.0), oscyluje wokół ~0.7..1.0 bliżej końca
+    intensity = 0.4 + amp * phase
+    return max(0.2, min(1.0, intensity))
+
+
+# Fala z tablicy zamiast math.sin w każdej klatce; błąd < 3e-6 przy 1024 próbkach
+PULSE_RESOLUTION = 1024
+PULSE_WAVE = CurveTable(pulse_wave, PULSE_RESOLUTION, periodic=True)
+
+
+def pulse_intensity(progress: float, t: float) -> float:
+    """pulse_intensity_exact liczone z tablicy PULSE_WAVE."""
+    freq = 0.5 + 3.5 * progress
+    intensity = 0.4 + (0.25 + 0.65 * progress) * PULSE_WAVE(freq * t)
+    return 0.2 if intensity < 0.2 else 1.0 if intensity > 1.0 else intensity
+
+
+def pulse_intensities(progress, t):
+    """pulse_intensity dla całych list postępów i czasów naraz (NumPy, gdy jest).
+
+    Zwraca listę albo ndarray tej samej długości.
+    """
+    np = batch_numpy(len(progress))
+    if np is None:
+        return [pulse_intensity(p, x) for p, x in zip(progress, t)]
+    progress = np.asarray(progress, dtype=float)
+    wave = PULSE_WAVE.evaluate((0.5 + 3.5 * progress) * np.asarray(t, dtype=float))
+    return np.clip(0.4 + (0.25 + 0.65 * progress) * wave, 0.2, 1.0)
+
+
+# Najmniejsza zauważalna zmiana jasności między klatkami pulsu (~2%)
+PULSE_THRESHOLD = 0.02
+
+
+def pulse_interval(progress: float, t: float, total: float, threshold: float = PULSE_THRESHOLD,
+                   min_interval: float = 0.04, max_interval: float = 0.5) -> float:
+    """Najdłuższy odstęp [s] do następnej klatki pulsu, po którym pulse_intensity
+    zmieni się najwyżej o threshold.
+
+    Oszacowanie |dI| <= |I'(t)|*dt + max|I''|*dt^2/2, gdzie faza to
+    2*pi*freq(t)*t, a freq i amplituda rosną z postępem (total - długość
+    odliczania w sekundach). Wynik jest w [min_interval, max_interval]:
+    domyślne 40 ms to dawny stały krok, więc puls nie przyspiesza ponad to.
+    """
+    dprog = 1.0 / total if total > 0 else 0.0
+    freq = 0.5 + 3.5 * progress
+    amp = 0.25 + 0.65 * progress
+    omega = 2.0 * math.pi * (freq + 3.5 * dprog * t)
+    slope = amp * 0.5 * omega * abs(math.cos(2.0 * math.pi * freq * t)) + 0.65 * dprog
+    # Krzywizna szacowana dla najszybszego miejsca w oknie max_interval
+    late = min(1.0, progress + max_interval * dprog)
+    amp_l = 0.25 + 0.65 * late
+    omega_l = 2.0 * math.pi * (0.5 + 3.5 * late + 3.5 * dprog * (t + max_interval))
+    curve = 0.5 * amp_l * (omega_l ** 2 + 4.0 * math.pi * 3.5 * dprog) + 0.65 * dprog * omega_l
+    dt = 2.0 * threshold / (slope + math.sqrt(slope * slope + 2.0 * curve * threshold))
+    # W dół do pełnych ms - z taką rozdzielczością FrameClock nastawia QTimer
+    return max(min_interval, min(max_interval, math.floor(dt * 1000) / 1000))
+
+
+class FrameClock(QObject):
+    """Jeden QTimer (PreciseTimer) napędzający wszystkie odliczania przez CountdownDriver.
+
+    Timer działa tylko wtedy, gdy jest co najmniej jedno aktywne odliczanie.
+    Po każdej klatce emitowany jest frameAdvanced(now) - wszystkie zmiany
+    wykonane w tej samej iteracji pętli zdarzeń Qt łączy w jedno odmalowanie.
+
+    adaptive=True: następna klatka przychodzi wtedy, gdy driver jej potrzebuje
+    (wolniejszy puls, zmiana sekundy, koniec odliczania ukrytego okna), a nie
+    co interval_ms. Dopóki ktoś słucha frameAdvanced, odstęp nie przekracza
+    interval_ms. wake() wymusza klatkę od razu, np. po odsłonięciu okna.
+    """
+
+    frameAdvanced = pyqtSignal(float)
+
+    # Najdłuższy sen (QTimer przyjmuje najwyżej 2**31 - 1 ms); dłuższe
+    # oczekiwanie jest liczone od nowa po przebudzeniu
+    MAX_SLEEP_MS = 3_600_000
+
+    _shared = None
+
+    def __init__(self, interval_ms: int = 40, clock=time.monotonic, adaptive: bool = True,
+                 parent=None) -> None:
+        super().__init__(parent)
+        self.driver = CountdownDriver(clock)
+        self.interval_ms = interval_ms
+        self.adaptive = adaptive
+        self.wakeups = 0
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.tick)
+
+    @classmethod
+    def shared(cls) -> "FrameClock":
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    @property
+    def clock(self):
+        return self.driver.clock
+
+    def add(self, countdown: Countdown, on_second=None, on_frame=None) -> None:
+        self.driver.add(countdown, on_second, on_frame)
+        if not self._timer.isActive() or self._timer.remainingTime() > self.interval_ms:
+            self._timer.start(self.interval_ms)
+
+    def remove(self, countdown: Countdown) -> None:
+        self.driver.remove(countdown)
+        if not len(self.driver):
+            self._timer.stop()
+
+    def wake(self) -> None:
+        if len(self.driver):
+            self._timer.start(0)
+
+    def tick(self) -> None:
+        now = self.driver.clock()
+        self.wakeups += 1
+        wake = self.driver.advance(now)
+        self.frameAdvanced.emit(now)
+        if not len(self.driver):
+            self._timer.stop()
+            return
+        interval = self.interval_ms
+        if self.adaptive and wake > 0:
+            listened = self.receivers(self.frameAdvanced) > 0
+            if math.isinf(wake):
+                if not listened:
+                    return  # śpi do add() albo wake()
+            else:
+                interval = max(1, min(self.MAX_SLEEP_MS, math.ceil(wake * 1000 - 1e-6)))
+            if listened:
+                interval = min(interval, self.interval_ms)
+        self._timer.start(interval)
+
+
+class EngineDisplays(QObject):
+    """Napędza wiele TimerDisplay z jednego TimerEngine jednym timerem.
+
+    Co klatkę engine.advance(now) obsługuje wygasłe etapy (kopiec), a każdy
+    przypięty wyświetlacz dostaje pozostały czas etapu i puls. Etapy
+    nieparzyste (np. przerwy) świecą na żółto, ostatnie 10 s na czerwono.
+    """
+
+    STAGE_COLORS = (QColor(0, 255, 0), QColor(255, 200, 0))
+    WARNING_COLOR = QColor(255, 0, 0)
+
+    def __init__(self, engine, interval_ms: int = 40, parent=None) -> None:
+        super().__init__(parent)
+        self.engine = engine
+        self._displays = {}
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.tick)
+
+    def __len__(self) -> int:
+        return len(self._displays)
+
+    def bind(self, name, display: "TimerDisplay") -> None:
+        self._displays[name] = display
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def unbind(self, name) -> None:
+        self._displays.pop(name, None)
+        if not self._displays:
+            self._timer.stop()
+
+    def tick(self, now: float = None) -> None:
+        engine = self.engine
+        now = engine.clock() if now is None else now
+        engine.advance(now)
+        pulsing, progress, times = [], [], []
+        for name, display in self._displays.items():
+            if name not in engine:
+                display.set_remaining(0)
+                display.apply_intensity(1.0)
+                continue
+            left = engine.remaining(name, now)
+            seconds = math.ceil(left)
+            stage, _, _ = engine.stage(name)
+            display.set_remaining(seconds)
+            display.set_base_color(
+                self.WARNING_COLOR if seconds <= 10 else self.STAGE_COLORS[stage % 2])
+            if engine.running(name):
+                length = engine.stage_length(name)
+                pulsing.append(display)
+                progress.append(1.0 - left / length)
+                times.append(length - left)
+        # Puls wszystkich wyświetlaczy jednym przebiegiem po tablicy fali
+        for display, intensity in zip(pulsing, pulse_intensities(progress, times)):
+            display.apply_intensity(intensity)
+
+
 class MainWindow(QWidget):
     """Prosty minutnik z cyframi 7-segmentowymi, pulsującymi szybciej bliżej końca.
        Ostatnie 10 sekund w kolorze czerwonym."""
 
-    def __init__(self) -> None:
+    def __init__(self, frame_clock: FrameClock = None) -> None:
         super().__init__()
         self.setWindowTitle("Minutnik 7-segmentowy (prosty)")
 
         self.total_seconds = 0
         self.remaining_seconds = 0
         self.is_running = False
-        self._pulse_t = 0.0  # czas dla animacji pulsowania
-
-        # Tick co sekundę
-        self.timer = QTimer(self)
-        self.timer.setInterval(1000)
-        self.timer.timeout.connect(self._tick)
+        self.countdown = None
+        self._watched_window = None
 
-        # Puls co ~40 ms
-        self.pulse_timer = QTimer(self)
-        self.pulse_timer.setInterval(40)
-        self.pulse_timer.timeout.connect(self._pulse_tick)
+        # Sekundy i puls liczone z terminu na zegarze monotonicznym,
+        # wszystkie okna dzielą jeden timer
+        self.frame_clock = frame_clock or FrameClock.shared()
 
         self._build_ui()
 
@@ -169,7 +696,7 @@ class MainWindow(QWidget):
         # Input + przyciski
         input_layout = QHBoxLayout()
         self.time_input = QLineEdit()
-        self.time_input.setPlaceholderText("MM:SS lub sekundy")
+        self.time_input.setPlaceholderText("H:MM:SS, MM:SS lub sekundy")
         self.start_button = QPushButton("Start")
         self.stop_button = QPushButton("Stop")
         self.start_button.clicked.connect(self.start)
@@ -199,53 +726,82 @@ class MainWindow(QWidget):
         self.total_seconds = total
         self.remaining_seconds = total
         self.is_running = True
-        self._pulse_t = 0.0
-        self.timer.start()
-        self.pulse_timer.start()
+        self.countdown = Countdown(total, clock=self.frame_clock.clock)
+        self.countdown.start()
+        self.frame_clock.add(self.countdown, on_second=self._tick, on_frame=self._pulse_tick)
         self.status_label.setText("Odliczanie...")
         self._update_display()
         self._update_base_color()
 
     def stop(self) -> None:
         self.is_running = False
-        self.timer.stop()
-        self.pulse_timer.stop()
+        if self.countdown is not None:
+            self.frame_clock.remove(self.countdown)
         self.status_label.setText("Zatrzymano")
         # Przywróć bazową zieleń i jasność
         self.display.set_base_color(QColor(0, 255, 0))
         self.display.apply_intensity(1.0)
 
-    def _tick(self) -> None:
-        if self.remaining_seconds > 0:
-            self.remaining_seconds -= 1
+    def _tick(self, remaining: int) -> None:
+        if remaining != self.remaining_seconds:
+            self.remaining_seconds = remaining
             self._update_display()
             self._update_base_color()
         if self.remaining_seconds <= 0 and self.is_running:
-            self.timer.stop()
             self.is_running = False
             self.status_label.setText("Koniec")
 
-    def _pulse_tick(self) -> None:
+    def _pulse_tick(self, now: float) -> float:
+        """Klatka pulsu; zwraca, za ile sekund potrzebna jest następna."""
         if not self.is_running:
-            return
-        # Postęp od 0 (start) do 1 (koniec). Zabezpieczenie na dzielenie przez zero.
-        progress = 1.0 if self.total_seconds <= 0 else 1.0 - (self.remaining_seconds / self.total_seconds)
-        progress = max(0.0, min(1.0, progress))
-
-        # Częstotliwość rośnie wraz z postępem (0.5 Hz -> 4.0 Hz)
-        freq = 0.5 + 3.5 * progress
-        self._pulse_t += 0.04  # ~40 ms
-
-        # Sygnał 0..1
-        phase = math.sin(2.0 * math.pi * freq * self._pulse_t) * 0.5 + 0.5
-
-        # Amplituda rośnie (delikatnie na początku, mocno pod koniec)
-        amp = 0.25 + 0.65 * progress  # 0.25..0.9
-        # Skala jasności (0.2..1.0), oscyluje wokół ~0.7..1.0 bliżej końca
-        intensity = 0.4 + amp * phase
-        intensity = max(0.2, min(1.0, intensity))
-
-        self.display.apply_intensity(intensity)
+            return math.inf
+        left = self.countdown.remaining(now)
+        if not self._pulse_visible():
+            # Ukryte okno nie pulsuje i nie odświeża sekund - budzi się na
+            # koniec albo po odsłonięciu (wake), puls wraca w fazie, bo jest
+            # funkcją czasu odliczania
+            return left
+        # Postęp od 0 (start) do 1 (koniec), czas animacji liczony od startu
+        progress = self.countdown.progress(now)
+        pulse_t = self.countdown.elapsed(now)
+
+        self.display.apply_intensity(pulse_intensity(progress, pulse_t))
+        step = self.frame_clock.interval_ms / 1000
+        interval = pulse_interval(progress, pulse_t, self.total_seconds, min_interval=step)
+        if interval <= step:
+            return interval  # sekunda zmieni się najpóźniej w następnej klatce, jak dawniej
+        return min(_to_next_second(self.countdown, now), interval)
+
+    def _pulse_visible(self) -> bool:
+        """Okno widoczne, niezminimalizowane i (jeśli platforma to zgłasza) niezasłonięte."""
+        window = self.window()
+        if not self.isVisible() or window.isMinimized():
+            return False
+        handle = window.windowHandle()
+        return handle is None or handle.isExposed()
+
+    def _resume_pulse(self) -> None:
+        if self.is_running and self._pulse_visible():
+            self.frame_clock.wake()
+
+    def showEvent(self, e) -> None:
+        super().showEvent(e)
+        handle = self.window().windowHandle()
+        if handle is not None and handle is not self._watched_window:
+            # Zasłonięcie/odsłonięcie okna widać tylko jako Expose na QWindow
+            handle.installEventFilter(self)
+            self._watched_window = handle
+        self._resume_pulse()
+
+    def changeEvent(self, e) -> None:
+        super().changeEvent(e)
+        if e.type() == QEvent.Type.WindowStateChange:
+            self._resume_pulse()
+
+    def eventFilter(self, obj, e) -> bool:
+        if e.type() == QEvent.Type.Expose:
+            self._resume_pulse()
+        return False
 
     def _update_base_color(self) -> None:
         # Czerwony w ostatnich 10 sekundach, inaczej zielony
@@ -255,20 +811,13 @@ class MainWindow(QWidget):
             self.display.set_base_color(QColor(0, 255, 0))
 
     def _update_display(self) -> None:
-        m = max(0, self.remaining_seconds) // 60
-        s = max(0, self.remaining_seconds) % 60
-        self.display.set_time(m, s)
+        self.display.set_remaining(self.remaining_seconds)
 
     @staticmethod
     def _parse_time(text: str) -> int:
-        """Zwraca całkowitą liczbę sekund dla 'MM:SS' lub liczby całkowitej."""
+        """Zwraca całkowitą liczbę sekund dla 'H:MM:SS', 'MM:SS' lub liczby całkowitej."""
         try:
-            if ":" in text:
-                parts = text.split(":")
-                if len(parts) == 2:
-                    return int(parts[0]) * 60 + int(parts[1])
-                return 0
-            return int(text)
+            return parse_duration(text)
         except ValueError:
             return 0
 
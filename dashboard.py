@@ -0,0 +1,102 @@
+"""Tablica wielu minutników napędzana jednym wspólnym zegarem klatek.
+
+Zamiast dwóch QTimerów na okno (jak w cw3.MainWindow) wszystkie odliczania
+obsługuje jeden FrameClock: sekundy przez CountdownDriver, puls w jednym
+przebiegu po frameAdvanced (pulse_intensities liczy wszystkie kafelki naraz).
+Wszystkie zmiany z jednej klatki trafiają do Qt w tej samej iteracji pętli
+zdarzeń, więc są odmalowane w jednym przejściu.
+"""
+import sys
+
+from qt_compat.QtGui import QColor
+from qt_compat.QtWidgets import QApplication, QGridLayout, QWidget
+
+from countdown import Countdown
+from cw3 import FrameClock, TimerDisplay, pulse_intensities
+
+GREEN = QColor(0, 255, 0)
+RED = QColor(255, 0, 0)
+
+
+class _Tile:
+    __slots__ = ("display", "countdown", "remaining")
+
+    def __init__(self, display: TimerDisplay, countdown: Countdown) -> None:
+        self.display = display
+        self.countdown = countdown
+        self.remaining = None
+
+
+class TimerDashboard(QWidget):
+    """Siatka TimerDisplay; każdy kafelek ma własne odliczanie, zegar jest wspólny."""
+
+    def __init__(self, columns: int = 8, frame_clock: FrameClock = None, parent=None) -> None:
+        super().__init__(parent)
+        self.frame_clock = frame_clock or FrameClock.shared()
+        self.frame_clock.frameAdvanced.connect(self._on_frame)
+        self.columns = columns
+        self.frames = 0
+        self._tiles = []
+        self._layout = QGridLayout(self)
+        self._layout.setSpacing(4)
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    def add_timer(self, seconds: int) -> TimerDisplay:
+        display = TimerDisplay()
+        display.setMinimumSize(160, 60)
+        tile = _Tile(display, Countdown(seconds, clock=self.frame_clock.clock))
+        n = len(self._tiles)
+        self._layout.addWidget(display, n // self.columns, n % self.columns)
+        self._tiles.append(tile)
+        self._show_seconds(tile, seconds)
+        return display
+
+    def start_all(self) -> None:
+        now = self.frame_clock.clock()
+        for tile in self._tiles:
+            if tile.countdown.finished():
+                continue
+            tile.countdown.start(now)
+            self.frame_clock.add(
+                tile.countdown, on_second=lambda s, tile=tile: self._show_seconds(tile, s)
+            )
+
+    def stop_all(self) -> None:
+        now = self.frame_clock.clock()
+        for tile in self._tiles:
+            tile.countdown.stop(now)
+            self.frame_clock.remove(tile.countdown)
+            tile.display.apply_intensity(1.0)
+
+    def _show_seconds(self, tile: _Tile, remaining: int) -> None:
+        if remaining == tile.remaining:
+            return
+        tile.remaining = remaining
+        tile.display.set_remaining(remaining)
+        tile.display.set_base_color(RED if remaining <= 10 else GREEN)
+        if remaining <= 0:
+            tile.display.apply_intensity(1.0)
+
+    def _on_frame(self, now: float) -> None:
+        self.frames += 1
+        tiles = [t for t in self._tiles if t.countdown.running and not t.countdown.finished(now)]
+        intensities = pulse_intensities([t.countdown.progress(now) for t in tiles],
+                                        [t.countdown.elapsed(now) for t in tiles])
+        for tile, intensity in zip(tiles, intensities):
+            tile.display.apply_intensity(intensity)
+
+
+def main() -> None:
+    app = QApplication(sys.argv)
+    board = TimerDashboard()
+    for i in range(48):
+        board.add_timer(30 + 15 * i)
+    board.start_all()
+    board.show()
+    sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""Feed widgets from slow data sources without blocking the GUI thread.
+
+Sources (hardware polls, sockets, the StandInSource producer) are read in a
+worker - a thread (ThreadedFeed) or an asyncio task (AsyncFeed) - which
+publishes the newest value per key into a Snapshot. The GUI side
+(SnapshotBinder) looks at the snapshot once per frame and pushes only
+changed values into bound widgets: PowerBar.setValue,
+TimerDisplay.set_remaining, AnimatedToggle.setChecked or any callable.
+
+Snapshot is lock-free: the single writer builds a new dict per poll cycle
+and swaps one reference, readers take that reference and never see a
+half-applied cycle. However many updates arrive between two frames, the
+GUI does one pass per frame.
+"""
+import asyncio
+import itertools
+import math
+import threading
+import time
+
+from qt_compat.QtCore import QObject, QTimer, Qt
+
+
+class Snapshot:
+    """Latest value per key; one writer thread, any number of readers."""
+
+    def __init__(self):
+        self._state = (0, {})  # (version, values), replaced as a whole
+        self.published = 0  # individual updates received
+
+    @property
+    def version(self):
+        return self._state[0]
+
+    def latest(self):
+        """``(version, values)``; treat ``values`` as read-only."""
+        return self._state
+
+    def get(self, key, default=None):
+        return self._state[1].get(key, default)
+
+    def publish(self, updates):
+        """Merge ``updates`` (a dict) and make them visible at once. Writer thread only."""
+        if not updates:
+            return
+        version, values = self._state
+        merged = dict(values)
+        merged.update(updates)
+        self.published += len(updates)
+        self._state = (version + 1, merged)
+
+
+class StandInSource:
+    """Local producer standing in for real hardware or a socket.
+
+    Each ``read(now)`` returns the updates due since the previous read, about
+    ``rate`` per second spread round-robin over ``keys``. Values depend only
+    on the time: ``"level"`` is a 0..99 sine per key, ``"seconds"`` counts down
+    from ``start`` and ``"switch"`` flips every ``period`` seconds. ``latency``
+    seconds of blocking per read imitate slow I/O.
+    """
+
+    KINDS = ("level", "seconds", "switch")
+
+    def __init__(self, keys, rate=1000, kind="level", latency=0.0, start=600, period=1.0):
+        if kind not in self.KINDS:
+            raise ValueError(f"unknown kind {kind!r}, expected one of {self.KINDS}")
+        self.keys = list(keys)
+        self.rate = rate
+        self.kind = kind
+        self.latency = latency
+        self.start = start
+        self.period = period
+        self._cycle = itertools.cycle(range(len(self.keys)))
+        self._t0 = None
+        self._owed = 0.0
+        self.produced = 0
+
+    def value(self, index, now):
+        t = now - self._t0
+        if self.kind == "level":
+            return int(49.5 + 49.5 * math.sin(t * 2.0 + index * 0.3))
+        if self.kind == "seconds":
+            return max(0, math.ceil(self.start - t - index))
+        return int((t + index * 0.1) / self.period) % 2 == 1
+
+    def read(self, now):
+        if self.latency:
+            time.sleep(self.latency)
+        if self._t0 is None:
+            self._t0 = self._last = now
+        self._owed += (now - self._last) * self.rate
+        self._last = now
+        count = int(self._owed)
+        self._owed -= count
+        self.produced += count
+        updates = {}
+        for _ in range(min(count, len(self.keys))):  # older ones would be overwritten anyway
+            i = next(self._cycle)
+            updates[self.keys[i]] = self.value(i, now)
+        return updates
+
+
+def _read_all(sources, now):
+    updates = {}
+    for source in sources:
+        updates.update(source.read(now))
+    return updates
+
+
+class ThreadedFeed:
+    """Polls ``sources`` every ``interval`` seconds in a daemon thread."""
+
+    def __init__(self, snapshot, sources, interval=0.001, clock=time.monotonic):
+        self.snapshot = snapshot
+        self.sources = list(sources)
+        self.interval = interval
+        self.clock = clock
+        self.cycles = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="ThreadedFeed", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        next_poll = self.clock()
+        while not self._stop.is_set():
+            self.snapshot.publish(_read_all(self.sources, self.clock()))
+            self.cycles += 1
+            next_poll += self.interval
+            delay = next_poll - self.clock()
+            if delay > 0:
+                self._stop.wait(delay)
+            else:
+                next_poll = self.clock()  # overran: do not try to catch up
+
+
+class AsyncFeed:
+    """The same polling as an asyncio task.
+
+    Sources may define ``async def aread(now)``; plain ``read`` runs in the
+    loop's default executor so a blocking read never stalls the loop.
+    ``run()`` can be scheduled on any loop, including a Qt-integrated one
+    (qasync); ``start()`` runs a private loop in a background thread.
+    """
+
+    def __init__(self, snapshot, sources, interval=0.001, clock=time.monotonic):
+        self.snapshot = snapshot
+        self.sources = list(sources)
+        self.interval = interval
+        self.clock = clock
+        self.cycles = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    async def _read(self, source, now):
+        if hasattr(source, "aread"):
+            return await source.aread(now)
+        return await asyncio.get_running_loop().run_in_executor(None, source.read, now)
+
+    async def run(self):
+        while not self._stop.is_set():
+            started = self.clock()
+            results = await asyncio.gather(*(self._read(s, started) for s in self.sources))
+            updates = {}
+            for result in results:
+                updates.update(result)
+            self.snapshot.publish(updates)
+            self.cycles += 1
+            await asyncio.sleep(max(0.0, self.interval - (self.clock() - started)))
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=asyncio.run, args=(self.run(),),
+                                            name="AsyncFeed", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+class SnapshotBinder(QObject):
+    """Applies a Snapshot to bound widgets once per frame, in the GUI thread."""
+
+    def __init__(self, snapshot, interval_ms=16, parent=None):
+        super().__init__(parent)
+        self.snapshot = snapshot
+        self._bindings = {}  # key -> [setter, last applied value]
+        self._version = None
+        self.frames = 0
+        self.applied = 0
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.apply)
+
+    def __len__(self):
+        return len(self._bindings)
+
+    def bind(self, key, setter):
+        """Call ``setter(value)`` whenever ``key`` has a new value."""
+        self._bindings[key] = [setter, object()]
+        self._version = None
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def bind_power_bar(self, key, power_bar):
+        self.bind(key, lambda value: power_bar.setValue(int(value)))
+
+    def bind_timer(self, key, display):
+        self.bind(key, lambda value: display.set_remaining(int(value)))
+
+    def bind_toggle(self, key, toggle):
+        self.bind(key, lambda value: toggle.setChecked(bool(value)))
+
+    def unbind(self, key):
+        self._bindings.pop(key, None)
+        if not self._bindings:
+            self._timer.stop()
+
+    def apply(self):
+        """One frame: read the snapshot once and push changed values."""
+        self.frames += 1
+        version, values = self.snapshot.latest()
+        if version == self._version:
+            return
+        self._version = version
+        for key, binding in self._bindings.items():
+            value = values.get(key, binding[1])
+            if value != binding[1]:
+                binding[1] = value
+                binding[0](value)
+                self.applied += 1
@@ -0,0 +1,141 @@
+"""Item delegates that paint AnimatedToggle and PowerBar cells in item views.
+
+No widget is created per row: each delegate owns one hidden template widget
+and reuses its painting code (``AnimatedToggle._draw`` / ``_Bar._draw``) for
+every visible cell, reading the state straight from the model. Only rows
+whose toggle is currently animating get a small state object, driven by the
+shared ToggleAnimator and dropped when the animation ends.
+"""
+from qt_compat import event_pos
+from qt_compat.QtCore import QEvent, QModelIndex, QPersistentModelIndex, QRectF, Qt
+from qt_compat.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+from animated_toggle import AnimatedToggle, ToggleAnimator
+from power_bar import _Bar
+from palette import gradient_brushes
+
+
+class _RowToggle:
+    """Animated handle/pulse values of one cell, updated by ToggleAnimator.
+
+    The last update() after the animation ends removes the row from its
+    delegate, so rows scrolled out of view do not linger until repainted.
+    """
+
+    __slots__ = ("_handle_position", "_pulse_radius", "_pulse_active", "index", "view", "delegate")
+
+    def __init__(self, index, view, position, delegate):
+        self._handle_position = position
+        self._pulse_radius = 0
+        self._pulse_active = False
+        self.index = index
+        self.view = view
+        self.delegate = delegate
+
+    def update(self):
+        if self.index.isValid():
+            self.view.viewport().update(self.view.visualRect(QModelIndex(self.index)))
+        if self not in self.delegate._animator:
+            self.delegate._rows.pop(self.index, None)
+
+
+def _draw_item_background(painter, option, index):
+    opt = QStyleOptionViewItem(option)
+    opt.text = ""
+    opt.features &= ~QStyleOptionViewItem.ViewItemFeature.HasCheckIndicator
+    style = option.widget.style() if option.widget else QApplication.style()
+    style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, option.widget)
+
+
+class ToggleDelegate(QStyledItemDelegate):
+    """Paints a boolean model value (CheckStateRole by default) as an AnimatedToggle.
+
+    Clicking a cell flips the value in the model and animates that cell only.
+    """
+
+    def __init__(self, parent=None, role=Qt.ItemDataRole.CheckStateRole, animator=None, **toggle_colors):
+        super().__init__(parent)
+        self.role = role
+        self._template = AnimatedToggle(**toggle_colors)
+        self._animator = animator if animator is not None else ToggleAnimator.shared()
+        self._rows = {}
+
+    def _checked(self, index):
+        value = index.data(self.role)
+        if self.role == Qt.ItemDataRole.CheckStateRole:
+            return value is not None and Qt.CheckState(value) == Qt.CheckState.Checked
+        return bool(value)
+
+    def paint(self, painter, option, index):
+        _draw_item_background(painter, option, index)
+        checked = self._checked(index)
+        position, pulse = (1 if checked else 0), 0
+
+        key = QPersistentModelIndex(index)
+        row = self._rows.get(key)
+        if row is not None:
+            if row in self._animator:
+                position = row._handle_position
+                pulse = row._pulse_radius if row._pulse_active else 0
+            else:
+                del self._rows[key]
+
+        rect = option.rect
+        painter.save()
+        painter.translate(rect.topLeft())
+        self._template._draw(painter, rect.width(), rect.height(), checked, position, pulse)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return self._template.sizeHint()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() != QEvent.Type.MouseButtonRelease or event.button() != Qt.MouseButton.LeftButton:
+            return False
+        if not option.rect.contains(event_pos(event).toPoint()) or not (index.flags() & Qt.ItemFlag.ItemIsEnabled):
+            return False
+
+        checked = not self._checked(index)
+        if self.role == Qt.ItemDataRole.CheckStateRole:
+            value = Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+        else:
+            value = checked
+        key = QPersistentModelIndex(index)
+        row = self._rows.get(key)
+        if row is None:
+            row = self._rows[key] = _RowToggle(key, option.widget, 0 if checked else 1, self)
+        self._animator.animate(row, 1 if checked else 0)
+        return model.setData(index, value, self.role)
+
+
+class PowerBarDelegate(QStyledItemDelegate):
+    """Paints a numeric model value as a row of PowerBar dots.
+
+    ``minimum``/``maximum`` map the value onto the ``steps`` dots; colors
+    default to PowerBar's red-to-green ramp.
+    """
+
+    def __init__(self, parent=None, steps=10, minimum=0, maximum=100,
+                 colors=None, role=Qt.ItemDataRole.DisplayRole):
+        super().__init__(parent)
+        self.role = role
+        self.minimum = minimum
+        self.maximum = maximum
+        self._template = _Bar(colors or gradient_brushes(('red', 'lime'), steps))
+
+    def paint(self, painter, option, index):
+        value = index.data(self.role)
+        lit = 0
+        if value is not None and self.maximum > self.minimum:
+            pc = (float(value) - self.minimum) / (self.maximum - self.minimum)
+            lit = max(0, min(self._template.n_steps, int(pc * self._template.n_steps)))
+
+        rect = option.rect
+        painter.save()
+        painter.translate(rect.topLeft())
+        self._template._draw(painter, rect.width(), rect.height(), lit,
+                             QRectF(0, 0, rect.width(), rect.height()))
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return self._template.sizeHint()
@@ -1,4 +1,4 @@
-from PyQt5 import QtWidgets
+from qt_compat import QtWidgets
 from power_bar import PowerBar
 
 app = QtWidgets.QApplication([])
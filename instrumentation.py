@@ -0,0 +1,313 @@
+"""Opt-in frame timing and repaint instrumentation for the widgets.
+
+Nothing here runs until ``enable()`` is called: it replaces the
+``paintEvent``/``update`` methods and timer slots of the widget classes with
+recording wrappers and ``disable()`` puts the originals back, so the
+disabled cost is zero.
+
+Events go into a fixed-size ring buffer written from the GUI thread without
+locks (a slot index is taken from an ``itertools.count``, which is atomic
+under the GIL); readers take a snapshot. Results can be shown in a live
+overlay widget, written periodically as JSON lines, or exported in Chrome
+trace-event format (chrome://tracing, Perfetto).
+
+    import instrumentation
+    instr = instrumentation.enable()
+    ...
+    instr.write_chrome_trace("trace.json")
+"""
+import itertools
+import json
+import sys
+import threading
+import time
+from collections import defaultdict
+from functools import wraps
+
+PAINT = "paint"
+UPDATE = "update"
+TIMER = "timer"
+DROPPED = "dropped"
+
+# module -> [(kind, class name, method, expected interval in ms)]; a timer
+# with interval None is only timed, never checked for lateness or drops
+DEFAULT_TARGETS = {
+    "cw3": [
+        (PAINT, "SevenSegmentDisplay", "paintEvent", None),
+        (PAINT, "SegmentDisplay", "paintEvent", None),
+        (UPDATE, "SevenSegmentDisplay", "update", None),
+        (UPDATE, "SegmentDisplay", "update", None),
+        # Adaptive FrameClock: no frames (and no seconds) while the window is hidden
+        (TIMER, "MainWindow", "_tick", None),
+        (TIMER, "MainWindow", "_pulse_tick", None),
+    ],
+    "power_bar": [
+        (PAINT, "_Bar", "paintEvent", None),
+        (UPDATE, "_Bar", "update", None),
+    ],
+    "animated_toggle": [
+        (PAINT, "AnimatedToggle", "paintEvent", None),
+        (UPDATE, "AnimatedToggle", "update", None),
+    ],
+}
+
+
+class RingBuffer:
+    """Fixed-capacity event store; the newest ``capacity`` records are kept."""
+
+    def __init__(self, capacity=65536):
+        self.capacity = capacity
+        self._slots = [None] * capacity
+        self._counter = itertools.count()
+        self._written = 0
+
+    def append(self, record):
+        i = next(self._counter)
+        self._slots[i % self.capacity] = record
+        self._written = i + 1
+
+    def __len__(self):
+        return min(self._written, self.capacity)
+
+    def snapshot(self):
+        """Records oldest first."""
+        written = self._written
+        if written <= self.capacity:
+            return [r for r in self._slots[:written] if r is not None]
+        start = written % self.capacity
+        return [r for r in self._slots[start:] + self._slots[:start] if r is not None]
+
+
+def _percentile(sorted_values, pc):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(pc / 100 * len(sorted_values)))]
+
+
+class Instrumentation:
+    """Patches widget classes and records (kind, name, start_ns, duration_ns, extra) tuples."""
+
+    def __init__(self, capacity=65536):
+        self.buffer = RingBuffer(capacity)
+        self._originals = []
+        self._last_call = {}
+        self._t0 = time.perf_counter_ns()
+
+    @property
+    def enabled(self):
+        return bool(self._originals)
+
+    def instrument(self, cls, method, kind, interval_ms=None):
+        original = cls.__dict__.get(method, getattr(cls, method))
+        record = self.buffer.append
+        name = f"{cls.__name__}.{method}"
+        clock = time.perf_counter_ns
+
+        if kind == PAINT:
+            @wraps(original)
+            def wrapper(self, *args):
+                start = clock()
+                try:
+                    return original(self, *args)
+                finally:
+                    record((PAINT, name, start, clock() - start, None))
+
+        elif kind == UPDATE:
+            @wraps(original)
+            def wrapper(self, *args):
+                record((UPDATE, name, clock(), 0, None))
+                return original(self, *args)
+
+        elif kind == TIMER and interval_ms is None:
+            @wraps(original)
+            def wrapper(self, *args):
+                start = clock()
+                try:
+                    return original(self, *args)
+                finally:
+                    record((TIMER, name, start, clock() - start, None))
+
+        elif kind == TIMER:
+            last_call = self._last_call
+            interval_ns = interval_ms * 1_000_000
+
+            @wraps(original)
+            def wrapper(self, *args):
+                start = clock()
+                key = (name, id(self))
+                previous = last_call.get(key)
+                last_call[key] = start
+                lateness = 0 if previous is None else start - previous - interval_ns
+                try:
+                    return original(self, *args)
+                finally:
+                    record((TIMER, name, start, clock() - start, lateness))
+                    if lateness > interval_ns // 2:
+                        record((DROPPED, name, start, 0, round(lateness / interval_ns)))
+
+        else:
+            raise ValueError(f"unknown instrumentation kind {kind!r}")
+
+        self._originals.append((cls, method, cls.__dict__.get(method)))
+        setattr(cls, method, wrapper)
+
+    def enable(self, targets=None):
+        """Instrument every target class whose module is already imported."""
+        for module_name, entries in (targets or DEFAULT_TARGETS).items():
+            module = sys.modules.get(module_name)
+            if module is None:
+                continue
+            for kind, class_name, method, interval in entries:
+                cls = getattr(module, class_name, None)
+                if cls is not None:
+                    self.instrument(cls, method, kind, interval)
+        return self
+
+    def disable(self):
+        for cls, method, original in reversed(self._originals):
+            if original is None:
+                delattr(cls, method)
+            else:
+                setattr(cls, method, original)
+        self._originals.clear()
+        self._last_call.clear()
+
+    def summary(self):
+        """Per-name statistics over everything still in the buffer."""
+        paints = defaultdict(list)
+        timers = defaultdict(list)
+        calls = defaultdict(int)
+        counts = defaultdict(int)
+        dropped = defaultdict(int)
+        for kind, name, _start, duration, extra in self.buffer.snapshot():
+            if kind == PAINT:
+                paints[name].append(duration / 1e6)
+            elif kind == UPDATE:
+                counts[name] += 1
+            elif kind == TIMER:
+                calls[name] += 1
+                if extra is not None:
+                    timers[name].append(extra / 1e6)
+            elif kind == DROPPED:
+                dropped[name] += extra
+
+        out = {}
+        for name, values in paints.items():
+            values.sort()
+            out[name] = {"paints": len(values), "paint_ms_p50": _percentile(values, 50),
+                         "paint_ms_p95": _percentile(values, 95), "paint_ms_max": values[-1]}
+        for name, n in counts.items():
+            out.setdefault(name, {})["updates"] = n
+        for name, n in calls.items():
+            out[name] = {"calls": n}
+            values = sorted(timers[name])
+            if values:
+                out[name].update({"late_ms_p50": _percentile(values, 50),
+                                  "late_ms_p95": _percentile(values, 95), "late_ms_max": values[-1],
+                                  "dropped_frames": dropped.get(name, 0)})
+        return out
+
+    def chrome_trace(self):
+        """The buffer as a Chrome trace-event dict."""
+        events = []
+        for kind, name, start, duration, extra in self.buffer.snapshot():
+            ts = (start - self._t0) / 1000
+            if kind in (PAINT, TIMER):
+                event = {"name": name, "cat": kind, "ph": "X", "ts": ts, "dur": duration / 1000,
+                         "pid": 1, "tid": 1}
+                if kind == TIMER and extra is not None:
+                    event["args"] = {"late_ms": extra / 1e6}
+            else:
+                event = {"name": name, "cat": kind, "ph": "i", "s": "t", "ts": ts, "pid": 1, "tid": 1}
+                if kind == DROPPED:
+                    event["args"] = {"frames": extra}
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+
+
+class JsonLinesReporter:
+    """Writes ``Instrumentation.summary()`` as one JSON line every ``interval`` seconds."""
+
+    def __init__(self, instr, stream, interval=1.0):
+        self.instr = instr
+        self.stream = stream
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="instrumentation-report", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.write_line()
+
+    def write_line(self):
+        line = {"time": time.time(), "stats": self.instr.summary()}
+        self.stream.write(json.dumps(line) + "\n")
+        self.stream.flush()
+
+
+def _qt():
+    """QtCore/QtWidgets of the binding chosen by qt_compat."""
+    from qt_compat import QtCore, QtWidgets
+    return QtCore, QtWidgets
+
+
+def create_overlay(instr, parent, interval_ms=500):
+    """Semi-transparent label in the top-left corner of ``parent`` showing live statistics."""
+    QtCore, QtWidgets = _qt()
+    label = QtWidgets.QLabel(parent)
+    label.setAttribute(QtCore.Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+    label.setStyleSheet(
+        "background: rgba(0, 0, 0, 170); color: #0f0; font-family: monospace; padding: 4px;")
+
+    def refresh():
+        lines = []
+        for name, s in sorted(instr.summary().items()):
+            if "paints" in s:
+                lines.append(f"{name}: {s['paints']} paints p95 {s['paint_ms_p95']:.2f} ms")
+            elif "late_ms_p95" in s:
+                lines.append(f"{name}: late p95 {s['late_ms_p95']:.1f} ms dropped {s['dropped_frames']}")
+            elif "calls" in s:
+                lines.append(f"{name}: {s['calls']} calls")
+            else:
+                lines.append(f"{name}: {s.get('updates', 0)} updates")
+        label.setText("\n".join(lines) or "no events")
+        label.adjustSize()
+        label.raise_()
+
+    timer = QtCore.QTimer(label)
+    timer.setInterval(interval_ms)
+    timer.timeout.connect(refresh)
+    timer.start()
+    refresh()
+    label.show()
+    return label
+
+
+_default = None
+
+
+def enable(capacity=65536, targets=None):
+    """Instrument the default targets with a process-wide Instrumentation."""
+    global _default
+    if _default is None:
+        _default = Instrumentation(capacity)
+    if not _default.enabled:
+        _default.enable(targets)
+    return _default
+
+
+def disable():
+    if _default is not None:
+        _default.disable()
@@ -0,0 +1,127 @@
+"""Single entry point for the demos, with startup measurements.
+
+    python launcher.py toggle                      # AnimatedDemo
+    python launcher.py powerbar --binding pyqt5    # PowerBar on PyQt5
+    python launcher.py cw3 --report startup.jsonl  # append timings to a file
+    python launcher.py cw3 --exit-after-paint      # measure and quit
+
+Only the Qt binding and the module of the chosen demo are imported before the
+window is shown. Everything else (``--preload``) is imported after the first
+paint, from the event loop, so it never delays the first frame.
+"""
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+
+_START = time.perf_counter()
+
+# name -> (module, widget class); modules are imported only when chosen.
+DEMOS = {
+    "cw3": ("cw3", "MainWindow"),
+    "powerbar": ("power_bar", "PowerBar"),
+    "toggle": ("animated_toggle", "AnimatedDemo"),
+}
+
+
+def _ms_since(start):
+    return round((time.perf_counter() - start) * 1000, 2)
+
+
+class StartupReport:
+    """Collects ``phase -> milliseconds`` while the demo starts."""
+
+    def __init__(self, demo):
+        self.demo = demo
+        self.phases = {}
+        self._last = _START
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases[phase] = round((now - self._last) * 1000, 2)
+        self._last = now
+
+    def as_dict(self, api):
+        return {
+            "time": time.time(),
+            "demo": self.demo,
+            "binding": api,
+            "phases_ms": self.phases,
+            "first_paint_ms": _ms_since(_START),
+        }
+
+
+def _watch_first_paint(QtCore, widget, callback):
+    """Call ``callback`` once, right after ``widget`` received its first paint event."""
+
+    class _FirstPaint(QtCore.QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QtCore.QEvent.Type.Paint:
+                obj.removeEventFilter(self)
+                # Let the paint finish before reporting.
+                QtCore.QTimer.singleShot(0, callback)
+            return False
+
+    watcher = _FirstPaint(widget)
+    widget.installEventFilter(watcher)
+    return watcher
+
+
+def _preload(report, names):
+    for name in names:
+        module, _ = DEMOS[name]
+        start = time.perf_counter()
+        importlib.import_module(module)
+        report.phases[f"preload {module}"] = _ms_since(start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("demo", choices=sorted(DEMOS))
+    parser.add_argument("--binding", choices=("pyqt6", "pyqt5"),
+                        help="Qt binding (default: $QT_API, else PyQt6 with PyQt5 fallback)")
+    parser.add_argument("--report", metavar="FILE", help="append the timings as a JSON line")
+    parser.add_argument("--preload", action="store_true",
+                        help="import the other demos after the first paint")
+    parser.add_argument("--exit-after-paint", action="store_true",
+                        help="quit once the first frame is painted")
+    args = parser.parse_args(argv)
+
+    if args.binding:
+        os.environ["QT_API"] = args.binding
+    report = StartupReport(args.demo)
+
+    from qt_compat import API, QtCore, QtWidgets
+    report.mark("import binding")
+
+    app = QtWidgets.QApplication(sys.argv[:1])
+    report.mark("QApplication")
+
+    module_name, class_name = DEMOS[args.demo]
+    widget_class = getattr(importlib.import_module(module_name), class_name)
+    report.mark(f"import {module_name}")
+
+    window = widget_class()
+    report.mark(f"construct {class_name}")
+
+    def first_paint():
+        report.mark("first paint")
+        result = report.as_dict(API)
+        if args.preload:
+            _preload(report, [name for name in sorted(DEMOS) if name != args.demo])
+        print(json.dumps(result), file=sys.stderr)
+        if args.report:
+            with open(args.report, "a") as fh:
+                fh.write(json.dumps(result) + "\n")
+        if args.exit_after_paint:
+            app.quit()
+
+    window._first_paint_watcher = _watch_first_paint(QtCore, window, first_paint)
+    window.show()
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,4 @@
-from PyQt5.QtWidgets import QApplication
+from qt_compat.QtWidgets import QApplication
 from animated_toggle import AnimatedDemo
 
 app = QApplication([])
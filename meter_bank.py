@@ -0,0 +1,235 @@
+"""Many PowerBar-style level meters drawn by one widget.
+
+Channel levels live in one flat array (NumPy when available, otherwise
+``array('f')``) and are painted in a single paintEvent: each channel is one
+blit of a pre-rendered row of lit dots, clipped to its level, plus one blit
+for the peak-hold dot.
+"""
+import time
+from array import array
+
+from qt_compat import QtCore, QtGui, QtWidgets
+from qt_compat.QtCore import Qt
+
+from palette import gradient_colors
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional speed-up
+    np = None
+
+
+class MeterBank(QtWidgets.QWidget):
+    """``channels`` horizontal meters of ``steps`` dots each, values in 0..1."""
+
+    def __init__(self, channels=16, steps=10, colors=None, parent=None):
+        super().__init__(parent)
+        self.setSizePolicy(
+            QtWidgets.QSizePolicy.Policy.MinimumExpanding,
+            QtWidgets.QSizePolicy.Policy.MinimumExpanding
+        )
+        self._channels = channels
+        self._steps = steps
+        self._colors = [QtGui.QColor(c) for c in colors] if colors else gradient_colors(('red', 'lime'), steps)
+        self._background_color = QtGui.QColor('black')
+        self._unlit_color = QtGui.QColor(30, 30, 30)
+        self._bar_solid_percent = 0.8
+        self._padding = 2.0
+
+        self._values = self._zeros()
+        self._peaks = self._zeros()
+        self._hold = self._zeros()  # seconds left before a peak starts to decay
+        self._hold_time = 0.0
+        self._decay = 0.0  # level units per second
+        self._last_advance = None
+
+        self._sprites = None
+        self._sprites_key = None
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(16)
+        self._timer.timeout.connect(self.advance)
+
+    def _zeros(self):
+        if np is not None:
+            return np.zeros(self._channels, dtype=np.float32)
+        return array('f', bytes(4 * self._channels))
+
+    def sizeHint(self):
+        return QtCore.QSize(200, 12 * self._channels)
+
+    def channelCount(self):
+        return self._channels
+
+    def values(self):
+        """The live level array; write into it and call ``update()`` to skip a copy."""
+        return self._values
+
+    def peaks(self):
+        return self._peaks
+
+    def setValues(self, values):
+        """Replace all channel levels at once."""
+        if np is not None:
+            np.clip(np.asarray(values, dtype=np.float32), 0.0, 1.0, out=self._values)
+            rising = self._values > self._peaks
+            self._peaks[rising] = self._values[rising]
+            self._hold[rising] = self._hold_time
+        else:
+            for i, v in enumerate(values):
+                self._values[i] = v = min(1.0, max(0.0, v))
+                if v > self._peaks[i]:
+                    self._peaks[i] = v
+                    self._hold[i] = self._hold_time
+        self.update()
+
+    def setValue(self, channel, value):
+        value = min(1.0, max(0.0, float(value)))
+        self._values[channel] = value
+        if value > self._peaks[channel]:
+            self._peaks[channel] = value
+            self._hold[channel] = self._hold_time
+        self.update()
+
+    def setPeakHold(self, hold_ms, decay_per_second=0.5, interval_ms=16):
+        """Keep each channel's peak for ``hold_ms``, then let it fall at ``decay_per_second``.
+
+        ``hold_ms=None`` disables peak markers and stops the decay timer. The
+        timer only runs while some peak differs from its level; it is
+        restarted from the next paint after a level moves away from its peak.
+        """
+        if hold_ms is None:
+            self._timer.stop()
+            self._hold_time = 0.0
+            self._decay = 0.0
+            self._peaks[:] = self._values
+            self.update()
+            return
+        self._hold_time = hold_ms / 1000
+        self._decay = decay_per_second
+        self._timer.setInterval(interval_ms)
+        self._wake_peaks()
+
+    def _held_peaks(self):
+        """True while some peak is held or falling, or lags a level written via ``values()``."""
+        if np is not None:
+            return bool((self._peaks != self._values).any())
+        return any(p != v for p, v in zip(self._peaks, self._values))
+
+    def _wake_peaks(self):
+        if self._hold_time > 0 and not self._timer.isActive() and self._held_peaks():
+            self._last_advance = None
+            self._timer.start()
+
+    def advance(self, dt=None):
+        """Age the peaks by ``dt`` seconds (measured on the monotonic clock by default).
+
+        Repaints only when a peak moved; stops the timer once no peak is held.
+        """
+        now = time.monotonic()
+        if dt is None:
+            dt = 0.0 if self._last_advance is None else now - self._last_advance
+        self._last_advance = now
+
+        if np is not None:
+            values, peaks, hold = self._values, self._peaks, self._hold
+            rising = values >= peaks
+            hold -= dt
+            hold[rising] = self._hold_time
+            falling = ~rising & (hold <= 0)
+            peaks[rising] = values[rising]
+            peaks[falling] = np.maximum(values[falling], peaks[falling] - self._decay * dt)
+            moved = bool(falling.any())
+        else:
+            moved = False
+            for i in range(self._channels):
+                v, peak = self._values[i], self._peaks[i]
+                if v >= peak:
+                    self._peaks[i] = v
+                    self._hold[i] = self._hold_time
+                else:
+                    self._hold[i] -= dt
+                    if self._hold[i] <= 0:
+                        self._peaks[i] = max(v, peak - self._decay * dt)
+                        moved = True
+        if not self._held_peaks():
+            self._timer.stop()
+        if moved:
+            self.update()
+
+    def _row_sprites(self, width, row_height, dpr):
+        """Pre-rendered (lit row, unlit row, one dot per step) for the current geometry."""
+        key = (width, row_height, dpr, self._padding, self._bar_solid_percent)
+        if key == self._sprites_key:
+            return self._sprites
+
+        d_width = width - self._padding * 2
+        d_height = row_height - self._padding * 2
+        step_size = d_width / self._steps
+        radius = max(1, int(min(step_size * self._bar_solid_percent, d_height) / 2))
+        cy = row_height / 2
+
+        def render(colors):
+            pixmap = QtGui.QPixmap(max(1, round(width * dpr)), max(1, round(row_height * dpr)))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            p = QtGui.QPainter(pixmap)
+            p.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+            p.setPen(Qt.PenStyle.NoPen)
+            for n, color in enumerate(colors):
+                p.setBrush(color)
+                cx = self._padding + n * step_size + step_size / 2
+                p.drawEllipse(QtCore.QPointF(cx, cy), radius, radius)
+            p.end()
+            return pixmap
+
+        self._sprites = (render(self._colors), render([self._unlit_color] * self._steps), step_size)
+        self._sprites_key = key
+        return self._sprites
+
+    def paintEvent(self, e):
+        painter = QtGui.QPainter(self)
+        painter.fillRect(e.rect(), self._background_color)
+        if not self._channels:
+            return
+
+        width = self.width()
+        row_height = self.height() / self._channels
+        dpr = self.devicePixelRatioF()
+        lit, unlit, step_size = self._row_sprites(width, int(row_height), dpr)
+
+        steps = self._steps
+        if np is not None:
+            lit_steps = (self._values * steps).astype(np.int32).tolist()
+            peak_steps = (self._peaks * steps).astype(np.int32).tolist()
+        else:
+            lit_steps = [int(v * steps) for v in self._values]
+            peak_steps = [int(v * steps) for v in self._peaks]
+        show_peaks = self._hold_time > 0
+        self._wake_peaks()
+
+        for ch in range(self._channels):
+            y = int(ch * row_height)
+            n = lit_steps[ch]
+            painter.drawPixmap(0, y, unlit)
+            if n > 0:
+                w = int(self._padding + n * step_size)
+                painter.drawPixmap(QtCore.QRectF(0, y, w, lit.height() / dpr), lit,
+                                   QtCore.QRectF(0, 0, w * dpr, lit.height()))
+            peak = min(peak_steps[ch], steps) - 1
+            if show_peaks and peak >= n:
+                x = self._padding + peak * step_size
+                painter.drawPixmap(QtCore.QRectF(x, y, step_size, lit.height() / dpr), lit,
+                                   QtCore.QRectF(x * dpr, 0, step_size * dpr, lit.height()))
+        painter.end()
+
+    def setBackgroundColor(self, color):
+        self._background_color = QtGui.QColor(color)
+        self.update()
+
+    def setColors(self, colors):
+        self._colors = [QtGui.QColor(c) for c in colors]
+        self._steps = len(self._colors)
+        self._sprites_key = None
+        self.update()
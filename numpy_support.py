@@ -0,0 +1,17 @@
+"""Optional NumPy, imported lazily.
+
+NumPy only speeds up large batches (gradients, curve tables), so it is not
+imported at startup: ``numpy_or_none()`` imports it on the first large
+batch and returns ``None`` when it is not installed.
+"""
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def numpy_or_none():
+    """numpy module or ``None``; the import is attempted once."""
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - optional speed-up
+        return None
+    return numpy
@@ -0,0 +1,220 @@
+"""Color ramps for the level-meter widgets.
+
+``gradient_brushes(stops, steps, mode)`` interpolates between two or more
+color stops and returns one ready-to-use QBrush per step. Interpolation is
+vectorized with NumPy when it is installed (pure Python otherwise), and
+results are memoized in a bounded LRU cache keyed by (stops, steps, mode),
+so bars and meter banks sharing a ramp share the same brushes.
+
+Modes:
+    "rgb"   - straight interpolation of the sRGB components,
+    "hsv"   - hue/saturation/value, hue along the shorter arc,
+    "oklab" - perceptually uniform OKLab space.
+
+Stops are either colors spread evenly (``['red', 'yellow', 'lime']``) or
+``(position, color)`` pairs with positions in 0..1.
+"""
+import colorsys
+from bisect import bisect_right
+from functools import lru_cache
+
+from numpy_support import numpy_or_none
+from qt_compat import QtGui
+
+MODES = ("rgb", "hsv", "oklab")
+
+# Gradients shorter than this are computed in pure Python: importing numpy
+# costs more than it saves for a ten-dot PowerBar and would slow down startup.
+NUMPY_MIN_STEPS = 256
+
+
+def gradient_brushes(stops, steps, mode="rgb"):
+    """Tuple of ``steps`` QBrushes running through ``stops``."""
+    if mode not in MODES:
+        raise ValueError(f"unknown gradient mode {mode!r}, expected one of {MODES}")
+    if steps < 1:
+        raise ValueError("steps must be at least 1")
+    return _cached_brushes(_normalize_stops(stops), int(steps), mode)
+
+
+def gradient_colors(stops, steps, mode="rgb"):
+    return [brush.color() for brush in gradient_brushes(stops, steps, mode)]
+
+
+def cache_info():
+    return _cached_brushes.cache_info()
+
+
+def cache_clear():
+    _cached_brushes.cache_clear()
+
+
+def _normalize_stops(stops):
+    """Hashable ((position, rgba), ...) sorted by position."""
+    stops = list(stops)
+    if len(stops) < 1:
+        raise ValueError("at least one color stop is required")
+    if all(isinstance(s, tuple) and len(s) == 2 and isinstance(s[0], (int, float)) for s in stops):
+        pairs = [(float(pos), QtGui.QColor(color)) for pos, color in stops]
+    else:
+        last = max(1, len(stops) - 1)
+        pairs = [(i / last, QtGui.QColor(color)) for i, color in enumerate(stops)]
+    for _, color in pairs:
+        if not color.isValid():
+            raise ValueError(f"invalid color stop {color!r}")
+    return tuple(sorted((pos, color.rgba()) for pos, color in pairs))
+
+
+@lru_cache(maxsize=64)
+def _cached_brushes(stops, steps, mode):
+    positions = [pos for pos, _ in stops]
+    colors = [QtGui.QColor.fromRgba(rgba) for _, rgba in stops]
+    channels = [_to_space(c, mode) for c in colors]
+    if mode == "hsv":
+        _unwrap_hue(channels)
+
+    np = numpy_or_none() if steps >= NUMPY_MIN_STEPS else None
+    if np is not None:
+        t = np.arange(steps) / (steps - 1) if steps > 1 else np.zeros(1)
+        columns = np.array(channels, dtype=np.float64).T
+        values = [np.interp(t, positions, col) for col in columns]
+        rgba = _pack_numpy(np, values, mode).tolist()
+    else:
+        t = [i / (steps - 1) for i in range(steps)] if steps > 1 else [0.0]
+        rgba = [_pack_scalar(_interp(positions, channels, x), mode) for x in t]
+
+    return tuple(QtGui.QBrush(QtGui.QColor.fromRgba(v)) for v in rgba)
+
+
+def _to_space(color, mode):
+    r, g, b, a = color.redF(), color.greenF(), color.blueF(), color.alphaF()
+    if mode == "hsv":
+        return (*colorsys.rgb_to_hsv(r, g, b), a)
+    if mode == "oklab":
+        return (*_srgb_to_oklab(r, g, b), a)
+    return (r, g, b, a)
+
+
+def _unwrap_hue(channels):
+    """Shift hues by whole turns so consecutive stops take the shorter way round.
+
+    Grey stops have no hue of their own and borrow the neighbouring one.
+    """
+    chromatic = [c[0] for c in channels if c[1] > 0]
+    if chromatic:
+        hue = chromatic[0]
+        for i, c in enumerate(channels):
+            if c[1] > 0:
+                hue = c[0]
+            else:
+                channels[i] = (hue, *c[1:])
+    for i in range(1, len(channels)):
+        h = channels[i][0]
+        prev = channels[i - 1][0]
+        while h - prev > 0.5:
+            h -= 1.0
+        while h - prev < -0.5:
+            h += 1.0
+        channels[i] = (h, *channels[i][1:])
+
+
+def _interp(positions, channels, x):
+    i = bisect_right(positions, x)
+    if i == 0:
+        return channels[0]
+    if i == len(positions):
+        return channels[-1]
+    p0, p1 = positions[i - 1], positions[i]
+    if p1 == p0:
+        return channels[i]
+    # Same formula as numpy.interp, so both back ends round identically.
+    return tuple((b - a) / (p1 - p0) * (x - p0) + a for a, b in zip(channels[i - 1], channels[i]))
+
+
+# --- pure Python back end -------------------------------------------------
+
+def _pack_scalar(values, mode):
+    c0, c1, c2, a = values
+    if mode == "hsv":
+        r, g, b = colorsys.hsv_to_rgb(c0 % 1.0, c1, c2)
+    elif mode == "oklab":
+        r, g, b = _oklab_to_srgb(c0, c1, c2)
+    else:
+        r, g, b = c0, c1, c2
+    r, g, b, a = (min(255, max(0, round(v * 255))) for v in (r, g, b, a))
+    return (a << 24) | (r << 16) | (g << 8) | b
+
+
+def _srgb_to_linear(c):
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+
+def _linear_to_srgb(c):
+    c = min(1.0, max(0.0, c))
+    return 12.92 * c if c <= 0.0031308 else 1.055 * c ** (1 / 2.4) - 0.055
+
+
+def _srgb_to_oklab(r, g, b):
+    r, g, b = _srgb_to_linear(r), _srgb_to_linear(g), _srgb_to_linear(b)
+    l = (0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b) ** (1 / 3)
+    m = (0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b) ** (1 / 3)
+    s = (0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b) ** (1 / 3)
+    return (
+        0.2104542553 * l + 0.7936177850 * m - 0.0040720468 * s,
+        1.9779984951 * l - 2.4285922050 * m + 0.4505937099 * s,
+        0.0259040371 * l + 0.7827717662 * m - 0.8086757660 * s,
+    )
+
+
+def _oklab_to_srgb(L, a, b):
+    l = (L + 0.3963377774 * a + 0.2158037573 * b) ** 3
+    m = (L - 0.1055613458 * a - 0.0638541728 * b) ** 3
+    s = (L - 0.0894841775 * a - 1.2914855480 * b) ** 3
+    return (
+        _linear_to_srgb(4.0767416621 * l - 3.3077115913 * m + 0.2309699292 * s),
+        _linear_to_srgb(-1.2684380046 * l + 2.6097574011 * m - 0.3413193965 * s),
+        _linear_to_srgb(-0.0041960863 * l - 0.7034186147 * m + 1.7076147010 * s),
+    )
+
+
+# --- NumPy back end --------------------------------------------------------
+
+def _pack_numpy(np, values, mode):
+    c0, c1, c2, a = values
+    if mode == "hsv":
+        r, g, b = _hsv_to_rgb_numpy(np, c0 % 1.0, c1, c2)
+    elif mode == "oklab":
+        r, g, b = _oklab_to_srgb_numpy(np, c0, c1, c2)
+    else:
+        r, g, b = c0, c1, c2
+    r, g, b, a = (np.clip(np.rint(v * 255), 0, 255).astype(np.uint32) for v in (r, g, b, a))
+    return (a << 24) | (r << 16) | (g << 8) | b
+
+
+def _hsv_to_rgb_numpy(np, h, s, v):
+    i = np.floor(h * 6.0)
+    f = h * 6.0 - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    i = i.astype(np.int64) % 6
+    r = np.choose(i, [v, q, p, p, t, v])
+    g = np.choose(i, [t, v, v, q, p, p])
+    b = np.choose(i, [p, p, t, v, v, q])
+    return r, g, b
+
+
+def _oklab_to_srgb_numpy(np, L, a, b):
+    l = (L + 0.3963377774 * a + 0.2158037573 * b) ** 3
+    m = (L - 0.1055613458 * a - 0.0638541728 * b) ** 3
+    s = (L - 0.0894841775 * a - 1.2914855480 * b) ** 3
+    rgb = (
+        4.0767416621 * l - 3.3077115913 * m + 0.2309699292 * s,
+        -1.2684380046 * l + 2.6097574011 * m - 0.3413193965 * s,
+        -0.0041960863 * l - 0.7034186147 * m + 1.7076147010 * s,
+    )
+    out = []
+    for c in rgb:
+        c = np.clip(c, 0.0, 1.0)
+        out.append(np.where(c <= 0.0031308, 12.92 * c, 1.055 * c ** (1 / 2.4) - 0.055))
+    return out
@@ -1,85 +1,257 @@
-from PyQt5 import QtCore, QtGui, QtWidgets
-from PyQt5.QtCore import Qt
+import math
+import threading
 
+from qt_compat import QtCore, QtGui, QtWidgets
+from qt_compat import event_pos
+from qt_compat.QtCore import Qt
 
-class _Bar(QtWidgets.QWidget):
+from palette import gradient_brushes
+from theme import BarTheme, Themed
 
+
+class _BarState:
+    __slots__ = ("minimum", "maximum", "value", "lit", "orientation", "wheel_delta",
+                 "layers", "layers_key", "edges", "edges_key")
+
+    def __init__(self):
+        # Range and value are pushed in by PowerBar (see setRange/setValue).
+        self.minimum = 0
+        self.maximum = 99
+        self.value = 0
+        self.lit = None  # number of lit dots last sent to paint
+        self.orientation = Qt.Orientation.Horizontal
+        self.wheel_delta = 0
+        self.layers = None  # (brush, path) per color, see _dot_layers
+        self.layers_key = None
+        self.edges = None  # step boundaries along the bar, see _step_edges
+        self.edges_key = None
+
+
+class _Bar(Themed, QtWidgets.QWidget):
+    """Row (or column) of dots lighting up with the value.
+
+    Colors, padding and dot size come from a shared, interned BarTheme, so
+    bars that look the same share one set of brushes; the per-instance
+    state lives in a slotted _BarState.
+    """
+
+    default_theme = BarTheme()
+
+    # Requested value from mouse, keyboard or wheel input, snapped to a step.
     clickedValue = QtCore.pyqtSignal(int)
 
-    def __init__(self, steps, *args, **kwargs):
+    def __init__(self, steps, *args, theme=None, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.setSizePolicy(
             QtWidgets.QSizePolicy.Policy.MinimumExpanding,
             QtWidgets.QSizePolicy.Policy.MinimumExpanding
         )
+        self.setFocusPolicy(Qt.FocusPolicy.WheelFocus)
 
-        if isinstance(steps, list):
-            self.n_steps = len(steps)
-            self.steps = steps
+        if isinstance(steps, (list, tuple)):
+            colors = steps
 
         elif isinstance(steps, int):
-            self.n_steps = steps
-            self.steps = ['red'] * steps
+            colors = ['red'] * steps
 
         else:
             raise TypeError('steps must be a list or int')
 
-        self._bar_solid_percent = 0.8
-        self._background_color = QtGui.QColor('black')
-        self._padding = 4.0  # n-pixel gap around edge.
+        self._state = _BarState()
+        self._theme = (theme or self.default_theme).replace(brushes=colors)
 
-    def paintEvent(self, e):
-        painter = QtGui.QPainter(self)
+    def setRange(self, vmin, vmax):
+        state = self._state
+        state.minimum, state.maximum = vmin, vmax
+        state.lit = None
+        self.update()
 
-        brush = QtGui.QBrush()
-        brush.setColor(self._background_color)
-        brush.setStyle(Qt.BrushStyle.SolidPattern)
-        rect = QtCore.QRect(0, 0, painter.device().width(), painter.device().height())
-        painter.fillRect(rect, brush)
+    def setValue(self, value):
+        self._state.value = value
+        self._trigger_refresh()
 
-        parent = self.parent()
-        vmin, vmax = parent.minimum(), parent.maximum()
-        value = parent.value()
+    def orientation(self):
+        return self._state.orientation
 
-        d_height = painter.device().height() - (self._padding * 2)
-        d_width = painter.device().width() - (self._padding * 2)
+    def setOrientation(self, orientation):
+        """Lay the dots out left to right (Horizontal) or bottom to top (Vertical)."""
+        if orientation != self._state.orientation:
+            self._state.orientation = orientation
+            self._theme_changed()
 
-        step_size = d_width / self.n_steps
-        radius = min(step_size * self._bar_solid_percent, d_height) / 2
+    def set_steps(self, colors):
+        """Parse step colors once; dots of the same color are painted as one path."""
+        self.set_brushes([c if isinstance(c, QtGui.QBrush) else QtGui.QBrush(QtGui.QColor(c)) for c in colors])
 
-        pc = (value - vmin) / (vmax - vmin)
-        n_steps_to_draw = int(pc * self.n_steps)
+    def set_brushes(self, brushes):
+        """Use ready-made brushes (e.g. from ``palette.gradient_brushes``) as they are."""
+        self.set_theme(self._theme.replace(brushes=brushes))
 
-        for n in range(n_steps_to_draw):
-            brush.setColor(QtGui.QColor(self.steps[n]))
-            cx = int(self._padding + n * step_size + step_size / 2)
-            cy = int(self._padding + d_height / 2)
-            painter.setBrush(brush)
-            painter.setPen(QtCore.Qt.PenStyle.NoPen)
-            painter.drawEllipse(QtCore.QPoint(cx, cy), int(radius), int(radius))
+    def _theme_changed(self):
+        state = self._state
+        state.layers = None
+        state.lit = None
+        self.updateGeometry()
+        self.update()
 
+    @property
+    def n_steps(self):
+        return len(self._theme.brushes)
+
+    @property
+    def steps(self):
+        return [brush.color() for brush in self._theme.brushes]
+
+    def _is_horizontal(self):
+        return self._state.orientation == Qt.Orientation.Horizontal
+
+    def _step_edges(self, length):
+        """Positions of the ``n_steps + 1`` step boundaries along a bar ``length`` long.
+
+        Measured from the start of the bar (left, or bottom when vertical) and
+        rebuilt only when the length, padding or number of steps changes.
+        """
+        state, padding, n_steps = self._state, self._theme.padding, self.n_steps
+        key = (length, padding, n_steps)
+        if key != state.edges_key:
+            step_size = (length - padding * 2) / max(1, n_steps)
+            state.edges = [padding + n * step_size for n in range(n_steps + 1)]
+            state.edges_key = key
+        return state.edges
+
+    def _length(self, width=None, height=None):
+        if self._is_horizontal():
+            return self.width() if width is None else width
+        return self.height() if height is None else height
+
+    def _dot_layers(self, width, height):
+        """(brush, path) per distinct color, rebuilt only when geometry or colors change."""
+        state, theme = self._state, self._theme
+        key = (width, height, theme)
+        if state.layers is None or key != state.layers_key:
+            horizontal = self._is_horizontal()
+            length, thickness = (width, height) if horizontal else (height, width)
+            d_thickness = thickness - (theme.padding * 2)
+            d_length = length - (theme.padding * 2)
+
+            step_size = d_length / self.n_steps
+            radius = int(min(step_size * theme.solid_percent, d_thickness) / 2)
+            across = int(theme.padding + d_thickness / 2)
+
+            groups = {}
+            for n, brush in enumerate(theme.brushes):
+                along = int(theme.padding + n * step_size + step_size / 2)
+                center = QtCore.QPointF(along, across) if horizontal else QtCore.QPointF(across, length - along)
+                rgba = brush.color().rgba()
+                if rgba not in groups:
+                    groups[rgba] = (brush, QtGui.QPainterPath())
+                groups[rgba][1].addEllipse(center, radius, radius)
+
+            state.layers = list(groups.values())
+            state.layers_key = key
+        return state.layers
+
+    def _step_x(self, n, width=None):
+        """Start edge of step ``n`` along the bar; dots never cross their step's boundaries."""
+        width = self._length() if width is None else width
+        padding = self._theme.padding
+        return padding + n * (width - padding * 2) / self.n_steps
+
+    def _lit_rect(self, n_lit, width, height):
+        """Rectangle covering the first ``n_lit`` steps."""
+        if self._is_horizontal():
+            return QtCore.QRectF(0, 0, self._step_x(n_lit, width), height)
+        end = self._step_x(n_lit, height)
+        return QtCore.QRectF(0, height - end, width, end)
+
+    def _lit_steps(self):
+        state = self._state
+        vmin, vmax = state.minimum, state.maximum
+        if vmax <= vmin:
+            return 0
+        # Integer arithmetic for int values, so _value_for_lit round-trips exactly.
+        return int((state.value - vmin) * self.n_steps // (vmax - vmin))
+
+    def _value_for_lit(self, lit):
+        """Smallest value that lights ``lit`` steps."""
+        state = self._state
+        vmin, vmax = state.minimum, state.maximum
+        lit = min(max(lit, 0), self.n_steps)
+        if vmax <= vmin or not self.n_steps:
+            return vmin
+        return min(vmax, vmin + math.ceil(lit * (vmax - vmin) / self.n_steps))
+
+    def _lit_at(self, pos):
+        """Lit steps for a pointer at ``pos``, snapped to the nearest step boundary in O(1)."""
+        n = self.n_steps
+        if not n:
+            return 0
+        if self._is_horizontal():
+            length = self.width()
+            along = pos.x()
+        else:
+            length = self.height()
+            along = length - pos.y()
+        edges = self._step_edges(length)
+        step_size = (edges[-1] - edges[0]) / n
+        if step_size <= 0:
+            return 0
+        cell = min(max(int((along - edges[0]) // step_size), 0), n - 1)
+        return cell + (along >= (edges[cell] + edges[cell + 1]) / 2)
+
+    def _request_lit(self, lit, direction=0):
+        state = self._state
+        value = self._value_for_lit(lit)
+        if direction and value == state.value:
+            # Fewer values than steps: move by at least one value.
+            value = min(max(value + direction, state.minimum), state.maximum)
+        self.clickedValue.emit(int(value))
+
+    def paintEvent(self, e):
+        painter = QtGui.QPainter(self)
+        lit = self._state.lit = self._lit_steps()
+        self._draw(painter, self.width(), self.height(), lit, QtCore.QRectF(e.rect()))
         painter.end()
 
-    def sizeHint(self):
-        return QtCore.QSize(200, 60)
+    def _draw(self, painter, width, height, n_steps_to_draw, exposed):
+        """Paint background and the first ``n_steps_to_draw`` dots at the painter's origin."""
+        painter.fillRect(exposed, self._theme.background)
+        if n_steps_to_draw > 0 and self.n_steps:
+            lit_rect = self._lit_rect(n_steps_to_draw, width, height)
+            painter.save()
+            painter.setClipRect(lit_rect.intersected(exposed), Qt.ClipOperation.IntersectClip)
+            painter.setPen(QtCore.Qt.PenStyle.NoPen)
+            for brush, path in self._dot_layers(width, height):
+                painter.fillPath(path, brush)
+            painter.restore()
 
     def sizeHint(self):
+        if self._is_horizontal():
+            return QtCore.QSize(200, 60)
         return QtCore.QSize(40, 120)
 
     def _trigger_refresh(self):
-        self.update()
+        state = self._state
+        lit = self._lit_steps()
+        if lit == state.lit:
+            return
+        if state.lit is None or not self.n_steps:
+            self.update()
+        else:
+            # Only the dots between the old and the new value change.
+            lo, hi = sorted((lit, state.lit))
+            edges = self._step_edges(self._length())
+            start, end = int(edges[lo]), int(edges[hi]) + 2
+            if self._is_horizontal():
+                self.update(start, 0, end - start, self.height())
+            else:
+                height = self.height()
+                self.update(0, height - end, self.width(), end - start)
+        state.lit = lit
 
     def _calculate_clicked_value(self, e):
-        parent = self.parent()
-        vmin, vmax = parent.minimum(), parent.maximum()
-        d_height = self.size().height() + (self._padding * 2)
-        step_size = d_height / self.n_steps
-        click_y = e.y() - self._padding - step_size / 2
-
-        pc = (d_height - click_y) / d_height
-        value = vmin + pc * (vmax - vmin)
-        self.clickedValue.emit(value)
+        self._request_lit(self._lit_at(event_pos(e)))
 
     def mouseMoveEvent(self, e):
         self._calculate_clicked_value(e)
@@ -87,59 +259,172 @@ class _Bar(QtWidgets.QWidget):
     def mousePressEvent(self, e):
         self._calculate_clicked_value(e)
 
+    def keyPressEvent(self, e):
+        page = max(1, self.n_steps // 10)
+        moves = {
+            Qt.Key.Key_Right: 1, Qt.Key.Key_Up: 1,
+            Qt.Key.Key_Left: -1, Qt.Key.Key_Down: -1,
+            Qt.Key.Key_PageUp: page, Qt.Key.Key_PageDown: -page,
+        }
+        key = e.key()
+        if key == Qt.Key.Key_Home:
+            self._request_lit(0)
+        elif key == Qt.Key.Key_End:
+            self._request_lit(self.n_steps)
+        elif key in moves:
+            self._request_lit(self._lit_steps() + moves[key], 1 if moves[key] > 0 else -1)
+        else:
+            super().keyPressEvent(e)
+
+    def wheelEvent(self, e):
+        state, delta = self._state, e.angleDelta()
+        # Touchpads send fractions of a notch; one step per accumulated notch.
+        state.wheel_delta += delta.y() or delta.x()
+        notches = int(state.wheel_delta / 120)
+        if notches:
+            state.wheel_delta -= notches * 120
+            self._request_lit(self._lit_steps() + notches, 1 if notches > 0 else -1)
+        e.accept()
+
 
 class PowerBar(QtWidgets.QWidget):
    
     colorChanged = QtCore.pyqtSignal()
+    _flushRequested = QtCore.pyqtSignal()
 
     def __init__(self, steps=10, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        colors = []
-        for i in range(steps):
-            r = int(255 - (255 * i / (steps - 1)))
-            g = int(255 * i / (steps - 1))
-            b = 0
-            colors.append(QtGui.QColor(r, g, b).name())
-
         layout = QtWidgets.QVBoxLayout()
-        self._bar = _Bar(colors) 
+        self._bar = _Bar(gradient_brushes(('red', 'lime'), steps))
         layout.addWidget(self._bar)
 
         self._dial = QtWidgets.QDial()
         self._dial.setNotchesVisible(True)
         self._dial.setWrapping(False)
-        self._dial.valueChanged.connect(self._bar._trigger_refresh)
+        self._bar.setRange(self._dial.minimum(), self._dial.maximum())
+        self._bar.setValue(self._dial.value())
+        self._dial.rangeChanged.connect(self._bar.setRange)
+        self._dial.valueChanged.connect(self._bar.setValue)
 
-        self._bar.clickedValue.connect(self._dial.setValue)
+        self._bar.clickedValue.connect(self._on_clicked_value)
 
         layout.addWidget(self._dial)
         self.setLayout(layout)
 
-
-    def __getattr__(self, name):
-        if name in self.__dict__:
-            return self[name]
-
-        return getattr(self._dial, name)
+        # Values queued by setValueAsync / coalesced drags, applied by _flush_pending.
+        self._value_lock = threading.Lock()
+        self._pending_value = None
+        self._pending_count = 0
+        self._flush_scheduled = False
+        self._coalescing = False
+        self._dropped_updates = 0
+        self._coalesced_updates = 0
+
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self._flush_pending)
+        self._flushRequested.connect(self._schedule_flush)
 
     def setColor(self, color):
-        self._bar.steps = [color] * self._bar.n_steps
-        self._bar.update()
+        self._bar.set_steps([color] * self._bar.n_steps)
 
     def setColors(self, colors):
-        self._bar.n_steps = len(colors)
-        self._bar.steps = colors
-        self._bar.update()
+        self._bar.set_steps(colors)
+
+    def setGradient(self, stops, mode='rgb', steps=None):
+        """Color the steps with a cached ``palette`` gradient (see palette.MODES)."""
+        self._bar.set_brushes(gradient_brushes(stops, steps or self._bar.n_steps, mode))
 
     def setBarPadding(self, i):
-        self._bar._padding = int(i)
-        self._bar.update()
+        self._bar.set_theme(self._bar.theme().replace(padding=int(i)))
+
+    def setBarOrientation(self, orientation):
+        """Qt.Orientation.Horizontal (default) or Qt.Orientation.Vertical."""
+        self._bar.setOrientation(orientation)
 
     def setBarSolidPercent(self, f):
-        self._bar._bar_solid_percent = float(f)
-        self._bar.update()
+        self._bar.set_theme(self._bar.theme().replace(solid_percent=f))
 
     def setBackgroundColor(self, color):
-        self._bar._background_color = QtGui.QColor(color)
-        self._bar.update()
+        self._bar.set_theme(self._bar.theme().replace(background=color))
+
+    def setCoalescing(self, interval_ms=16):
+        """Apply at most one value per ``interval_ms`` (about one frame at 60 Hz).
+
+        Drag and ``setValueAsync`` values arriving in between replace the
+        pending one, so the bar always ends on the latest value. Pass ``None``
+        to apply mouse input immediately again.
+        """
+        self._coalescing = interval_ms is not None
+        self._flush_timer.setInterval(interval_ms or 0)
+
+    def setValueAsync(self, value):
+        """Thread-safe setValue; the value is applied later in the GUI thread."""
+        with self._value_lock:
+            if self._pending_count:
+                self._dropped_updates += 1
+            self._pending_value = int(value)
+            self._pending_count += 1
+            schedule = not self._flush_scheduled
+            self._flush_scheduled = True
+        if schedule:
+            # Queued to the GUI thread when emitted from a worker thread.
+            self._flushRequested.emit()
+
+    def droppedUpdates(self):
+        """Values replaced by a newer one before they were applied."""
+        return self._dropped_updates
+
+    def coalescedUpdates(self):
+        """Refreshes that merged more than one incoming value."""
+        return self._coalesced_updates
+
+    def _on_clicked_value(self, value):
+        if self._coalescing:
+            self.setValueAsync(value)
+        else:
+            self._dial.setValue(value)
+
+    def _schedule_flush(self):
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_pending(self):
+        with self._value_lock:
+            value, count = self._pending_value, self._pending_count
+            self._pending_value = None
+            self._pending_count = 0
+            self._flush_scheduled = False
+        if count > 1:
+            self._coalesced_updates += 1
+        if count:
+            self._dial.setValue(value)
+
+
+def _forward_to_dial(name):
+    """Build a PowerBar attribute that forwards ``name`` to the wrapped QDial."""
+    attr = getattr(QtWidgets.QDial, name)
+
+    if isinstance(attr, QtCore.pyqtSignal):
+        return property(lambda self: getattr(self._dial, name), doc=f"QDial.{name} signal.")
+
+    if callable(attr) and not isinstance(attr, type):
+        def method(self, *args):
+            return attr(self._dial, *args)
+        method.__name__ = method.__qualname__ = name
+        method.__doc__ = f"Forwarded to QDial.{name}()."
+        return method
+
+    return attr  # enums and enum values
+
+
+# Expose the QDial/QAbstractSlider API on PowerBar once, at import time,
+# instead of resolving every call through __getattr__.
+for _name in dir(QtWidgets.QDial):
+    if not _name.startswith('_') and not hasattr(QtWidgets.QWidget, _name) \
+            and _name not in PowerBar.__dict__:
+        setattr(PowerBar, _name, _forward_to_dial(_name))
+del _name
@@ -0,0 +1,63 @@
+"""Single place that picks the Qt binding for every module in the project.
+
+The binding is chosen by the ``QT_API`` environment variable (``pyqt6`` or
+``pyqt5``); without it an already imported binding is reused, otherwise
+PyQt6 is preferred and PyQt5 is the fallback. Modules import Qt only via
+
+    from qt_compat import QtCore, QtGui, QtWidgets, Qt
+
+so the whole application runs on one binding. The binding's submodules are
+also registered as ``qt_compat.QtCore`` etc., so existing imports of the
+form ``from qt_compat.QtWidgets import QWidget`` work unchanged.
+"""
+import importlib
+import os
+import sys
+
+BINDINGS = ("pyqt6", "pyqt5")
+_MODULES = {"pyqt6": "PyQt6", "pyqt5": "PyQt5"}
+
+
+def _choose():
+    requested = os.environ.get("QT_API", "").lower()
+    if requested:
+        if requested not in _MODULES:
+            raise ImportError(f"QT_API={requested!r} is not supported, use one of {BINDINGS}")
+        return [requested]
+    for api, package in _MODULES.items():
+        if package in sys.modules:
+            return [api]
+    return list(BINDINGS)
+
+
+def _load():
+    errors = []
+    for api in _choose():
+        package = _MODULES[api]
+        try:
+            core = importlib.import_module(f"{package}.QtCore")
+            gui = importlib.import_module(f"{package}.QtGui")
+            widgets = importlib.import_module(f"{package}.QtWidgets")
+        except ImportError as exc:
+            errors.append(f"{package}: {exc}")
+            continue
+        return api, core, gui, widgets
+    raise ImportError("no usable Qt binding found (" + "; ".join(errors) + ")")
+
+
+API, QtCore, QtGui, QtWidgets = _load()
+for _module in (QtCore, QtGui, QtWidgets):
+    sys.modules[f"{__name__}.{_module.__name__.rsplit('.', 1)[1]}"] = _module
+del _module
+
+Qt = QtCore.Qt
+Signal = QtCore.pyqtSignal
+Slot = QtCore.pyqtSlot
+Property = QtCore.pyqtProperty
+
+
+def event_pos(event):
+    """Local position of a mouse/wheel event as QPointF."""
+    if API == "pyqt6":
+        return event.position()
+    return event.localPos() if hasattr(event, "localPos") else QtCore.QPointF(event.pos())
@@ -0,0 +1,53 @@
+"""Synthetic mouse, key and wheel events for PowerBar's _Bar.
+
+Shared by tests/test_power_bar_input.py and benchmarks/power_bar_input.py.
+"""
+from qt_compat import QtCore, QtGui, QtWidgets
+from qt_compat.QtCore import Qt
+
+from power_bar import PowerBar
+
+ORIENTATIONS = (("horizontal", Qt.Orientation.Horizontal), ("vertical", Qt.Orientation.Vertical))
+
+
+def _global(bar, pos):
+    return QtCore.QPointF(bar.mapToGlobal(pos.toPoint()))
+
+
+def mouse(bar, kind, x, y):
+    pos = QtCore.QPointF(x, y)
+    released = kind == QtCore.QEvent.Type.MouseButtonRelease
+    buttons = Qt.MouseButton.NoButton if released else Qt.MouseButton.LeftButton
+    event = QtGui.QMouseEvent(kind, pos, _global(bar, pos), Qt.MouseButton.LeftButton,
+                              buttons, Qt.KeyboardModifier.NoModifier)
+    QtWidgets.QApplication.sendEvent(bar, event)
+
+
+def key(bar, code):
+    event = QtGui.QKeyEvent(QtCore.QEvent.Type.KeyPress, code, Qt.KeyboardModifier.NoModifier)
+    QtWidgets.QApplication.sendEvent(bar, event)
+
+
+def wheel(bar, delta):
+    pos = QtCore.QPointF(bar.width() / 2, bar.height() / 2)
+    event = QtGui.QWheelEvent(pos, _global(bar, pos), QtCore.QPoint(), QtCore.QPoint(0, delta),
+                              Qt.MouseButton.NoButton, Qt.KeyboardModifier.NoModifier,
+                              Qt.ScrollPhase.NoScrollPhase, False)
+    QtWidgets.QApplication.sendEvent(bar, event)
+
+
+def make_power_bar(steps, orientation, size=(400, 400)):
+    """A shown PowerBar and its _Bar."""
+    widget = PowerBar(steps)
+    widget.setBarOrientation(orientation)
+    widget.resize(*size)
+    widget.show()
+    QtWidgets.QApplication.processEvents()
+    return widget, widget._bar
+
+
+def bar_point(bar, along):
+    """Widget coordinates ``along`` pixels from the start of the bar."""
+    if bar.orientation() == Qt.Orientation.Horizontal:
+        return along, bar.height() / 2
+    return bar.width() / 2, bar.height() - along
@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+from qt_compat.QtCore import QEasingCurve
+
+import curves
+from cw3 import PULSE_WAVE, pulse_intensities, pulse_intensity_exact
+
+TOLERANCE = 1e-4
+EASINGS = ("InOutCubic", "OutCubic", "InOutQuad", "OutBack")
+
+
+def _pulse_inputs(n, seed=1):
+    rng = random.Random(seed)
+    progress = [rng.random() for _ in range(n)]
+    return progress, [p * 600 for p in progress]  # 10-minute countdown
+
+
+def test_pulse_wave_table_error():
+    assert PULSE_WAVE.max_error() < TOLERANCE
+
+
+@pytest.mark.parametrize("name", EASINGS)
+def test_easing_table_error(qapp, name):
+    table = curves.easing_table(getattr(QEasingCurve.Type, name))
+    assert table.max_error(samples=20_000) < TOLERANCE
+
+
+def test_pulse_intensities_list_path():
+    progress, times = _pulse_inputs(curves.NUMPY_MIN_BATCH - 1)
+    values = pulse_intensities(progress, times)
+    assert isinstance(values, list)
+    for v, p, t in zip(values, progress, times):
+        assert v == pytest.approx(pulse_intensity_exact(p, t), abs=TOLERANCE)
+
+
+def test_pulse_intensities_numpy_path():
+    np = pytest.importorskip("numpy")
+    progress, times = _pulse_inputs(20_000)
+    values = pulse_intensities(progress, times)
+    assert isinstance(values, np.ndarray)
+    exact = [pulse_intensity_exact(p, t) for p, t in zip(progress, times)]
+    assert float(np.max(np.abs(values - exact))) < TOLERANCE
+
+
+def test_clamped_outside_unit_interval():
+    table = curves.CurveTable(lambda x: x * x, 64)
+    assert table(-0.5) == table(0.0) == 0.0
+    assert table(1.5) == table(1.0) == 1.0
+    small = table.evaluate([-0.5, 1.5])
+    assert list(small) == [0.0, 1.0]
+    large = table.evaluate([-0.5, 1.5] * curves.NUMPY_MIN_BATCH)
+    assert [float(v) for v in large[:2]] == [0.0, 1.0]
+
+
+def test_periodic_wraps_outside_unit_interval():
+    xs = [-1.75, -0.25, 1.25, 3.5]
+    for x in xs:
+        assert PULSE_WAVE(x) == pytest.approx(PULSE_WAVE(x % 1.0), abs=1e-12)
+    wrapped = [PULSE_WAVE(x % 1.0) for x in xs]
+    assert list(PULSE_WAVE.evaluate(xs)) == pytest.approx(wrapped, abs=1e-12)
+    batch = PULSE_WAVE.evaluate(xs * curves.NUMPY_MIN_BATCH)
+    assert [float(v) for v in batch[:4]] == pytest.approx(wrapped, abs=1e-12)
@@ -0,0 +1,21 @@
+from batch_render import TimerScene
+from countdown import ManualClock
+from cw3 import FrameClock
+from dashboard import TimerDashboard
+
+
+def _digits(display):
+    return [d._state.value for d in (display.d1, display.d2, display.d3, display.d4)]
+
+
+def test_tiles_over_100_minutes_show_hours(qapp):
+    dashboard = TimerDashboard(frame_clock=FrameClock(clock=ManualClock()))
+    display = dashboard.add_timer(2 * 3600 + 5 * 60)
+    assert _digits(display) == [0, 2, 0, 5]
+
+
+def test_timer_scene_shows_hours(qapp):
+    scene = TimerScene(seconds=2 * 3600 + 5 * 60)
+    widget = scene.build()
+    scene.seek(0.0)
+    assert _digits(widget) == [0, 2, 0, 5]
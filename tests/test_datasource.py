@@ -0,0 +1,91 @@
+import time
+
+import pytest
+
+from datasource import AsyncFeed, Snapshot, SnapshotBinder, StandInSource, ThreadedFeed
+
+
+def test_publish_merges_and_bumps_version():
+    snapshot = Snapshot()
+    assert snapshot.latest() == (0, {})
+    snapshot.publish({"a": 1, "b": 2})
+    snapshot.publish({"b": 3})
+    assert snapshot.latest() == (2, {"a": 1, "b": 3})
+    assert snapshot.published == 3
+
+
+def test_publish_keeps_earlier_values_untouched():
+    snapshot = Snapshot()
+    snapshot.publish({"a": 1})
+    _, before = snapshot.latest()
+    snapshot.publish({"a": 2})
+    assert before == {"a": 1}
+    snapshot.publish({})
+    assert snapshot.version == 2
+
+
+def test_apply_pushes_only_changed_values(qapp):
+    snapshot = Snapshot()
+    binder = SnapshotBinder(snapshot)
+    seen = {"a": [], "b": []}
+    binder.bind("a", seen["a"].append)
+    binder.bind("b", seen["b"].append)
+    snapshot.publish({"a": 1})
+    binder.apply()
+    binder.apply()  # same version, nothing to do
+    snapshot.publish({"a": 1, "b": 5})
+    binder.apply()
+    snapshot.publish({"a": 2})
+    binder.apply()
+    assert seen == {"a": [1, 2], "b": [5]}
+    assert binder.applied == 3
+    binder.unbind("a")
+    binder.unbind("b")
+    assert not binder._timer.isActive()
+
+
+def test_bound_widgets_show_latest_values(qapp):
+    from animated_toggle import AnimatedToggle
+    from power_bar import PowerBar
+
+    snapshot = Snapshot()
+    binder = SnapshotBinder(snapshot)
+    bar, toggle = PowerBar(10), AnimatedToggle()
+    binder.bind_power_bar("bar", bar)
+    binder.bind_toggle("toggle", toggle)
+    for value in (10, 40, 73):
+        snapshot.publish({"bar": value, "toggle": value % 2 == 1})
+    binder.apply()
+    assert bar.value() == 73
+    assert toggle.isChecked()
+
+
+@pytest.mark.parametrize("feed_class", [ThreadedFeed, AsyncFeed])
+def test_feed_start_publishes_and_stop_joins(feed_class):
+    snapshot = Snapshot()
+    source = StandInSource([f"k{i}" for i in range(4)], rate=10_000)
+    feed = feed_class(snapshot, [source])
+    feed.start()
+    feed.start()  # already running: no second worker
+    thread = feed._thread
+    deadline = time.monotonic() + 5
+    while len(snapshot.latest()[1]) < 4 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    feed.stop()
+    assert not thread.is_alive()
+    assert feed._thread is None
+    assert set(snapshot.latest()[1]) == set(source.keys)
+    version, cycles = snapshot.version, feed.cycles
+    time.sleep(0.02)
+    assert (snapshot.version, feed.cycles) == (version, cycles)
+    feed.stop()  # stopping twice is harmless
+
+
+@pytest.mark.parametrize("feed_class", [ThreadedFeed, AsyncFeed])
+def test_feed_stop_right_after_start_returns(feed_class):
+    for _ in range(20):
+        feed = feed_class(Snapshot(), [StandInSource(["k"], rate=1000)])
+        feed.start()
+        thread = feed._thread
+        feed.stop()
+        assert not thread.is_alive()
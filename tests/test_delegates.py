@@ -0,0 +1,43 @@
+from qt_compat.QtCore import QEvent, QPointF, Qt
+from qt_compat.QtGui import QMouseEvent, QStandardItem, QStandardItemModel
+from qt_compat.QtWidgets import QStyleOptionViewItem, QTableView
+
+from animated_toggle import ToggleAnimator
+from countdown import ManualClock
+from delegates import ToggleDelegate
+
+
+def _click(delegate, view, index):
+    option = QStyleOptionViewItem()
+    option.rect = view.visualRect(index)
+    option.widget = view
+    pos = QPointF(option.rect.center())
+    event = QMouseEvent(QEvent.Type.MouseButtonRelease, pos, pos, Qt.MouseButton.LeftButton,
+                        Qt.MouseButton.NoButton, Qt.KeyboardModifier.NoModifier)
+    return delegate.editorEvent(event, view.model(), option, index)
+
+
+def test_finished_rows_are_dropped_without_repaint(qapp):
+    model = QStandardItemModel(1000, 1)
+    for row in range(1000):
+        item = QStandardItem()
+        item.setCheckable(True)
+        model.setItem(row, 0, item)
+    view = QTableView()
+    view.setModel(model)
+    clock = ManualClock()
+    animator = ToggleAnimator(clock=clock)
+    delegate = ToggleDelegate(view, animator=animator)
+    view.setItemDelegateForColumn(0, delegate)
+    view.resize(200, 300)
+
+    for row in range(3):
+        assert _click(delegate, view, model.index(row, 0))
+    assert len(delegate._rows) == 3
+    assert model.item(0).checkState() == Qt.CheckState.Checked
+
+    view.scrollToBottom()  # animowane wiersze poza widokiem - bez paint()
+    clock.advance(1.0)
+    animator.advance()
+    assert len(animator) == 0
+    assert delegate._rows == {}
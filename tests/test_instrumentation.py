@@ -0,0 +1,39 @@
+import time
+
+from instrumentation import DEFAULT_TARGETS, DROPPED, TIMER, Instrumentation
+
+
+class _Ticker:
+    def tick(self):
+        pass
+
+
+def _run(interval_ms):
+    instr = Instrumentation(capacity=64)
+    instr.instrument(_Ticker, "tick", TIMER, interval_ms)
+    try:
+        ticker = _Ticker()
+        for _ in range(3):
+            ticker.tick()
+            time.sleep(0.01)
+    finally:
+        instr.disable()
+    return instr
+
+
+def test_fixed_interval_timer_reports_late_calls_as_dropped():
+    instr = _run(1)
+    assert any(r[0] == DROPPED for r in instr.buffer.snapshot())
+    assert instr.summary()["_Ticker.tick"]["dropped_frames"] > 0
+
+
+def test_timer_without_interval_is_never_dropped():
+    instr = _run(None)
+    assert not any(r[0] == DROPPED for r in instr.buffer.snapshot())
+    assert instr.summary() == {"_Ticker.tick": {"calls": 3}}
+    assert "args" not in instr.chrome_trace()["traceEvents"][0]
+
+
+def test_adaptive_window_callbacks_have_no_expected_interval():
+    for method in ("_tick", "_pulse_tick"):
+        assert (TIMER, "MainWindow", method, None) in DEFAULT_TARGETS["cw3"]
@@ -0,0 +1,46 @@
+import pytest
+
+import meter_bank
+from meter_bank import MeterBank
+
+
+@pytest.fixture(params=["numpy", "array"])
+def bank(qapp, request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(meter_bank, "np", None)
+    bank = MeterBank(4, 10)
+    bank.update = lambda *args: setattr(bank, "updates", bank.updates + 1)
+    bank.updates = 0
+    yield bank
+    bank.close()
+
+
+def test_idle_bank_stops_peak_timer(bank):
+    bank.setPeakHold(100, 1.0)
+    assert not bank._timer.isActive()
+    bank.setValues([0.5] * 4)
+    bank.advance(0.016)
+    assert not bank._timer.isActive()
+    bank.updates = 0
+    bank.advance(0.016)
+    assert bank.updates == 0
+
+
+def test_peak_is_held_then_decays_and_timer_stops(bank):
+    bank.setPeakHold(100, 1.0)
+    bank.setValues([0.8, 0.0, 0.0, 0.0])
+    bank.setValue(0, 0.2)
+    bank._wake_peaks()  # jak z paintEvent
+    assert bank._timer.isActive()
+    bank.updates = 0
+    bank.advance(0.05)  # w oknie przytrzymania
+    assert bank.peaks()[0] == pytest.approx(0.8)
+    assert bank.updates == 0
+    bank.advance(0.06)
+    assert bank.peaks()[0] == pytest.approx(0.74)
+    assert bank.updates == 1
+    bank.advance(1.0)
+    assert bank.peaks()[0] == pytest.approx(0.2)
+    assert not bank._timer.isActive()
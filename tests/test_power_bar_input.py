@@ -0,0 +1,73 @@
+import pytest
+
+from qt_compat.QtCore import QEvent, Qt
+
+from input_events import ORIENTATIONS, bar_point, key, make_power_bar, mouse, wheel
+
+PRESS, MOVE, RELEASE = (QEvent.Type.MouseButtonPress, QEvent.Type.MouseMove,
+                        QEvent.Type.MouseButtonRelease)
+
+
+@pytest.fixture(params=[orientation for _, orientation in ORIENTATIONS],
+                ids=[name for name, _ in ORIENTATIONS])
+def bar10(qapp, request):
+    widget, bar = make_power_bar(10, request.param)
+    yield widget, bar
+    widget.close()
+
+
+def test_press_snaps_to_nearest_step(bar10):
+    widget, bar = bar10
+    edges = bar._step_edges(bar._length())
+    mouse(bar, PRESS, *bar_point(bar, 0))
+    assert widget.value() == 0
+    mouse(bar, PRESS, *bar_point(bar, edges[3] + 1))
+    assert bar._lit_steps() == 3
+    mouse(bar, PRESS, *bar_point(bar, edges[4] - 1))
+    assert bar._lit_steps() == 4
+
+
+def test_drag_past_end_clamps_and_emits_ints(bar10):
+    widget, bar = bar10
+    edges = bar._step_edges(bar._length())
+    emitted = []
+    bar.clickedValue.connect(emitted.append)
+    mouse(bar, PRESS, *bar_point(bar, 0))
+    for along in (edges[5], edges[8], edges[10] + 500):
+        mouse(bar, MOVE, *bar_point(bar, along))
+    assert widget.value() == widget.maximum()
+    mouse(bar, RELEASE, *bar_point(bar, edges[10] + 500))
+    assert emitted and {type(v) for v in emitted} == {int}
+
+
+def test_keys_move_one_step(bar10):
+    widget, bar = bar10
+    key(bar, Qt.Key.Key_Home)
+    assert widget.value() == 0
+    key(bar, Qt.Key.Key_Right)
+    key(bar, Qt.Key.Key_Up)
+    assert bar._lit_steps() == 2
+    key(bar, Qt.Key.Key_Down)
+    assert bar._lit_steps() == 1
+    key(bar, Qt.Key.Key_End)
+    assert widget.value() == widget.maximum()
+
+
+def test_wheel_accumulates_notches(bar10):
+    widget, bar = bar10
+    key(bar, Qt.Key.Key_End)
+    wheel(bar, -240)
+    assert bar._lit_steps() == 8
+    wheel(bar, 60)
+    wheel(bar, 60)
+    assert bar._lit_steps() == 9
+
+
+def test_keys_move_value_when_steps_exceed_values(qapp):
+    widget, bar = make_power_bar(1000, Qt.Orientation.Horizontal)
+    key(bar, Qt.Key.Key_Home)
+    key(bar, Qt.Key.Key_Right)
+    key(bar, Qt.Key.Key_Left)
+    key(bar, Qt.Key.Key_Right)
+    assert widget.value() == 1
+    widget.close()
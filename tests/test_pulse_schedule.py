@@ -0,0 +1,158 @@
+import math
+
+import pytest
+
+from countdown import Countdown, CountdownDriver, ManualClock
+from cw3 import (PULSE_THRESHOLD, FrameClock, MainWindow, pulse_intensity, pulse_intensity_exact,
+                 pulse_interval)
+
+
+def test_paused_countdown_with_listener_keeps_default_interval(qapp):
+    clock = ManualClock(10.0)
+    frame_clock = FrameClock(clock=clock)
+    frame_clock.frameAdvanced.connect(lambda now: None)
+    countdown = Countdown(30, clock)
+    countdown.start()
+    frame_clock.add(countdown)
+    countdown.stop()
+    frame_clock._timer.stop()  # jak po timeout() jednorazowego timera
+    frame_clock.tick()  # advance() zwraca math.inf
+    assert frame_clock._timer.isActive()
+    assert frame_clock._timer.interval() == frame_clock.interval_ms
+
+
+def test_paused_countdown_without_listener_sleeps(qapp):
+    clock = ManualClock(10.0)
+    frame_clock = FrameClock(clock=clock)
+    countdown = Countdown(30, clock)
+    countdown.start()
+    frame_clock.add(countdown)
+    countdown.stop()
+    frame_clock._timer.stop()
+    frame_clock.tick()
+    assert not frame_clock._timer.isActive()
+
+
+def _worst_change(intensity, a, b, total):
+    """Largest change of ``intensity`` between frames at ``a`` and ``b`` (sampled every 2 ms)."""
+    base = intensity(min(1.0, a / total), a)
+    steps = max(2, int((b - a) / 0.002))
+    return max(abs(intensity(min(1.0, t / total), t) - base)
+               for t in (a + (b - a) * k / steps for k in range(1, steps + 1)))
+
+
+def test_pulse_interval_stays_within_threshold():
+    total = 600
+    for k in range(0, 6000, 7):
+        t = k / 10
+        interval = pulse_interval(t / total, t, total)
+        assert 0.04 <= interval <= 0.5
+        if interval > 0.04:  # krok minimalny - szybciej puls nie jest odświeżany
+            assert _worst_change(pulse_intensity_exact, t, t + interval, total) <= PULSE_THRESHOLD + 1e-9
+
+
+def test_driver_advance_returns_soonest_wake():
+    clock = ManualClock(0.0)
+    driver = CountdownDriver(clock)
+    slow, fast = Countdown(30, clock), Countdown(30, clock)
+    slow.start()
+    fast.start()
+    driver.add(slow, on_frame=lambda now: 0.3)
+    assert driver.advance() == pytest.approx(0.3)
+    driver.add(fast)  # bez on_frame - najbliższa zmiana pełnej sekundy
+    clock.advance(0.75)
+    assert driver.advance() == pytest.approx(0.25)
+    driver.add(fast, on_frame=lambda now: None)  # None - co klatkę
+    assert driver.advance() == 0.0
+    slow.stop()
+    fast.stop()
+    assert driver.advance() == math.inf
+
+
+def _run_window(window, frame_clock, clock, until, frames):
+    """Ticks frame_clock at the times its timer asks for until ``until`` or the end."""
+    while frame_clock._timer.isActive():
+        interval = frame_clock._timer.interval() / 1000
+        if clock.now + interval > until:
+            return
+        frame_clock._timer.stop()  # klatkami steruje test, nie prawdziwy czas
+        clock.advance(interval)
+        frame_clock.tick()
+        if window._pulse_visible():
+            frames.append(clock.now)
+
+
+@pytest.fixture
+def pulse_window(qapp):
+    clock = ManualClock(1000.0)
+    frame_clock = FrameClock(clock=clock, adaptive=True)
+    window = MainWindow(frame_clock)
+    window.resize(480, 200)
+    window.show()
+    qapp.processEvents()
+    yield window, frame_clock, clock
+    window.close()
+
+
+def _opacity(window):
+    return window.display._digits[0]._state.opacity
+
+
+def test_adaptive_frames_stay_within_threshold(pulse_window):
+    window, frame_clock, clock = pulse_window
+    total = 60
+    window.time_input.setText(str(total))
+    window.start()
+    start, frames = clock.now, []
+    _run_window(window, frame_clock, clock, math.inf, frames)
+    assert window.status_label.text() == "Koniec"
+    assert frame_clock.wakeups < total / 0.04
+    for a, b in zip(frames, frames[1:]):
+        if b - a > 0.0401:
+            worst = _worst_change(pulse_intensity, a - start, b - start, total)
+            assert worst <= PULSE_THRESHOLD + 1e-9
+
+
+def test_hidden_window_sleeps_until_the_end(pulse_window):
+    window, frame_clock, clock = pulse_window
+    window.time_input.setText("60")
+    window.start()
+    window.hide()
+    frame_clock._timer.stop()
+    frame_clock.tick()
+    assert frame_clock._timer.interval() == 60_000
+
+
+def test_pulse_resumes_in_phase_after_show(pulse_window, qapp):
+    window, frame_clock, clock = pulse_window
+    total = 60
+    window.time_input.setText(str(total))
+    window.start()
+    start = clock.now
+    window.hide()
+    _run_window(window, frame_clock, clock, start + total / 2, [])
+    clock.now = start + total / 2 + 0.123  # odsłonięcie w środku cyklu pulsu
+    window.show()
+    qapp.processEvents()
+    assert frame_clock._timer.isActive() and frame_clock._timer.interval() == 0
+    frame_clock._timer.stop()
+    frame_clock.tick()
+    cd = window.countdown
+    assert _opacity(window) == pytest.approx(max(0.2, pulse_intensity(cd.progress(), cd.elapsed())), abs=1e-9)
+
+
+def test_long_hidden_countdown_sleeps_in_bounded_steps(qapp):
+    clock = ManualClock(1000.0)
+    frame_clock = FrameClock(clock=clock, adaptive=True)
+    window = MainWindow(frame_clock)  # nigdy nie pokazane
+    window.time_input.setText("1000:00:00")
+    window.start()
+    frame_clock._timer.stop()
+    frame_clock.tick()
+    assert frame_clock._timer.interval() == FrameClock.MAX_SLEEP_MS
+    clock.advance(FrameClock.MAX_SLEEP_MS / 1000)
+    frame_clock._timer.stop()
+    frame_clock.tick()
+    assert frame_clock._timer.interval() == FrameClock.MAX_SLEEP_MS
+    assert window.is_running
+    window.stop()
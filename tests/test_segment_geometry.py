@@ -0,0 +1,11 @@
+from cw3 import SevenSegmentDisplay
+
+
+def test_rect_segment_junctions_are_filled(qapp):
+    display = SevenSegmentDisplay()
+    display.resize(96, 160)
+    display.set_digit(8)
+    image = display.grab().toImage()
+    # Styk segmentów a i b: zachodzące na siebie pół piksela nie może zostać dziurą
+    for x, y in ((83, 11), (84, 12)):
+        assert image.pixelColor(x, y).green() == 255
@@ -0,0 +1,15 @@
+import copy
+import pickle
+
+from theme import BarTheme, SegmentTheme, ToggleTheme
+
+
+def test_pickle_round_trip_returns_interned_theme(qapp):
+    for theme in (SegmentTheme(), SegmentTheme(active="#ffaa00"), ToggleTheme(), BarTheme()):
+        assert pickle.loads(pickle.dumps(theme)) is theme
+
+
+def test_copy_returns_interned_theme(qapp):
+    theme = SegmentTheme(active="#ffaa00")
+    assert copy.copy(theme) is theme
+    assert copy.deepcopy(theme) is theme
@@ -0,0 +1,44 @@
+from countdown import ManualClock
+from timer_engine import TimerEngine
+
+
+def test_name_reused_after_cancel_ignores_old_deadline():
+    clock = ManualClock(0.0)
+    stages = []
+    engine = TimerEngine(clock, on_stage=lambda *args: stages.append(args))
+    engine.add("a", 10)
+    engine.cancel("a")
+    engine.add("a", 100)
+    assert engine.next_deadline() == 100.0
+    assert engine.advance(10) == []
+    assert engine.expired == 0
+    assert stages == []
+    assert engine.remaining("a", 10) == 90.0
+
+
+def test_pause_and_resume_keep_one_live_entry():
+    clock = ManualClock(0.0)
+    engine = TimerEngine(clock)
+    engine.add("a", [10, 5])
+    engine.pause("a", now=4)
+    assert engine.next_deadline() is None
+    engine.resume("a", now=20)
+    assert engine.next_deadline() == 26.0
+    assert engine.advance(26) == ["a"]
+    assert engine.stage("a")[0] == 1
+
+
+def test_restore_schedules_running_timers(tmp_path):
+    path = str(tmp_path / "timers.jsonl")
+    clock = ManualClock(0.0)
+    engine = TimerEngine.restore(path, clock=clock)
+    engine.add("a", 10)
+    engine.add("b", 30)
+    engine.pause("b", now=5)
+    engine.journal.close()
+    clock.advance(6)
+    restored = TimerEngine.restore(path, clock=clock)
+    assert restored.next_deadline() == 10.0
+    assert restored.remaining("b") == 25.0
+    assert restored.advance(10) == ["a"]
+    restored.journal.close()
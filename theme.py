@@ -0,0 +1,182 @@
+"""Shared, interned widget themes.
+
+A theme is an immutable set of colors (plus the brushes built from them)
+for one widget family. Themes are interned by value: ``SegmentTheme()``
+always returns the same object, so ten thousand digits with the default
+look hold one reference each instead of their own QColor/QBrush copies.
+``replace`` returns the interned theme with some fields changed, and
+``restyle`` moves every live widget of a class to another theme in one
+pass. Unused themes are dropped with their last reference.
+"""
+import weakref
+
+from qt_compat import QtCore, QtGui, QtWidgets
+
+COLOR, BRUSHES, NUMBER = "color", "brushes", "number"
+
+
+def _color(value):
+    if isinstance(value, tuple):
+        return QtGui.QColor(*value)
+    return QtGui.QColor(value)
+
+
+def _brush(value):
+    return value if isinstance(value, QtGui.QBrush) else QtGui.QBrush(_color(value))
+
+
+def _rebuild(cls, values):
+    """Unpickle/copy a theme as the interned instance with the same values."""
+    return cls(**values)
+
+
+class Theme:
+    """Base class: subclasses list ``FIELDS`` as ``(name, default, kind)``."""
+
+    __slots__ = ("_key", "__weakref__")
+    FIELDS = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._pool = weakref.WeakValueDictionary()
+
+    def __new__(cls, **values):
+        unknown = set(values) - {name for name, _, _ in cls.FIELDS}
+        if unknown:
+            raise TypeError(f"{cls.__name__} has no fields {sorted(unknown)}")
+        fields, key = [], []
+        for name, default, kind in cls.FIELDS:
+            value = values.get(name, default)
+            if kind == COLOR:
+                value = _color(value)
+                key.append(value.rgba())
+            elif kind == BRUSHES:
+                value = tuple(_brush(v) for v in value)
+                key.append(tuple(b.color().rgba() for b in value))
+            else:
+                value = float(value)
+                key.append(value)
+            fields.append((name, value))
+        key = tuple(key)
+        theme = cls._pool.get(key)
+        if theme is None:
+            theme = object.__new__(cls)
+            setattr_ = object.__setattr__
+            setattr_(theme, "_key", key)
+            for name, value in fields:
+                setattr_(theme, name, value)
+            theme._build()
+            cls._pool[key] = theme
+        return theme
+
+    def _build(self):
+        """Derive brushes/pens from the fields; called once per interned theme."""
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable, use replace()")
+
+    def __reduce__(self):
+        values = self.values()
+        for name, _, kind in self.FIELDS:
+            if kind == BRUSHES:  # QBrush has no pickle support, its color does
+                values[name] = tuple(b.color() for b in values[name])
+        return _rebuild, (type(self), values)
+
+    def values(self):
+        return {name: getattr(self, name) for name, _, _ in self.FIELDS}
+
+    def replace(self, **changes):
+        """The (interned) theme with ``changes`` applied; ``self`` if nothing changes."""
+        return type(self)(**{**self.values(), **changes})
+
+    def __repr__(self):
+        return f"{type(self).__name__}{self._key}"
+
+
+class SegmentTheme(Theme):
+    """Colors of 7-segment digits (cw3 SevenSegmentDisplay, SegmentDisplay)."""
+
+    __slots__ = ("active", "inactive", "background")
+    FIELDS = (
+        ("active", (0, 255, 0), COLOR),
+        ("inactive", (40, 40, 40), COLOR),
+        ("background", (20, 20, 20), COLOR),
+    )
+
+
+class BarTheme(Theme):
+    """Look of a PowerBar ``_Bar``: step brushes, background and dot geometry."""
+
+    __slots__ = ("background", "brushes", "padding", "solid_percent")
+    FIELDS = (
+        ("background", "black", COLOR),
+        ("brushes", ("red",) * 10, BRUSHES),
+        ("padding", 4.0, NUMBER),
+        ("solid_percent", 0.8, NUMBER),
+    )
+
+
+class ToggleTheme(Theme):
+    """Colors of an AnimatedToggle and the brushes painted with them."""
+
+    __slots__ = ("bar_color", "checked_color", "handle_color",
+                 "pulse_unchecked_color", "pulse_checked_color",
+                 "bar_brush", "bar_checked_brush", "handle_brush", "handle_checked_brush",
+                 "pulse_unchecked_brush", "pulse_checked_brush")
+    FIELDS = (
+        ("bar_color", QtCore.Qt.GlobalColor.gray, COLOR),
+        ("checked_color", "#00B0FF", COLOR),
+        ("handle_color", QtCore.Qt.GlobalColor.white, COLOR),
+        ("pulse_unchecked_color", "#44999999", COLOR),
+        ("pulse_checked_color", "#4400B0EE", COLOR),
+    )
+
+    def _build(self):
+        setattr_ = object.__setattr__
+        setattr_(self, "bar_brush", QtGui.QBrush(self.bar_color))
+        setattr_(self, "bar_checked_brush", QtGui.QBrush(self.checked_color.lighter()))
+        setattr_(self, "handle_brush", QtGui.QBrush(self.handle_color))
+        setattr_(self, "handle_checked_brush", QtGui.QBrush(self.checked_color))
+        setattr_(self, "pulse_unchecked_brush", QtGui.QBrush(self.pulse_unchecked_color))
+        setattr_(self, "pulse_checked_brush", QtGui.QBrush(self.pulse_checked_color))
+
+
+class Themed:
+    """Mixin for widgets that keep a shared theme in ``self._theme``.
+
+    Subclasses set ``default_theme`` and implement ``_theme_changed()`` to
+    drop caches built from the old theme and schedule a repaint.
+    """
+
+    default_theme = None
+
+    def theme(self):
+        return self._theme
+
+    def set_theme(self, theme):
+        if theme is self._theme:
+            return False
+        self._theme = theme
+        self._theme_changed()
+        return True
+
+    def _theme_changed(self):
+        self.update()
+
+    @classmethod
+    def set_default_theme(cls, theme):
+        """Use ``theme`` for new instances and for every instance still on the old default."""
+        old, cls.default_theme = cls.default_theme, theme
+        return restyle(cls, theme, old)
+
+
+def restyle(widget_class, theme, old=None):
+    """Switch every live ``widget_class`` instance (only those on ``old``, if given) to ``theme``.
+
+    One pass over the application's widgets; returns the number restyled.
+    """
+    count = 0
+    for widget in QtWidgets.QApplication.allWidgets():
+        if isinstance(widget, widget_class) and (old is None or widget._theme is old):
+            count += widget.set_theme(theme)
+    return count
@@ -0,0 +1,342 @@
+"""Silnik wielu nazwanych minutników z etapami i powtórzeniami, niezależny od Qt.
+
+Minutnik to ciąg etapów (np. 30 s pracy, 10 s przerwy) powtarzany
+``repeats`` razy (0 = bez końca). Terminy końca bieżących etapów trzymane są
+w kopcu, więc najbliższy termin jest znany od razu, a dodanie i wygaśnięcie
+kosztuje O(log n). Pauza, wznowienie i anulowanie nie przebudowują kopca -
+nieaktualne wpisy są pomijane przy zdejmowaniu (``gen`` - numer wpisu z
+licznika całego silnika, więc nie pasuje też do minutnika o tej samej nazwie
+dodanego po anulowaniu).
+
+Stan można utrwalać w dzienniku (Journal) dopisującym tylko zmiany
+wprowadzone przez użytkownika; przejścia między etapami wynikają z czasu,
+więc po restarcie ``TimerEngine.restore`` odtwarza je sam. Dziennik wymaga
+zegara ściennego (time.time), bo zegar monotoniczny nie przeżywa restartu.
+"""
+import heapq
+import itertools
+import json
+import math
+import os
+import time
+
+
+class _Timer:
+    __slots__ = ("name", "stages", "labels", "repeats", "stage", "repeat",
+                 "deadline", "left", "gen", "cycle")
+
+    def __init__(self, name, stages, labels, repeats) -> None:
+        self.name = name
+        self.stages = stages
+        self.labels = labels
+        self.repeats = repeats
+        self.cycle = sum(stages)
+        self.stage = 0
+        self.repeat = 0
+        self.deadline = None  # termin końca etapu, gdy minutnik działa
+        self.left = stages[0]  # pozostały czas etapu, gdy stoi
+        self.gen = None  # numer aktualnego wpisu w kopcu
+
+    @property
+    def running(self) -> bool:
+        return self.deadline is not None
+
+
+def _normalize_stages(stages):
+    """Etapy jako liczby sekund lub pary (etykieta, sekundy)."""
+    if isinstance(stages, (int, float)):
+        stages = [stages]
+    seconds, labels = [], []
+    for stage in stages:
+        if isinstance(stage, (list, tuple)):
+            label, length = stage
+        else:
+            label, length = "", stage
+        if length <= 0:
+            raise ValueError("etap musi trwać dłużej niż 0 s")
+        seconds.append(float(length))
+        labels.append(str(label))
+    if not seconds:
+        raise ValueError("minutnik musi mieć co najmniej jeden etap")
+    return tuple(seconds), tuple(labels)
+
+
+class Journal:
+    """Dziennik zmian dopisywany linia po linii (JSON Lines).
+
+    Niedokończona ostatnia linia (przerwany zapis) jest przy odczycie
+    pomijana. compact() zastępuje dziennik migawką bieżącego stanu.
+    """
+
+    def __init__(self, path: str, fsync: bool = False) -> None:
+        self.path = path
+        self.fsync = fsync
+        self._file = open(path, "a", encoding="utf-8")
+
+    def append(self, record: dict) -> None:
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    @staticmethod
+    def records(path: str):
+        if not os.path.exists(path):
+            return
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    return  # urwany zapis na końcu pliku
+
+    def compact(self, engine: "TimerEngine", now: float = None) -> None:
+        now = engine.clock() if now is None else now
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            for record in engine.snapshot(now):
+                fh.write(json.dumps(record, separators=(",", ":")) + "\n")
+            fh.flush()
+            os.fsync(fh.fileno())
+        self._file.close()
+        os.replace(tmp, self.path)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class TimerEngine:
+    """Planista nazwanych minutników oparty na kopcu terminów.
+
+    advance(now) przesuwa wszystkie minutniki, których etap się skończył, i
+    woła on_stage(name, stage, repeat) dla nowego etapu lub on_finish(name)
+    po ostatnim. Jeśli przepadło kilka etapów, wywołanie jest jedno, dla
+    etapu bieżącego.
+    """
+
+    def __init__(self, clock=time.monotonic, journal: Journal = None,
+                 on_stage=None, on_finish=None) -> None:
+        self.clock = clock
+        self.journal = journal
+        self.on_stage = on_stage
+        self.on_finish = on_finish
+        self._timers = {}
+        self._heap = []
+        self._seq = itertools.count()
+        self.expired = 0
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def __contains__(self, name) -> bool:
+        return name in self._timers
+
+    def names(self):
+        return self._timers.keys()
+
+    # --- zmiany stanu (zapisywane w dzienniku) ---
+
+    def add(self, name, stages, repeats: int = 1, running: bool = True, now: float = None) -> None:
+        """Nowy minutnik; stages: sekundy, lista sekund lub par (etykieta, sekundy)."""
+        if name in self._timers:
+            raise ValueError(f"minutnik {name!r} już istnieje")
+        now = self.clock() if now is None else now
+        seconds, labels = _normalize_stages(stages)
+        self._add(name, seconds, labels, int(repeats), running, now)
+        self._log({"op": "add", "at": now, "name": name, "stages": seconds,
+                   "labels": labels, "repeats": int(repeats), "running": running})
+
+    def pause(self, name, now: float = None) -> None:
+        now = self.clock() if now is None else now
+        self._timers[name]  # KeyError dla nieznanej nazwy
+        self.advance(now)
+        timer = self._timers.get(name)
+        if timer is not None and self._pause(timer, now):
+            self._log({"op": "pause", "at": now, "name": name})
+
+    def resume(self, name, now: float = None) -> None:
+        now = self.clock() if now is None else now
+        if self._resume(self._timers[name], now):
+            self._log({"op": "resume", "at": now, "name": name})
+
+    def cancel(self, name, now: float = None) -> None:
+        now = self.clock() if now is None else now
+        if self._timers.pop(name, None) is not None:
+            self._log({"op": "cancel", "at": now, "name": name})
+
+    # --- odczyt ---
+
+    def remaining(self, name, now: float = None) -> float:
+        """Czas do końca bieżącego etapu."""
+        timer = self._timers[name]
+        if not timer.running:
+            return timer.left
+        now = self.clock() if now is None else now
+        return max(0.0, timer.deadline - now)
+
+    def remaining_seconds(self, name, now: float = None) -> int:
+        return math.ceil(self.remaining(name, now))
+
+    def stage(self, name):
+        """(numer etapu, etykieta, numer powtórzenia)."""
+        timer = self._timers[name]
+        return timer.stage, timer.labels[timer.stage], timer.repeat
+
+    def stage_length(self, name) -> float:
+        timer = self._timers[name]
+        return timer.stages[timer.stage]
+
+    def running(self, name) -> bool:
+        return self._timers[name].running
+
+    def next_deadline(self):
+        """Najbliższy termin końca etapu albo None."""
+        heap = self._heap
+        while heap:
+            deadline, _, name, gen = heap[0]
+            timer = self._timers.get(name)
+            if timer is not None and timer.gen == gen:
+                return deadline
+            heapq.heappop(heap)
+        return None
+
+    # --- napęd ---
+
+    def advance(self, now: float = None) -> list:
+        """Obsługuje wszystkie etapy zakończone do ``now``; zwraca nazwy zmienionych minutników."""
+        now = self.clock() if now is None else now
+        heap, timers = self._heap, self._timers
+        changed = []
+        while heap and heap[0][0] <= now:
+            _, _, name, gen = heapq.heappop(heap)
+            timer = timers.get(name)
+            if timer is None or timer.gen != gen:
+                continue  # wpis po pauzie lub anulowaniu
+            self.expired += 1
+            changed.append(name)
+            if self._roll(timer, now):
+                self._push(timer)
+                if self.on_stage is not None:
+                    self.on_stage(name, timer.stage, timer.repeat)
+            else:
+                del timers[name]
+                if self.on_finish is not None:
+                    self.on_finish(name)
+        return changed
+
+    def snapshot(self, now: float = None) -> list:
+        """Bieżący stan jako rekordy dziennika (do compact)."""
+        now = self.clock() if now is None else now
+        self.advance(now)
+        records = []
+        for timer in self._timers.values():
+            records.append({
+                "op": "state", "at": now, "name": timer.name, "stages": timer.stages,
+                "labels": timer.labels, "repeats": timer.repeats, "stage": timer.stage,
+                "repeat": timer.repeat, "deadline": timer.deadline, "left": timer.left,
+            })
+        return records
+
+    @classmethod
+    def restore(cls, path: str, clock=time.time, fsync: bool = False, **kwargs) -> "TimerEngine":
+        """Odtwarza stan z dziennika i dalej do niego dopisuje."""
+        engine = cls(clock=clock, **kwargs)
+        for record in Journal.records(path):
+            engine._apply(record)
+        # Minutniki zakończone w czasie, gdy program nie działał, znikają bez
+        # wywołań zwrotnych; pozostałe trafiają na bieżący etap.
+        now = clock()
+        for name, timer in list(engine._timers.items()):
+            if not engine._roll(timer, now):
+                del engine._timers[name]
+        engine._heap = []
+        for timer in engine._timers.values():
+            if timer.running:
+                engine._push(timer)
+        engine.journal = Journal(path, fsync=fsync)
+        return engine
+
+    # --- wnętrze ---
+
+    def _log(self, record) -> None:
+        if self.journal is not None:
+            self.journal.append(record)
+
+    def _push(self, timer) -> None:
+        timer.gen = seq = next(self._seq)
+        heapq.heappush(self._heap, (timer.deadline, seq, timer.name, seq))
+
+    def _add(self, name, seconds, labels, repeats, running, now) -> _Timer:
+        timer = _Timer(name, tuple(seconds), tuple(labels), repeats)
+        self._timers[name] = timer
+        if running:
+            timer.deadline = now + timer.left
+            self._push(timer)
+        return timer
+
+    def _pause(self, timer, now) -> bool:
+        if not timer.running:
+            return False
+        if not self._roll(timer, now):
+            return False
+        timer.left = max(0.0, timer.deadline - now)
+        timer.deadline = None
+        timer.gen = None  # unieważnia wpis w kopcu
+        return True
+
+    def _resume(self, timer, now) -> bool:
+        if timer.running:
+            return False
+        timer.deadline = now + timer.left
+        self._push(timer)
+        return True
+
+    def _roll(self, timer, now) -> bool:
+        """Przesuwa minutnik na etap trwający w chwili ``now``; False, gdy się skończył.
+
+        Kolejne terminy liczone są od poprzednich, nie od ``now``, więc
+        spóźnione wywołania nie przesuwają harmonogramu.
+        """
+        if not timer.running or timer.deadline > now:
+            return True
+        stages, n = timer.stages, len(timer.stages)
+        # Całe przegapione cykle naraz (np. długi postój programu).
+        behind = now - timer.deadline
+        if behind >= timer.cycle:
+            cycles = int(behind // timer.cycle)
+            if timer.repeats:
+                cycles = min(cycles, max(0, timer.repeats - timer.repeat - 1))
+            timer.repeat += cycles
+            timer.deadline += cycles * timer.cycle
+        while timer.deadline <= now:
+            timer.stage += 1
+            if timer.stage == n:
+                timer.stage = 0
+                timer.repeat += 1
+                if timer.repeats and timer.repeat >= timer.repeats:
+                    timer.deadline = None
+                    timer.left = 0.0
+                    return False
+            timer.deadline += stages[timer.stage]
+        return True
+
+    def _apply(self, record) -> None:
+        op, name, at = record["op"], record["name"], record["at"]
+        timer = self._timers.get(name)
+        if op == "add":
+            self._add(name, record["stages"], record["labels"], record["repeats"],
+                      record["running"], at)
+        elif op == "state":
+            timer = self._add(name, record["stages"], record["labels"], record["repeats"], False, at)
+            timer.stage, timer.repeat = record["stage"], record["repeat"]
+            timer.deadline, timer.left = record["deadline"], record["left"]
+        elif timer is None:
+            return  # zmiana minutnika, który już się zakończył
+        elif op == "pause":
+            if timer.running and not self._pause(timer, at):
+                del self._timers[name]
+        elif op == "resume":
+            self._resume(timer, at)
+        elif op == "cancel":
+            del self._timers[name]